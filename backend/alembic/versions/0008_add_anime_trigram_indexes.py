@@ -0,0 +1,39 @@
+"""add trigram indexes for anime search
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-01-14 10:15:00.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_anime_title_trgm",
+        "anime",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_anime_title_original_trgm",
+        "anime",
+        ["title_original"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title_original": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_anime_title_original_trgm", table_name="anime")
+    op.drop_index("ix_anime_title_trgm", table_name="anime")
@@ -0,0 +1,46 @@
+"""add weighted full-text search vector to anime
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-01-15 08:40:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title_original, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "anime",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_anime_search_vector",
+        "anime",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_anime_search_vector", table_name="anime")
+    op.drop_column("anime", "search_vector")
@@ -0,0 +1,35 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-01-16 11:05:00.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_anime_created_at_id", "anime", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_releases_created_at_id", "releases", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_favorites_user_id_created_at_id",
+        "favorites",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_favorites_user_id_created_at_id", table_name="favorites")
+    op.drop_index("ix_releases_created_at_id", table_name="releases")
+    op.drop_index("ix_anime_created_at_id", table_name="anime")
@@ -0,0 +1,36 @@
+"""add updated_at to anime, releases and episodes
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-01-17 09:20:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+TABLES = ("anime", "releases", "episodes")
+
+
+def upgrade() -> None:
+    for table_name in TABLES:
+        op.add_column(
+            table_name,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+        )
+        op.execute(f"UPDATE {table_name} SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    for table_name in reversed(TABLES):
+        op.drop_column(table_name, "updated_at")
@@ -0,0 +1,28 @@
+"""add token_version to users
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-01-24 11:05:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_version")
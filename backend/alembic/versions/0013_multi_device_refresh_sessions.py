@@ -0,0 +1,74 @@
+"""allow multiple refresh sessions per user
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-01-26 14:40:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        op.f("uq_refresh_tokens_user_id"), "refresh_tokens", type_="unique"
+    )
+    op.drop_index(op.f("ix_refresh_tokens_token_hash"), table_name="refresh_tokens")
+    op.create_index(
+        op.f("ix_refresh_tokens_token_hash"),
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+    )
+    op.add_column(
+        "refresh_tokens", sa.Column("user_agent", sa.String(length=255), nullable=True)
+    )
+    op.add_column(
+        "refresh_tokens", sa.Column("ip_address", sa.String(length=45), nullable=True)
+    )
+    op.add_column(
+        "refresh_tokens",
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("refresh_tokens", "last_used_at")
+    op.drop_column("refresh_tokens", "ip_address")
+    op.drop_column("refresh_tokens", "user_agent")
+    op.drop_index(op.f("ix_refresh_tokens_token_hash"), table_name="refresh_tokens")
+    op.create_index(
+        op.f("ix_refresh_tokens_token_hash"),
+        "refresh_tokens",
+        ["token_hash"],
+        unique=False,
+    )
+    # Keep only the newest session per user so the old constraint can return.
+    op.execute(
+        """
+        DELETE FROM refresh_tokens
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id ORDER BY created_at DESC, id DESC
+                ) AS position
+                FROM refresh_tokens
+            ) AS ranked
+            WHERE ranked.position > 1
+        )
+        """
+    )
+    op.create_unique_constraint(
+        op.f("uq_refresh_tokens_user_id"), "refresh_tokens", ["user_id"]
+    )
@@ -0,0 +1,27 @@
+"""add refresh_tokens expires_at index for the sweeper
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-01-29 08:15:00.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_refresh_tokens_expires_at"),
+        "refresh_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_refresh_tokens_expires_at"), table_name="refresh_tokens")
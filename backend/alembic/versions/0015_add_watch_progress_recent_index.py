@@ -0,0 +1,38 @@
+"""index watch_progress by user and recency for continue watching
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-02-03 10:20:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_watch_progress_user_id_last_watched_at",
+        "watch_progress",
+        ["user_id", sa.text("last_watched_at DESC")],
+        unique=False,
+    )
+    # The composite index serves every lookup the single-column one did.
+    op.drop_index(op.f("ix_watch_progress_user_id"), table_name="watch_progress")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_watch_progress_user_id"),
+        "watch_progress",
+        ["user_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_watch_progress_user_id_last_watched_at", table_name="watch_progress"
+    )
@@ -0,0 +1,51 @@
+"""create the monthly partitioned views log
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-02-06 09:30:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "views",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("episode_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("position_seconds", sa.Integer(), nullable=True),
+        sa.Column("progress_percent", sa.Float(), nullable=True),
+        sa.Column("device", sa.String(length=128), nullable=True),
+        sa.Column("viewed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", "viewed_at", name=op.f("pk_views")),
+        postgresql_partition_by="RANGE (viewed_at)",
+    )
+    op.create_index(
+        "ix_views_user_id_viewed_at_id",
+        "views",
+        ["user_id", "viewed_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_views_viewed_at",
+        "views",
+        ["viewed_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+    # Monthly partitions are created by the application: ahead of time by the
+    # maintenance job and on demand by the view log writer. There is no
+    # default partition, so rows never end up outside a monthly one.
+
+
+def downgrade() -> None:
+    op.drop_table("views")
@@ -0,0 +1,84 @@
+"""create popularity rollup tables
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-02-10 12:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "anime_daily_stats",
+        sa.Column("anime_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("views", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "watch_starts", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "favorites", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["anime_id"],
+            ["anime.id"],
+            name=op.f("fk_anime_daily_stats_anime_id_anime"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("anime_id", "day", name=op.f("pk_anime_daily_stats")),
+    )
+    op.create_index(
+        op.f("ix_anime_daily_stats_day"), "anime_daily_stats", ["day"], unique=False
+    )
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("source", sa.String(length=64), nullable=False),
+        sa.Column("processed_until", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("source", name=op.f("pk_rollup_watermarks")),
+    )
+
+    op.create_table(
+        "anime_rankings",
+        sa.Column("ranking", sa.String(length=32), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("anime_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["anime_id"],
+            ["anime.id"],
+            name=op.f("fk_anime_rankings_anime_id_anime"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("ranking", "rank", name=op.f("pk_anime_rankings")),
+    )
+
+    # The aggregator reads new events by time range on each run.
+    op.create_index(
+        op.f("ix_favorites_created_at"), "favorites", ["created_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_watch_progress_created_at"),
+        "watch_progress",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_watch_progress_created_at"), table_name="watch_progress")
+    op.drop_index(op.f("ix_favorites_created_at"), table_name="favorites")
+    op.drop_table("anime_rankings")
+    op.drop_table("rollup_watermarks")
+    op.drop_index(op.f("ix_anime_daily_stats_day"), table_name="anime_daily_stats")
+    op.drop_table("anime_daily_stats")
@@ -0,0 +1,42 @@
+"""add an ingestion timestamp to the views log
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-02-12 10:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "views", sa.Column("ingested_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    # Existing rows were rolled up by viewed_at; keeping that as their
+    # ingestion time stops them from being counted a second time.
+    op.execute("UPDATE views SET ingested_at = viewed_at")
+    op.alter_column(
+        "views",
+        "ingested_at",
+        server_default=sa.func.now(),
+        nullable=False,
+    )
+    op.create_index(
+        "ix_views_ingested_at",
+        "views",
+        ["ingested_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_views_ingested_at", table_name="views")
+    op.drop_column("views", "ingested_at")
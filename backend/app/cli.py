@@ -0,0 +1,91 @@
+"""Maintenance commands: ``kitsu-backend <command>`` or ``python -m app.cli <command>``."""
+
+import argparse
+import asyncio
+import logging
+
+from .database import engine
+from .utils.popularity import popularity_aggregator
+from .utils.token_sweeper import refresh_token_sweeper
+from .utils.view_partitions import view_partition_maintainer
+
+
+async def _sweep_refresh_tokens(batch_size: int | None) -> int:
+    if batch_size is not None:
+        refresh_token_sweeper.batch_size = batch_size
+    try:
+        result = await refresh_token_sweeper.sweep(engine)
+    finally:
+        await engine.dispose()
+
+    if not result.acquired:
+        print("Another process is sweeping refresh tokens; nothing done.")
+        return 1
+    print(f"Deleted {result.deleted} refresh tokens in {result.batches} batches.")
+    return 0
+
+
+async def _maintain_view_partitions() -> int:
+    try:
+        result = await view_partition_maintainer.maintain(engine)
+    finally:
+        await engine.dispose()
+
+    if not result.acquired:
+        print("Another process is maintaining view partitions; nothing done.")
+        return 1
+    created = ", ".join(month.strftime("%Y-%m") for month in result.created) or "none"
+    dropped = ", ".join(month.strftime("%Y-%m") for month in result.dropped) or "none"
+    print(f"View partitions created: {created}; dropped: {dropped}.")
+    return 0
+
+
+async def _roll_up_popularity() -> int:
+    try:
+        result = await popularity_aggregator.run(engine)
+    finally:
+        await engine.dispose()
+
+    if not result.acquired:
+        print("Another process is rolling up popularity; nothing done.")
+        return 1
+    counted = ", ".join(f"{name}={rows}" for name, rows in result.rows.items())
+    print(f"Daily stats rows updated: {counted}; rankings recomputed.")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="kitsu-backend")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sweep = commands.add_parser(
+        "sweep-refresh-tokens",
+        help="Delete expired and long-revoked refresh tokens now",
+    )
+    sweep.add_argument("--batch-size", type=int, default=None)
+
+    commands.add_parser(
+        "maintain-view-partitions",
+        help="Create upcoming monthly views partitions and drop expired ones now",
+    )
+    commands.add_parser(
+        "rollup-popularity",
+        help="Fold new view, watch and favorite events into daily stats and rerank",
+    )
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "sweep-refresh-tokens":
+        if args.batch_size is not None and args.batch_size <= 0:
+            parser.error("--batch-size must be greater than 0")
+        return asyncio.run(_sweep_refresh_tokens(args.batch_size))
+    if args.command == "maintain-view-partitions":
+        return asyncio.run(_maintain_view_partitions())
+    if args.command == "rollup-popularity":
+        return asyncio.run(_roll_up_popularity())
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,4 @@
+import ipaddress
 import os
 from urllib.parse import urlparse
 
@@ -7,6 +8,18 @@ from pydantic import BaseModel, Field
 
 load_dotenv()
 
+SYMMETRIC_JWT_ALGORITHMS = frozenset({"HS256", "HS384", "HS512"})
+ASYMMETRIC_JWT_ALGORITHMS = frozenset({"RS256", "EdDSA"})
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    raw_value = os.getenv(name, str(default)).strip().lower()
+    if raw_value in {"1", "true", "yes", "on"}:
+        return True
+    if raw_value in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"{name} must be a boolean value")
+
 
 class Settings(BaseModel):
     app_name: str = Field(default="Kitsu Backend")
@@ -21,6 +34,56 @@ class Settings(BaseModel):
     access_token_expire_minutes: int = Field(default=30)
     refresh_token_expire_days: int = Field(default=14)
     algorithm: str = Field(default="HS256")
+    jwt_keys_dir: str | None = Field(default=None)
+    jwt_keys_reload_seconds: int = Field(default=300)
+    refresh_token_sweep_enabled: bool = Field(default=True)
+    refresh_token_sweep_interval_seconds: int = Field(default=3600)
+    refresh_token_sweep_batch_size: int = Field(default=1000)
+    refresh_token_revoked_retention_hours: int = Field(default=24)
+    watch_progress_write_behind: bool = Field(default=False)
+    watch_progress_flush_seconds: int = Field(default=5)
+    watch_progress_buffer_size: int = Field(default=50000)
+    watch_progress_batch_max_items: int = Field(default=200)
+    view_log_flush_seconds: int = Field(default=2)
+    view_log_buffer_size: int = Field(default=100000)
+    view_log_batch_size: int = Field(default=5000)
+    view_log_partitions_ahead: int = Field(default=2)
+    view_log_retention_months: int = Field(default=12)
+    popularity_rollup_enabled: bool = Field(default=True)
+    popularity_rollup_interval_seconds: int = Field(default=60)
+    trending_window_days: int = Field(default=7)
+    trending_half_life_hours: int = Field(default=48)
+    trending_top_k: int = Field(default=100)
+    search_similarity_threshold: float = Field(default=0.4)
+    search_index_enabled: bool = Field(default=False)
+    search_index_refresh_seconds: int = Field(default=300)
+    search_suggest_index_enabled: bool = Field(default=False)
+    search_suggest_refresh_seconds: int = Field(default=300)
+    search_cache_size: int = Field(default=1024)
+    search_cache_ttl_seconds: int = Field(default=60)
+    cache_backend: str = Field(default="memory")
+    cache_redis_url: str | None = Field(default=None)
+    cache_max_entries: int = Field(default=10000)
+    cache_anime_ttl_seconds: int = Field(default=300)
+    cache_release_ttl_seconds: int = Field(default=300)
+    cache_episodes_ttl_seconds: int = Field(default=120)
+    password_hash_workers: int = Field(default=2)
+    password_hash_max_pending: int = Field(default=32)
+    password_bcrypt_rounds: int = Field(default=12)
+    auth_stateless: bool = Field(default=False)
+    auth_user_cache_size: int = Field(default=10000)
+    auth_user_cache_ttl_seconds: int = Field(default=60)
+    auth_refresh_mode: str = Field(default="locking")
+    auth_refresh_grace_seconds: int = Field(default=10)
+    auth_refresh_grace_cache_size: int = Field(default=10000)
+    auth_rate_limit_enabled: bool = Field(default=True)
+    auth_rate_limit_backend: str = Field(default="memory")
+    auth_rate_limit_redis_url: str | None = Field(default=None)
+    auth_rate_limit_ip_per_minute: int = Field(default=30)
+    auth_rate_limit_ip_burst: int = Field(default=10)
+    auth_rate_limit_email_per_minute: int = Field(default=5)
+    auth_rate_limit_email_burst: int = Field(default=5)
+    trusted_proxies: list[str] = Field(default_factory=list)
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -76,15 +139,293 @@ class Settings(BaseModel):
         if db_pool_recycle <= 0:
             raise ValueError("DB_POOL_RECYCLE must be greater than 0")
 
-        raw_db_pool_pre_ping = os.getenv(
-            "DB_POOL_PRE_PING", str(cls.model_fields["db_pool_pre_ping"].default)
+        db_pool_pre_ping = _get_bool_env(
+            "DB_POOL_PRE_PING", cls.model_fields["db_pool_pre_ping"].default
+        )
+
+        search_similarity_threshold = float(
+            os.getenv(
+                "SEARCH_SIMILARITY_THRESHOLD",
+                cls.model_fields["search_similarity_threshold"].default,
+            )
+        )
+        if not 0 < search_similarity_threshold <= 1:
+            raise ValueError("SEARCH_SIMILARITY_THRESHOLD must be in the (0, 1] range")
+
+        search_index_refresh_seconds = int(
+            os.getenv(
+                "SEARCH_INDEX_REFRESH_SECONDS",
+                cls.model_fields["search_index_refresh_seconds"].default,
+            )
+        )
+        if search_index_refresh_seconds <= 0:
+            raise ValueError("SEARCH_INDEX_REFRESH_SECONDS must be greater than 0")
+
+        search_suggest_refresh_seconds = int(
+            os.getenv(
+                "SEARCH_SUGGEST_REFRESH_SECONDS",
+                cls.model_fields["search_suggest_refresh_seconds"].default,
+            )
+        )
+        if search_suggest_refresh_seconds <= 0:
+            raise ValueError("SEARCH_SUGGEST_REFRESH_SECONDS must be greater than 0")
+
+        search_cache_size = int(
+            os.getenv("SEARCH_CACHE_SIZE", cls.model_fields["search_cache_size"].default)
+        )
+        if search_cache_size < 0:
+            raise ValueError("SEARCH_CACHE_SIZE must be greater than or equal to 0")
+
+        search_cache_ttl_seconds = int(
+            os.getenv(
+                "SEARCH_CACHE_TTL_SECONDS",
+                cls.model_fields["search_cache_ttl_seconds"].default,
+            )
+        )
+        if search_cache_ttl_seconds <= 0:
+            raise ValueError("SEARCH_CACHE_TTL_SECONDS must be greater than 0")
+
+        cache_backend = os.getenv(
+            "CACHE_BACKEND", cls.model_fields["cache_backend"].default
+        ).strip().lower()
+        if cache_backend not in {"memory", "redis"}:
+            raise ValueError("CACHE_BACKEND must be either 'memory' or 'redis'")
+
+        cache_redis_url = os.getenv("CACHE_REDIS_URL", "").strip() or None
+        if cache_backend == "redis" and cache_redis_url is None:
+            raise ValueError("CACHE_REDIS_URL must be set when CACHE_BACKEND=redis")
+
+        cache_max_entries = int(
+            os.getenv("CACHE_MAX_ENTRIES", cls.model_fields["cache_max_entries"].default)
+        )
+        if cache_max_entries < 0:
+            raise ValueError("CACHE_MAX_ENTRIES must be greater than or equal to 0")
+
+        cache_ttls: dict[str, int] = {}
+        for field_name in (
+            "cache_anime_ttl_seconds",
+            "cache_release_ttl_seconds",
+            "cache_episodes_ttl_seconds",
+        ):
+            env_name = field_name.upper()
+            cache_ttls[field_name] = int(
+                os.getenv(env_name, cls.model_fields[field_name].default)
+            )
+            if cache_ttls[field_name] <= 0:
+                raise ValueError(f"{env_name} must be greater than 0")
+
+        password_hash_workers = int(
+            os.getenv(
+                "PASSWORD_HASH_WORKERS",
+                cls.model_fields["password_hash_workers"].default,
+            )
+        )
+        if password_hash_workers <= 0:
+            raise ValueError("PASSWORD_HASH_WORKERS must be greater than 0")
+
+        password_hash_max_pending = int(
+            os.getenv(
+                "PASSWORD_HASH_MAX_PENDING",
+                cls.model_fields["password_hash_max_pending"].default,
+            )
+        )
+        if password_hash_max_pending < password_hash_workers:
+            raise ValueError(
+                "PASSWORD_HASH_MAX_PENDING must be greater than or equal to PASSWORD_HASH_WORKERS"
+            )
+
+        password_bcrypt_rounds = int(
+            os.getenv(
+                "PASSWORD_BCRYPT_ROUNDS",
+                cls.model_fields["password_bcrypt_rounds"].default,
+            )
+        )
+        if not 4 <= password_bcrypt_rounds <= 31:
+            raise ValueError("PASSWORD_BCRYPT_ROUNDS must be in the [4, 31] range")
+
+        auth_user_cache_size = int(
+            os.getenv(
+                "AUTH_USER_CACHE_SIZE", cls.model_fields["auth_user_cache_size"].default
+            )
+        )
+        if auth_user_cache_size < 0:
+            raise ValueError("AUTH_USER_CACHE_SIZE must be greater than or equal to 0")
+
+        auth_user_cache_ttl_seconds = int(
+            os.getenv(
+                "AUTH_USER_CACHE_TTL_SECONDS",
+                cls.model_fields["auth_user_cache_ttl_seconds"].default,
+            )
+        )
+        if auth_user_cache_ttl_seconds <= 0:
+            raise ValueError("AUTH_USER_CACHE_TTL_SECONDS must be greater than 0")
+
+        auth_refresh_mode = os.getenv(
+            "AUTH_REFRESH_MODE", cls.model_fields["auth_refresh_mode"].default
+        ).strip().lower()
+        if auth_refresh_mode not in {"locking", "cas"}:
+            raise ValueError("AUTH_REFRESH_MODE must be either 'locking' or 'cas'")
+
+        auth_refresh_grace_seconds = int(
+            os.getenv(
+                "AUTH_REFRESH_GRACE_SECONDS",
+                cls.model_fields["auth_refresh_grace_seconds"].default,
+            )
+        )
+        if auth_refresh_grace_seconds <= 0:
+            raise ValueError("AUTH_REFRESH_GRACE_SECONDS must be greater than 0")
+
+        auth_refresh_grace_cache_size = int(
+            os.getenv(
+                "AUTH_REFRESH_GRACE_CACHE_SIZE",
+                cls.model_fields["auth_refresh_grace_cache_size"].default,
+            )
+        )
+        if auth_refresh_grace_cache_size <= 0:
+            raise ValueError("AUTH_REFRESH_GRACE_CACHE_SIZE must be greater than 0")
+
+        auth_rate_limit_backend = os.getenv(
+            "AUTH_RATE_LIMIT_BACKEND", cls.model_fields["auth_rate_limit_backend"].default
         ).strip().lower()
-        if raw_db_pool_pre_ping in {"1", "true", "yes", "on"}:
-            db_pool_pre_ping = True
-        elif raw_db_pool_pre_ping in {"0", "false", "no", "off"}:
-            db_pool_pre_ping = False
-        else:
-            raise ValueError("DB_POOL_PRE_PING must be a boolean value")
+        if auth_rate_limit_backend not in {"memory", "redis"}:
+            raise ValueError("AUTH_RATE_LIMIT_BACKEND must be either 'memory' or 'redis'")
+
+        auth_rate_limit_redis_url = (
+            os.getenv("AUTH_RATE_LIMIT_REDIS_URL", "").strip() or cache_redis_url
+        )
+        if auth_rate_limit_backend == "redis" and auth_rate_limit_redis_url is None:
+            raise ValueError(
+                "AUTH_RATE_LIMIT_REDIS_URL or CACHE_REDIS_URL must be set when "
+                "AUTH_RATE_LIMIT_BACKEND=redis"
+            )
+
+        auth_rate_limits: dict[str, int] = {}
+        for field_name in (
+            "auth_rate_limit_ip_per_minute",
+            "auth_rate_limit_ip_burst",
+            "auth_rate_limit_email_per_minute",
+            "auth_rate_limit_email_burst",
+        ):
+            env_name = field_name.upper()
+            auth_rate_limits[field_name] = int(
+                os.getenv(env_name, cls.model_fields[field_name].default)
+            )
+            if auth_rate_limits[field_name] <= 0:
+                raise ValueError(f"{env_name} must be greater than 0")
+
+        trusted_proxies = [
+            proxy.strip()
+            for proxy in os.getenv("TRUSTED_PROXIES", "").split(",")
+            if proxy.strip()
+        ]
+        for proxy in trusted_proxies:
+            try:
+                ipaddress.ip_network(proxy, strict=False)
+            except ValueError as exc:
+                raise ValueError(
+                    "TRUSTED_PROXIES must contain IP addresses or networks"
+                ) from exc
+
+        algorithm = os.getenv("ALGORITHM", cls.model_fields["algorithm"].default).strip()
+        if algorithm not in SYMMETRIC_JWT_ALGORITHMS | ASYMMETRIC_JWT_ALGORITHMS:
+            raise ValueError(
+                "ALGORITHM must be one of: "
+                + ", ".join(sorted(SYMMETRIC_JWT_ALGORITHMS | ASYMMETRIC_JWT_ALGORITHMS))
+            )
+
+        jwt_keys_dir = os.getenv("JWT_KEYS_DIR", "").strip() or None
+        if algorithm in ASYMMETRIC_JWT_ALGORITHMS and jwt_keys_dir is None:
+            raise ValueError(f"JWT_KEYS_DIR must be set when ALGORITHM={algorithm}")
+
+        jwt_keys_reload_seconds = int(
+            os.getenv(
+                "JWT_KEYS_RELOAD_SECONDS",
+                cls.model_fields["jwt_keys_reload_seconds"].default,
+            )
+        )
+        if jwt_keys_reload_seconds <= 0:
+            raise ValueError("JWT_KEYS_RELOAD_SECONDS must be greater than 0")
+
+        refresh_token_sweep: dict[str, int] = {}
+        for field_name in (
+            "refresh_token_sweep_interval_seconds",
+            "refresh_token_sweep_batch_size",
+            "refresh_token_revoked_retention_hours",
+        ):
+            env_name = field_name.upper()
+            refresh_token_sweep[field_name] = int(
+                os.getenv(env_name, cls.model_fields[field_name].default)
+            )
+            if refresh_token_sweep[field_name] <= 0:
+                raise ValueError(f"{env_name} must be greater than 0")
+
+        watch_progress_flush_seconds = int(
+            os.getenv(
+                "WATCH_PROGRESS_FLUSH_SECONDS",
+                cls.model_fields["watch_progress_flush_seconds"].default,
+            )
+        )
+        if watch_progress_flush_seconds <= 0:
+            raise ValueError("WATCH_PROGRESS_FLUSH_SECONDS must be greater than 0")
+
+        watch_progress_buffer_size = int(
+            os.getenv(
+                "WATCH_PROGRESS_BUFFER_SIZE",
+                cls.model_fields["watch_progress_buffer_size"].default,
+            )
+        )
+        if watch_progress_buffer_size <= 0:
+            raise ValueError("WATCH_PROGRESS_BUFFER_SIZE must be greater than 0")
+
+        watch_progress_batch_max_items = int(
+            os.getenv(
+                "WATCH_PROGRESS_BATCH_MAX_ITEMS",
+                cls.model_fields["watch_progress_batch_max_items"].default,
+            )
+        )
+        if watch_progress_batch_max_items <= 0:
+            raise ValueError("WATCH_PROGRESS_BATCH_MAX_ITEMS must be greater than 0")
+
+        view_log: dict[str, int] = {}
+        for field_name in (
+            "view_log_flush_seconds",
+            "view_log_buffer_size",
+            "view_log_batch_size",
+            "view_log_partitions_ahead",
+        ):
+            env_name = field_name.upper()
+            view_log[field_name] = int(
+                os.getenv(env_name, cls.model_fields[field_name].default)
+            )
+            if view_log[field_name] <= 0:
+                raise ValueError(f"{env_name} must be greater than 0")
+        if view_log["view_log_batch_size"] > view_log["view_log_buffer_size"]:
+            raise ValueError(
+                "VIEW_LOG_BATCH_SIZE must not exceed VIEW_LOG_BUFFER_SIZE"
+            )
+
+        view_log_retention_months = int(
+            os.getenv(
+                "VIEW_LOG_RETENTION_MONTHS",
+                cls.model_fields["view_log_retention_months"].default,
+            )
+        )
+        if view_log_retention_months < 0:
+            raise ValueError("VIEW_LOG_RETENTION_MONTHS must be non-negative")
+
+        popularity: dict[str, int] = {}
+        for field_name in (
+            "popularity_rollup_interval_seconds",
+            "trending_window_days",
+            "trending_half_life_hours",
+            "trending_top_k",
+        ):
+            env_name = field_name.upper()
+            popularity[field_name] = int(
+                os.getenv(env_name, cls.model_fields[field_name].default)
+            )
+            if popularity[field_name] <= 0:
+                raise ValueError(f"{env_name} must be greater than 0")
 
         return cls(
             app_name=os.getenv("APP_NAME", cls.model_fields["app_name"].default),
@@ -104,11 +445,67 @@ class Settings(BaseModel):
                     cls.model_fields["refresh_token_expire_days"].default,
                 )
             ),
-            algorithm=os.getenv("ALGORITHM", cls.model_fields["algorithm"].default),
+            algorithm=algorithm,
+            jwt_keys_dir=jwt_keys_dir,
+            jwt_keys_reload_seconds=jwt_keys_reload_seconds,
+            refresh_token_sweep_enabled=_get_bool_env(
+                "REFRESH_TOKEN_SWEEP_ENABLED",
+                cls.model_fields["refresh_token_sweep_enabled"].default,
+            ),
+            **refresh_token_sweep,
+            watch_progress_write_behind=_get_bool_env(
+                "WATCH_PROGRESS_WRITE_BEHIND",
+                cls.model_fields["watch_progress_write_behind"].default,
+            ),
+            watch_progress_flush_seconds=watch_progress_flush_seconds,
+            watch_progress_buffer_size=watch_progress_buffer_size,
+            watch_progress_batch_max_items=watch_progress_batch_max_items,
+            **view_log,
+            view_log_retention_months=view_log_retention_months,
+            popularity_rollup_enabled=_get_bool_env(
+                "POPULARITY_ROLLUP_ENABLED",
+                cls.model_fields["popularity_rollup_enabled"].default,
+            ),
+            **popularity,
             db_pool_size=db_pool_size,
             db_max_overflow=db_max_overflow,
             db_pool_recycle=db_pool_recycle,
             db_pool_pre_ping=db_pool_pre_ping,
+            search_similarity_threshold=search_similarity_threshold,
+            search_index_enabled=_get_bool_env(
+                "SEARCH_INDEX_ENABLED", cls.model_fields["search_index_enabled"].default
+            ),
+            search_index_refresh_seconds=search_index_refresh_seconds,
+            search_suggest_index_enabled=_get_bool_env(
+                "SEARCH_SUGGEST_INDEX_ENABLED",
+                cls.model_fields["search_suggest_index_enabled"].default,
+            ),
+            search_suggest_refresh_seconds=search_suggest_refresh_seconds,
+            search_cache_size=search_cache_size,
+            search_cache_ttl_seconds=search_cache_ttl_seconds,
+            cache_backend=cache_backend,
+            cache_redis_url=cache_redis_url,
+            cache_max_entries=cache_max_entries,
+            **cache_ttls,
+            password_hash_workers=password_hash_workers,
+            password_hash_max_pending=password_hash_max_pending,
+            password_bcrypt_rounds=password_bcrypt_rounds,
+            auth_stateless=_get_bool_env(
+                "AUTH_STATELESS", cls.model_fields["auth_stateless"].default
+            ),
+            auth_user_cache_size=auth_user_cache_size,
+            auth_user_cache_ttl_seconds=auth_user_cache_ttl_seconds,
+            auth_refresh_mode=auth_refresh_mode,
+            auth_refresh_grace_seconds=auth_refresh_grace_seconds,
+            auth_refresh_grace_cache_size=auth_refresh_grace_cache_size,
+            auth_rate_limit_enabled=_get_bool_env(
+                "AUTH_RATE_LIMIT_ENABLED",
+                cls.model_fields["auth_rate_limit_enabled"].default,
+            ),
+            auth_rate_limit_backend=auth_rate_limit_backend,
+            auth_rate_limit_redis_url=auth_rate_limit_redis_url,
+            **auth_rate_limits,
+            trusted_proxies=trusted_proxies,
         )
 
 
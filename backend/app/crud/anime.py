@@ -1,36 +1,198 @@
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.anime import Anime
+from ..config import settings
+from ..models.anime import SEARCH_TEXT_CONFIG, Anime
+from ..models.favorite import Favorite
+from ..models.watch_progress import WatchProgress
+from ..schemas.anime import AnimeListItem, CachedAnime
+from ..utils.pagination import Page, apply_keyset_pagination, build_page
+from .base import schema_columns
+from .catalog_cache import ANIME_NAMESPACE, catalog_cache
+
+# The list schema never shows ``description``, so list queries skip it.
+ANIME_LIST_COLUMNS = schema_columns(Anime, AnimeListItem)
 
 
 async def get_anime_list(
-    session: AsyncSession, limit: int, offset: int
-) -> list[Anime]:
-    stmt = (
-        select(Anime)
-        .order_by(Anime.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+    session: AsyncSession, limit: int, offset: int = 0, cursor: str | None = None
+) -> Page[Row]:
+    stmt = apply_keyset_pagination(
+        select(*ANIME_LIST_COLUMNS, Anime.created_at, Anime.updated_at),
+        Anime.created_at,
+        Anime.id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return build_page(list(result.all()), limit)
 
 
-async def get_anime_by_id(session: AsyncSession, anime_id: uuid.UUID) -> Anime | None:
+async def load_anime(session: AsyncSession, anime_id: uuid.UUID) -> Anime | None:
     return await session.get(Anime, anime_id)
 
 
-async def search_anime(db: AsyncSession, query: str, limit: int, offset: int) -> list[Anime]:
+async def get_anime_by_id(
+    session: AsyncSession, anime_id: uuid.UUID
+) -> CachedAnime | None:
+    """Read-through cached lookup; use ``load_anime`` when the ORM entity is needed."""
+
+    async def load() -> CachedAnime | None:
+        anime = await load_anime(session, anime_id)
+        return None if anime is None else CachedAnime.model_validate(anime)
+
+    return await catalog_cache.get_or_load(
+        ANIME_NAMESPACE,
+        anime_id,
+        load,
+        ttl_seconds=settings.cache_anime_ttl_seconds,
+        dump=lambda anime: anime.model_dump(mode="json"),
+        load=CachedAnime.model_validate,
+    )
+
+
+async def get_existing_anime_ids(
+    session: AsyncSession, anime_ids: Sequence[uuid.UUID]
+) -> set[uuid.UUID]:
+    if not anime_ids:
+        return set()
+    result = await session.scalars(select(Anime.id).where(Anime.id.in_(anime_ids)))
+    return set(result)
+
+
+async def get_anime_updated_at(
+    session: AsyncSession, anime_id: uuid.UUID
+) -> datetime | None:
+    return await session.scalar(select(Anime.updated_at).where(Anime.id == anime_id))
+
+
+async def search_anime(
+    db: AsyncSession, query: str, limit: int, offset: int
+) -> Sequence[Row]:
     pattern = f"%{query}%"
     stmt = (
-        select(Anime)
+        select(*ANIME_LIST_COLUMNS)
         .where(Anime.title.ilike(pattern))
         .order_by(Anime.title.asc())
         .limit(limit)
         .offset(offset)
     )
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return result.all()
+
+
+async def search_anime_fuzzy(
+    db: AsyncSession, query: str, limit: int, offset: int
+) -> Sequence[Row]:
+    """Typo-tolerant search over title and title_original ranked by similarity.
+
+    The ``%>`` operator is served by the pg_trgm GIN indexes; the cut-off is
+    ``pg_trgm.word_similarity_threshold`` (see ``SEARCH_SIMILARITY_THRESHOLD``).
+    """
+    score = func.greatest(
+        func.word_similarity(query, Anime.title),
+        func.coalesce(func.word_similarity(query, Anime.title_original), 0),
+    )
+    stmt = (
+        select(*ANIME_LIST_COLUMNS)
+        .where(
+            or_(
+                Anime.title.op("%>")(query),
+                Anime.title_original.op("%>")(query),
+            )
+        )
+        .order_by(score.desc(), Anime.title.asc())
+        .limit(limit)
+        .offset(offset)
+    )
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def search_anime_fulltext(
+    db: AsyncSession, query: str, limit: int, offset: int, *, highlight: bool = False
+) -> Sequence[Row]:
+    """Weighted full-text search ranked with ``ts_rank``.
+
+    Matching and ranking read the stored ``search_vector`` column, so no
+    document is parsed at query time. ``ts_headline`` has to re-parse the
+    description, which is why snippets are built only for the returned page.
+    """
+    text_config = literal_column(f"'{SEARCH_TEXT_CONFIG}'::regconfig")
+    ts_query = func.websearch_to_tsquery(text_config, query)
+    rank = func.ts_rank(Anime.search_vector, ts_query)
+    columns = [*ANIME_LIST_COLUMNS, rank.label("rank")]
+    if highlight:
+        columns.append(Anime.description)
+
+    page = (
+        select(*columns)
+        .where(Anime.search_vector.op("@@")(ts_query))
+        .order_by(rank.desc(), Anime.title.asc())
+        .limit(limit)
+        .offset(offset)
+    )
+    if highlight:
+        page = page.subquery()
+        snippet = func.ts_headline(
+            text_config,
+            func.coalesce(page.c.description, ""),
+            ts_query,
+            "MaxFragments=2, MinWords=5, MaxWords=20, StartSel=<mark>, StopSel=</mark>",
+        )
+        page = select(
+            page.c.id,
+            page.c.title,
+            page.c.year,
+            page.c.status,
+            page.c.rank,
+            snippet.label("snippet"),
+        ).order_by(page.c.rank.desc(), page.c.title.asc())
+
+    result = await db.execute(page)
+    return result.all()
+
+
+async def suggest_anime_titles(
+    db: AsyncSession, prefix: str, limit: int
+) -> Sequence[Row]:
+    stmt = (
+        select(Anime.id, Anime.title)
+        .where(Anime.title.istartswith(prefix, autoescape=True))
+        .order_by(Anime.title.asc())
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def list_anime_titles_with_popularity(db: AsyncSession) -> Sequence[Row]:
+    favorites = (
+        select(Favorite.anime_id, func.count().label("total"))
+        .group_by(Favorite.anime_id)
+        .subquery()
+    )
+    watchers = (
+        select(WatchProgress.anime_id, func.count().label("total"))
+        .group_by(WatchProgress.anime_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            Anime.id,
+            Anime.title,
+            Anime.title_original,
+            (
+                func.coalesce(favorites.c.total, 0) + func.coalesce(watchers.c.total, 0)
+            ).label("popularity"),
+        )
+        .outerjoin(favorites, favorites.c.anime_id == Anime.id)
+        .outerjoin(watchers, watchers.c.anime_id == Anime.id)
+    )
+    result = await db.execute(stmt)
+    return result.all()
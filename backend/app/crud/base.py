@@ -1,13 +1,24 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Base
+from ..utils.pagination import Page, apply_keyset_pagination, build_page
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def schema_columns(model: type[Base], schema: type[BaseModel], *extra: str) -> list[Any]:
+    """
+    Mapped columns backing ``schema``'s fields plus ``extra`` attributes, for
+    list queries that should not hydrate full ORM entities.
+    """
+    names = dict.fromkeys([*schema.model_fields, *extra])
+    return [getattr(model, name) for name in names]
+
+
 class CRUDBase(Generic[ModelType]):
     """
     Generic CRUD interface to be extended per model.
@@ -24,6 +35,22 @@ class CRUDBase(Generic[ModelType]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_page(
+        self, session: AsyncSession, limit: int = 100, cursor: str | None = None
+    ) -> Page[ModelType]:
+        """
+        Keyset-paginated listing; the model must define ``created_at`` and ``id``.
+        """
+        stmt = apply_keyset_pagination(
+            select(self.model),
+            self.model.created_at,
+            self.model.id,
+            limit=limit,
+            cursor=cursor,
+        )
+        result = await session.execute(stmt)
+        return build_page(list(result.scalars().all()), limit)
+
     async def create(self, session: AsyncSession, obj_in: dict) -> ModelType:
         instance = self.model(**obj_in)
         session.add(instance)
@@ -0,0 +1,46 @@
+from ..config import settings
+from ..models.anime import Anime
+from ..models.episode import Episode
+from ..models.release import Release
+from ..utils.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    ReadThroughCache,
+    RedisCacheBackend,
+)
+from ..utils.metrics import register_metrics
+from ..utils.model_events import ModelChange, on_commit
+
+ANIME_NAMESPACE = "anime"
+RELEASE_NAMESPACE = "release"
+EPISODES_NAMESPACE = "episodes"
+
+
+def _create_backend() -> CacheBackend:
+    if settings.cache_backend == "redis" and settings.cache_redis_url:
+        return RedisCacheBackend(settings.cache_redis_url)
+    return MemoryCacheBackend(maxsize=settings.cache_max_entries)
+
+
+catalog_cache = ReadThroughCache(_create_backend())
+register_metrics("catalog_cache", catalog_cache.stats)
+
+
+def _invalidate_by(namespace: str, key_field: str):
+    def listener(changes: list[ModelChange]) -> None:
+        # A row moved to another parent is stale under its old key too.
+        keys = {
+            key
+            for change in changes
+            for key in (change.values.get(key_field), change.previous.get(key_field))
+            if key is not None
+        }
+        if keys:
+            catalog_cache.invalidate(namespace, *keys)
+
+    return listener
+
+
+on_commit(Anime, _invalidate_by(ANIME_NAMESPACE, "id"))
+on_commit(Release, _invalidate_by(RELEASE_NAMESPACE, "id"))
+on_commit(Episode, _invalidate_by(EPISODES_NAMESPACE, "release_id"))
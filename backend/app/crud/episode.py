@@ -1,18 +1,65 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
 from ..models.episode import Episode
+from ..models.release import Release
+from ..schemas.episode import EpisodeListItem
+from .base import schema_columns
+from .catalog_cache import EPISODES_NAMESPACE, catalog_cache
 
+EPISODE_LIST_COLUMNS = schema_columns(Episode, EpisodeListItem)
 
-async def get_episodes_by_release(
+
+async def load_episodes_by_release(
     session: AsyncSession, release_id: uuid.UUID
-) -> list[Episode]:
+) -> list[Row]:
     stmt = (
-        select(Episode)
+        select(*EPISODE_LIST_COLUMNS)
         .where(Episode.release_id == release_id)
         .order_by(Episode.number.asc())
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return list(result.all())
+
+
+async def get_episodes_by_release(
+    session: AsyncSession, release_id: uuid.UUID
+) -> list[EpisodeListItem]:
+    """Read-through cached episode list of a release, ordered by number."""
+
+    async def load() -> list[EpisodeListItem]:
+        episodes = await load_episodes_by_release(session, release_id)
+        return [EpisodeListItem.model_validate(episode) for episode in episodes]
+
+    return await catalog_cache.get_or_load(
+        EPISODES_NAMESPACE,
+        release_id,
+        load,
+        ttl_seconds=settings.cache_episodes_ttl_seconds,
+        dump=lambda episodes: [episode.model_dump(mode="json") for episode in episodes],
+        load=lambda payload: [EpisodeListItem.model_validate(item) for item in payload],
+    )
+
+
+async def get_release_episodes_version(
+    session: AsyncSession, release_id: uuid.UUID
+) -> Row | None:
+    """
+    Release timestamp plus episode count and latest episode timestamp, or
+    ``None`` when the release does not exist.
+    """
+    stmt = (
+        select(
+            Release.updated_at.label("release_updated_at"),
+            func.count(Episode.id).label("episode_count"),
+            func.max(Episode.updated_at).label("episodes_updated_at"),
+        )
+        .outerjoin(Episode, Episode.release_id == Release.id)
+        .where(Release.id == release_id)
+        .group_by(Release.id)
+    )
+    result = await session.execute(stmt)
+    return result.first()
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.favorite import Favorite
+from ..utils.pagination import Page, apply_keyset_pagination, build_page
 
 
 async def get_favorite(
@@ -38,14 +39,19 @@ async def remove_favorite(
 
 
 async def list_favorites(
-    session: AsyncSession, user_id: uuid.UUID, limit: int, offset: int
-) -> list[Favorite]:
-    stmt = (
-        select(Favorite)
-        .where(Favorite.user_id == user_id)
-        .order_by(Favorite.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[Favorite]:
+    stmt = apply_keyset_pagination(
+        select(Favorite).where(Favorite.user_id == user_id),
+        Favorite.created_at,
+        Favorite.id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return build_page(list(result.scalars().all()), limit)
@@ -0,0 +1,205 @@
+import operator
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import reduce
+from typing import Any
+
+from sqlalchemy import (
+    Date,
+    Select,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from ..models.anime import Anime
+from ..models.episode import Episode
+from ..models.favorite import Favorite
+from ..models.popularity import AnimeDailyStats, AnimeRanking, RollupWatermark
+from ..models.release import Release
+from ..models.view import View
+from ..models.watch_progress import WatchProgress
+from ..schemas.anime import AnimeListItem
+from .base import schema_columns
+
+
+@dataclass(frozen=True)
+class EventSource:
+    """Append-like events counted into one ``anime_daily_stats`` column.
+
+    ``events`` selects ``anime_id`` and the ``occurred_at`` that picks the
+    day; ``ingested_at`` is the column the watermark advances over. It should
+    be stamped when the row is written rather than when the event happened,
+    so rows written late are not skipped.
+    """
+
+    name: str
+    counter: str
+    ingested_at: Any
+    events: Select
+
+
+EVENT_SOURCES = (
+    EventSource(
+        name="views",
+        counter="views",
+        ingested_at=View.ingested_at,
+        events=select(Release.anime_id, View.viewed_at.label("occurred_at"))
+        .join(Episode, Episode.id == View.episode_id)
+        .join(Release, Release.id == Episode.release_id),
+    ),
+    EventSource(
+        name="watch_starts",
+        counter="watch_starts",
+        ingested_at=WatchProgress.created_at,
+        events=select(
+            WatchProgress.anime_id, WatchProgress.created_at.label("occurred_at")
+        ),
+    ),
+    EventSource(
+        name="favorites",
+        counter="favorites",
+        ingested_at=Favorite.created_at,
+        events=select(Favorite.anime_id, Favorite.created_at.label("occurred_at")),
+    ),
+)
+
+
+async def get_rollup_watermark(
+    connection: AsyncConnection, source: EventSource
+) -> datetime | None:
+    return await connection.scalar(
+        select(RollupWatermark.processed_until).where(
+            RollupWatermark.source == source.name
+        )
+    )
+
+
+async def set_rollup_watermark(
+    connection: AsyncConnection, source: EventSource, processed_until: datetime
+) -> None:
+    stmt = pg_insert(RollupWatermark).values(
+        source=source.name, processed_until=processed_until
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RollupWatermark.source],
+        set_={"processed_until": stmt.excluded.processed_until},
+    )
+    await connection.execute(stmt)
+
+
+async def get_earliest_event(
+    connection: AsyncConnection, source: EventSource
+) -> datetime | None:
+    return await connection.scalar(select(func.min(source.ingested_at)))
+
+
+async def roll_up_events(
+    connection: AsyncConnection,
+    source: EventSource,
+    after: datetime,
+    until: datetime,
+) -> int:
+    """Add events ingested in ``(after, until]`` to the daily counters.
+
+    Returns the number of daily rows touched.
+    """
+    events = source.events.where(
+        source.ingested_at > after, source.ingested_at <= until
+    ).subquery()
+    day = cast(func.timezone(literal_column("'UTC'"), events.c.occurred_at), Date)
+    counts = select(
+        events.c.anime_id, day.label("day"), func.count().label(source.counter)
+    ).group_by(events.c.anime_id, day)
+
+    stmt = pg_insert(AnimeDailyStats).from_select(
+        ["anime_id", "day", source.counter], counts
+    )
+    counter = getattr(AnimeDailyStats, source.counter)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AnimeDailyStats.anime_id, AnimeDailyStats.day],
+        set_={source.counter: counter + stmt.excluded[source.counter]},
+    )
+    result = await connection.execute(stmt)
+    return result.rowcount
+
+
+async def compute_ranking(
+    connection: AsyncConnection,
+    score: Any,
+    *,
+    since: date,
+    limit: int,
+) -> list[tuple[uuid.UUID, float]]:
+    """Top ``limit`` anime by ``score`` summed over the days from ``since`` on."""
+    total = func.sum(score).label("score")
+    stmt = (
+        select(AnimeDailyStats.anime_id, total)
+        .where(AnimeDailyStats.day >= since)
+        .group_by(AnimeDailyStats.anime_id)
+        .order_by(total.desc(), AnimeDailyStats.anime_id)
+        .limit(limit)
+    )
+    result = await connection.execute(stmt)
+    return [(row.anime_id, float(row.score)) for row in result if row.score > 0]
+
+
+def decayed_score(
+    weights: dict[str, float], *, today: date, half_life_hours: int
+) -> Any:
+    """Weighted daily counters halved every ``half_life_hours`` of age."""
+    events = reduce(
+        operator.add,
+        (
+            getattr(AnimeDailyStats, counter) * weight
+            for counter, weight in weights.items()
+        ),
+    )
+    age_hours = (literal(today, Date) - AnimeDailyStats.day) * 24.0
+    return events * func.power(0.5, age_hours / float(half_life_hours))
+
+
+async def replace_ranking(
+    connection: AsyncConnection,
+    ranking: str,
+    entries: Sequence[tuple[uuid.UUID, float]],
+    computed_at: datetime,
+) -> None:
+    await connection.execute(delete(AnimeRanking).where(AnimeRanking.ranking == ranking))
+    if not entries:
+        return
+    await connection.execute(
+        insert(AnimeRanking),
+        [
+            {
+                "ranking": ranking,
+                "rank": rank,
+                "anime_id": anime_id,
+                "score": score,
+                "computed_at": computed_at,
+            }
+            for rank, (anime_id, score) in enumerate(entries, start=1)
+        ],
+    )
+
+
+async def list_ranking(
+    session: AsyncSession, ranking: str, limit: int
+) -> list[Any]:
+    stmt = (
+        select(*schema_columns(Anime, AnimeListItem), AnimeRanking.score)
+        .join(Anime, Anime.id == AnimeRanking.anime_id)
+        .where(AnimeRanking.ranking == ranking)
+        .order_by(AnimeRanking.rank)
+        .limit(limit)
+    )
+    result = await session.execute(stmt)
+    return list(result.all())
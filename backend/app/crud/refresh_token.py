@@ -1,35 +1,106 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, and_, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from ..models.refresh_token import RefreshToken
+from ..models.user import User
 
 
-async def create_or_rotate_refresh_token(
-    session: AsyncSession, user_id: uuid.UUID, token_hash: str, expires_at: datetime
-) -> RefreshToken:
-    result = await session.execute(
-        select(RefreshToken).where(RefreshToken.user_id == user_id)
-    )
-    existing = result.scalars().first()
-    if existing:
-        existing.token_hash = token_hash
-        existing.expires_at = expires_at
-        existing.revoked = False
-        await session.flush()
-        return existing
-
-    refresh_token = RefreshToken(
+async def upsert_refresh_token_session(
+    session: AsyncSession,
+    *,
+    session_id: uuid.UUID,
+    user_id: uuid.UUID,
+    token_hash: str,
+    expires_at: datetime,
+    user_agent: str | None = None,
+    ip_address: str | None = None,
+) -> None:
+    """Open session ``session_id`` or rotate its token, in one statement."""
+    stmt = pg_insert(RefreshToken).values(
+        id=session_id,
         user_id=user_id,
         token_hash=token_hash,
         expires_at=expires_at,
         revoked=False,
+        user_agent=user_agent,
+        ip_address=ip_address,
     )
-    session.add(refresh_token)
-    await session.flush()
-    return refresh_token
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RefreshToken.id],
+        set_={
+            "token_hash": stmt.excluded.token_hash,
+            "expires_at": stmt.excluded.expires_at,
+            "last_used_at": func.now(),
+            "ip_address": func.coalesce(
+                stmt.excluded.ip_address, RefreshToken.ip_address
+            ),
+        },
+    )
+    await session.execute(stmt)
+
+
+async def get_refresh_session_for_rotation(
+    session: AsyncSession, token_hash: str
+) -> Row | None:
+    """Lock the session row for ``token_hash`` and read its owner's token claims."""
+    result = await session.execute(
+        select(
+            RefreshToken.id,
+            RefreshToken.user_id,
+            RefreshToken.revoked,
+            RefreshToken.expires_at,
+            User.is_active,
+            User.token_version,
+        )
+        .join(User, User.id == RefreshToken.user_id)
+        .where(RefreshToken.token_hash == token_hash)
+        .with_for_update(of=RefreshToken)
+    )
+    return result.first()
+
+
+async def rotate_refresh_token_if_current(
+    session: AsyncSession,
+    *,
+    token_hash: str,
+    new_token_hash: str,
+    expires_at: datetime,
+    ip_address: str | None = None,
+) -> Row | None:
+    """Compare-and-swap rotation: succeeds only while ``token_hash`` is current.
+
+    Returns the session id with its owner's token claims, or None when the
+    token was already rotated, revoked or expired. No row lock is held
+    beyond the statement's own transaction.
+    """
+    result = await session.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked.is_(False),
+            RefreshToken.expires_at > func.now(),
+            User.id == RefreshToken.user_id,
+            User.is_active.is_(True),
+        )
+        .values(
+            token_hash=new_token_hash,
+            expires_at=expires_at,
+            last_used_at=func.now(),
+            ip_address=func.coalesce(ip_address, RefreshToken.ip_address),
+        )
+        .returning(
+            RefreshToken.id,
+            RefreshToken.user_id,
+            User.is_active,
+            User.token_version,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.first()
 
 
 async def get_refresh_token_by_hash(
@@ -43,14 +114,74 @@ async def get_refresh_token_by_hash(
     return result.scalars().first()
 
 
+async def get_user_refresh_token(
+    session: AsyncSession, user_id: uuid.UUID, session_id: uuid.UUID
+) -> RefreshToken | None:
+    result = await session.execute(
+        select(RefreshToken).where(
+            RefreshToken.id == session_id, RefreshToken.user_id == user_id
+        )
+    )
+    return result.scalars().first()
+
+
+async def list_active_refresh_tokens(
+    session: AsyncSession, user_id: uuid.UUID
+) -> list[RefreshToken]:
+    result = await session.execute(
+        select(RefreshToken)
+        .where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.revoked.is_(False),
+            RefreshToken.expires_at > datetime.now(timezone.utc),
+        )
+        .order_by(RefreshToken.last_used_at.desc(), RefreshToken.id.desc())
+    )
+    return list(result.scalars().all())
+
+
 async def revoke_refresh_token(
+    session: AsyncSession, refresh_token: RefreshToken
+) -> RefreshToken:
+    refresh_token.revoked = True
+    await session.flush()
+    return refresh_token
+
+
+async def revoke_user_refresh_tokens(
     session: AsyncSession, user_id: uuid.UUID
-) -> RefreshToken | None:
+) -> int:
     result = await session.execute(
-        select(RefreshToken).where(RefreshToken.user_id == user_id)
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked.is_(False))
+        .values(revoked=True)
+    )
+    return result.rowcount
+
+
+async def delete_stale_refresh_tokens(
+    connection: AsyncConnection,
+    *,
+    expired_before: datetime,
+    revoked_before: datetime,
+    limit: int,
+) -> int:
+    """Delete up to ``limit`` expired or long-revoked rows; locked rows are skipped."""
+    stale_ids = (
+        select(RefreshToken.id)
+        .where(
+            or_(
+                RefreshToken.expires_at < expired_before,
+                and_(
+                    RefreshToken.revoked.is_(True),
+                    RefreshToken.last_used_at < revoked_before,
+                ),
+            )
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await connection.execute(
+        delete(RefreshToken).where(RefreshToken.id.in_(stale_ids))
     )
-    token = result.scalars().first()
-    if token:
-        token.revoked = True
-        await session.flush()
-    return token
+    return result.rowcount
@@ -1,25 +1,92 @@
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
+from ..models.episode import Episode
 from ..models.release import Release
+from ..schemas.release import CachedRelease, ReleaseListItem
+from ..utils.pagination import Page, apply_keyset_pagination, build_page
+from .base import schema_columns
+from .catalog_cache import RELEASE_NAMESPACE, catalog_cache
+
+RELEASE_LIST_COLUMNS = schema_columns(
+    Release, ReleaseListItem, "created_at", "updated_at"
+)
 
 
 async def get_releases(
-    session: AsyncSession, limit: int, offset: int
-) -> list[Release]:
-    stmt = (
-        select(Release)
-        .order_by(Release.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+    session: AsyncSession, limit: int, offset: int = 0, cursor: str | None = None
+) -> Page[Row]:
+    stmt = apply_keyset_pagination(
+        select(*RELEASE_LIST_COLUMNS),
+        Release.created_at,
+        Release.id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return build_page(list(result.all()), limit)
 
 
-async def get_release_by_id(
+async def load_release(
     session: AsyncSession, release_id: uuid.UUID
 ) -> Release | None:
     return await session.get(Release, release_id)
+
+
+async def get_release_by_id(
+    session: AsyncSession, release_id: uuid.UUID
+) -> CachedRelease | None:
+    """Read-through cached lookup; use ``load_release`` when the ORM entity is needed."""
+
+    async def load() -> CachedRelease | None:
+        release = await load_release(session, release_id)
+        return None if release is None else CachedRelease.model_validate(release)
+
+    return await catalog_cache.get_or_load(
+        RELEASE_NAMESPACE,
+        release_id,
+        load,
+        ttl_seconds=settings.cache_release_ttl_seconds,
+        dump=lambda release: release.model_dump(mode="json"),
+        load=CachedRelease.model_validate,
+    )
+
+
+async def get_release_updated_at(
+    session: AsyncSession, release_id: uuid.UUID
+) -> datetime | None:
+    return await session.scalar(
+        select(Release.updated_at).where(Release.id == release_id)
+    )
+
+
+async def get_release_episode_rows(
+    session: AsyncSession, anime_id: uuid.UUID
+) -> Sequence[Row]:
+    """
+    All releases of an anime outer-joined with their episodes in one query,
+    ordered so rows of the same release are adjacent.
+    """
+    stmt = (
+        select(
+            Release.id,
+            Release.anime_id,
+            Release.title,
+            Release.year,
+            Release.status,
+            Episode.id.label("episode_id"),
+            Episode.number.label("episode_number"),
+            Episode.title.label("episode_title"),
+        )
+        .outerjoin(Episode, Episode.release_id == Release.id)
+        .where(Release.anime_id == anime_id)
+        .order_by(Release.created_at.asc(), Release.id, Episode.number.asc())
+    )
+    result = await session.execute(stmt)
+    return result.all()
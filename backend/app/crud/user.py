@@ -1,9 +1,188 @@
-from sqlalchemy import select
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import false, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
+from ..models.refresh_token import RefreshToken
 from ..models.user import User
+from ..utils.cache import TTLCache
+from ..utils.metrics import register_metrics
+from ..utils.model_events import ModelChange, on_commit
+
+
+@dataclass(frozen=True, slots=True)
+class UserIdentity:
+    """The part of a user row needed to authorize a request."""
+
+    id: uuid.UUID
+    is_active: bool
+    token_version: int
+
+
+user_identity_cache: TTLCache[uuid.UUID, UserIdentity] = TTLCache(
+    maxsize=settings.auth_user_cache_size,
+    ttl_seconds=settings.auth_user_cache_ttl_seconds,
+)
+register_metrics("auth_user_cache", user_identity_cache.stats)
 
 
 async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
     result = await session.execute(select(User).where(User.email == email))
     return result.scalars().first()
+
+
+async def get_user_password_hash(
+    session: AsyncSession, user_id: uuid.UUID
+) -> str | None:
+    return await session.scalar(select(User.password_hash).where(User.id == user_id))
+
+
+async def update_user_credentials(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    password_hash: str | None = None,
+    is_active: bool | None = None,
+) -> UserIdentity | None:
+    """Change the password and/or active flag and bump ``token_version``.
+
+    Both happen in one UPDATE, so access tokens issued before it fail the
+    version check as soon as it commits. Core statements skip the commit
+    hooks: callers evict ``user_identity_cache`` after committing. Returns
+    None when the user does not exist.
+    """
+    values: dict[str, Any] = {"token_version": User.token_version + 1}
+    if password_hash is not None:
+        values["password_hash"] = password_hash
+    if is_active is not None:
+        values["is_active"] = is_active
+    result = await session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(**values)
+        .returning(User.id, User.is_active, User.token_version)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return UserIdentity(
+        id=row.id, is_active=row.is_active, token_version=row.token_version
+    )
+
+
+async def create_user_with_refresh_token(
+    session: AsyncSession,
+    *,
+    email: str,
+    password_hash: str,
+    session_id: uuid.UUID,
+    token_hash: str,
+    expires_at: datetime,
+    user_agent: str | None = None,
+    ip_address: str | None = None,
+) -> UserIdentity | None:
+    """Insert a user and its first refresh session in one statement.
+
+    Returns None when the email is taken; the unique constraint decides, so
+    concurrent sign-ups with the same email cannot both succeed.
+    """
+    new_user = (
+        pg_insert(User)
+        .values(
+            id=uuid.uuid4(),
+            email=email,
+            password_hash=password_hash,
+            is_active=True,
+            token_version=0,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id, User.is_active, User.token_version)
+        .cte("new_user")
+    )
+    new_session = (
+        pg_insert(RefreshToken)
+        .from_select(
+            [
+                RefreshToken.id,
+                RefreshToken.user_id,
+                RefreshToken.token_hash,
+                RefreshToken.expires_at,
+                RefreshToken.revoked,
+                RefreshToken.user_agent,
+                RefreshToken.ip_address,
+            ],
+            select(
+                literal(session_id, RefreshToken.id.type),
+                new_user.c.id,
+                literal(token_hash, RefreshToken.token_hash.type),
+                literal(expires_at, RefreshToken.expires_at.type),
+                false(),
+                literal(user_agent, RefreshToken.user_agent.type),
+                literal(ip_address, RefreshToken.ip_address.type),
+            ),
+        )
+        .cte("new_session")
+    )
+    result = await session.execute(
+        select(new_user.c.id, new_user.c.is_active, new_user.c.token_version)
+        .add_cte(new_session)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return UserIdentity(
+        id=row.id, is_active=row.is_active, token_version=row.token_version
+    )
+
+
+async def load_user_identity(
+    session: AsyncSession, user_id: uuid.UUID
+) -> UserIdentity | None:
+    result = await session.execute(
+        select(User.id, User.is_active, User.token_version).where(User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return UserIdentity(
+        id=row.id, is_active=row.is_active, token_version=row.token_version
+    )
+
+
+async def get_user_identity(
+    session: AsyncSession, user_id: uuid.UUID
+) -> UserIdentity | None:
+    identity = user_identity_cache.get(user_id)
+    if identity is None:
+        identity = await load_user_identity(session, user_id)
+        if identity is not None:
+            user_identity_cache.set(user_id, identity)
+    return identity
+
+
+def _refresh_identities(changes: list[ModelChange]) -> None:
+    for change in changes:
+        user_id = change.values.get("id")
+        if user_id is None:
+            continue
+        # Write the committed state through; partial snapshots are re-read.
+        if change.deleted or not {"is_active", "token_version"} <= change.values.keys():
+            user_identity_cache.delete(user_id)
+            continue
+        user_identity_cache.set(
+            user_id,
+            UserIdentity(
+                id=user_id,
+                is_active=change.values["is_active"],
+                token_version=change.values["token_version"],
+            ),
+        )
+
+
+on_commit(User, _refresh_identities)
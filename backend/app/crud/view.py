@@ -1,19 +1,116 @@
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+import re
+import uuid
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from ..models.view import View
+from ..schemas.view import ViewRead
+from ..utils.pagination import Page, apply_keyset_pagination, build_page
+from .base import schema_columns
+
+VIEW_COLUMNS = (
+    "id",
+    "user_id",
+    "episode_id",
+    "position_seconds",
+    "progress_percent",
+    "device",
+    "viewed_at",
+)
+
+_PARTITION_RE = re.compile(r"^views_y(\d{4})m(\d{2})$")
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def view_month(moment: datetime) -> date:
+    """First day of the UTC month whose partition holds ``moment``."""
+    return moment.astimezone(timezone.utc).date().replace(day=1)
+
+
+def view_partition_name(month: date) -> str:
+    return f"views_y{month.year:04d}m{month.month:02d}"
+
+
+async def list_view_partitions(connection: AsyncConnection) -> list[date]:
+    result = await connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = 'views'::regclass"
+        )
+    )
+    months: list[date] = []
+    for (name,) in result:
+        match = _PARTITION_RE.match(name)
+        if match is not None:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+async def create_view_partition(connection: AsyncConnection, month: date) -> None:
+    # Names and bounds come from dates, never from input, so inlining is safe.
+    # Bounds are pinned to UTC rather than the session time zone.
+    await connection.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {view_partition_name(month)} "
+            f"PARTITION OF views FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+            f"TO ('{add_months(month, 1).isoformat()} 00:00+00')"
+        )
+    )
+
+
+async def drop_view_partition(connection: AsyncConnection, month: date) -> None:
+    await connection.execute(text(f"DROP TABLE IF EXISTS {view_partition_name(month)}"))
+
+
+async def insert_views(
+    connection: AsyncConnection, records: Sequence[tuple[Any, ...]]
+) -> None:
+    """Append ``records`` (tuples in ``VIEW_COLUMNS`` order) to the view log.
+
+    With asyncpg the rows go through binary COPY, other drivers fall back to a
+    multi-row INSERT. Either way the rows join the transaction already open on
+    ``connection`` (for example after partitions were checked), so the caller
+    must commit.
+    """
+    if not records:
+        return
 
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if hasattr(driver_connection, "copy_records_to_table"):
+        await driver_connection.copy_records_to_table(
+            View.__tablename__, records=records, columns=VIEW_COLUMNS
+        )
+        return
 
-async def record_view(session: AsyncSession, data: dict) -> View:
-    view = View(**data)
-    session.add(view)
-    await session.flush()
-    return view
+    await connection.execute(
+        insert(View), [dict(zip(VIEW_COLUMNS, record)) for record in records]
+    )
 
 
-async def list_views(
-    session: AsyncSession, limit: int = 20, offset: int = 0
-) -> list[View]:
-    stmt = select(View).limit(limit).offset(offset)
+async def list_user_views(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[Any]:
+    stmt = apply_keyset_pagination(
+        select(*schema_columns(View, ViewRead)).where(View.user_id == user_id),
+        View.viewed_at,
+        View.id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return build_page(list(result.all()), limit, created_at_attr="viewed_at")
@@ -1,9 +1,25 @@
 import uuid
+from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Integer, Row, column, func, select, true, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..models.anime import Anime
+from ..models.episode import Episode
+from ..models.release import Release
 from ..models.watch_progress import WatchProgress
+from ..schemas.episode import EpisodeListItem
+from ..schemas.watch import (
+    ContinueWatchingAnime,
+    ContinueWatchingItem,
+    WatchProgressRead,
+)
+from .base import schema_columns
+
+USER_FOREIGN_KEY = "fk_watch_progress_user_id_users"
 
 
 async def get_watch_progress(
@@ -16,7 +32,7 @@ async def get_watch_progress(
     return result.scalar_one_or_none()
 
 
-async def create_watch_progress(
+async def upsert_watch_progress(
     session: AsyncSession,
     user_id: uuid.UUID,
     anime_id: uuid.UUID,
@@ -24,40 +40,166 @@ async def create_watch_progress(
     position_seconds: int | None,
     progress_percent: float | None,
 ) -> WatchProgress:
-    progress = WatchProgress(
+    """Insert or update the (user_id, anime_id) row and return it in one statement.
+
+    A missing anime surfaces as a foreign key violation from the insert.
+    """
+    stmt = pg_insert(WatchProgress).values(
+        id=uuid.uuid4(),
         user_id=user_id,
         anime_id=anime_id,
         episode=episode,
         position_seconds=position_seconds,
         progress_percent=progress_percent,
     )
-    session.add(progress)
-    await session.flush()
-    return progress
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=[WatchProgress.user_id, WatchProgress.anime_id],
+            set_={
+                "episode": stmt.excluded.episode,
+                "position_seconds": stmt.excluded.position_seconds,
+                "progress_percent": stmt.excluded.progress_percent,
+                "last_watched_at": func.now(),
+            },
+        )
+        .returning(WatchProgress)
+        .execution_options(populate_existing=True)
+    )
+    result = await session.scalars(stmt)
+    return result.one()
 
 
-async def update_watch_progress(
-    session: AsyncSession,
-    progress: WatchProgress,
-    episode: int,
-    position_seconds: int | None,
-    progress_percent: float | None,
-) -> WatchProgress:
-    progress.episode = episode
-    progress.position_seconds = position_seconds
-    progress.progress_percent = progress_percent
-    await session.flush()
-    return progress
+def _next_episode(anime_id: Any, episode: Any) -> Any:
+    """Lowest-numbered episode after ``episode`` across the anime's releases."""
+    return (
+        select(
+            Episode.id.label("next_episode_id"),
+            Episode.number.label("next_episode_number"),
+            Episode.title.label("next_episode_title"),
+        )
+        .join(Release, Release.id == Episode.release_id)
+        .where(Release.anime_id == anime_id, Episode.number > episode)
+        .order_by(Episode.number, Release.created_at)
+        .limit(1)
+        .lateral("next_episode")
+    )
+
 
+def _continue_watching_item(progress: Any, row: Row) -> ContinueWatchingItem:
+    next_episode = None
+    if row.next_episode_id is not None:
+        next_episode = EpisodeListItem(
+            id=row.next_episode_id,
+            number=row.next_episode_number,
+            title=row.next_episode_title,
+        )
+    return ContinueWatchingItem(
+        **WatchProgressRead.model_validate(progress).model_dump(),
+        anime=ContinueWatchingAnime(
+            id=progress.anime_id, title=row.anime_title, year=row.anime_year
+        ),
+        next_episode=next_episode,
+    )
 
-async def list_watch_progress(
+
+async def list_continue_watching(
     session: AsyncSession, user_id: uuid.UUID, limit: int
-) -> list[WatchProgress]:
+) -> list[ContinueWatchingItem]:
+    """Most recent progress with anime and next episode, newest first.
+
+    Served by ix_watch_progress_user_id_last_watched_at as a range scan, so
+    no sort runs no matter how long the history is; the anime lookup and the
+    next-episode lateral join only touch the ``limit`` rows returned.
+    """
+    next_episode = _next_episode(WatchProgress.anime_id, WatchProgress.episode)
     stmt = (
-        select(WatchProgress)
+        select(
+            *schema_columns(WatchProgress, WatchProgressRead),
+            Anime.title.label("anime_title"),
+            Anime.year.label("anime_year"),
+            next_episode,
+        )
+        .join(Anime, Anime.id == WatchProgress.anime_id)
+        .outerjoin(next_episode, true())
         .where(WatchProgress.user_id == user_id)
         .order_by(WatchProgress.last_watched_at.desc())
         .limit(limit)
     )
     result = await session.execute(stmt)
+    return [_continue_watching_item(row, row) for row in result]
+
+
+async def describe_watch_progress(
+    session: AsyncSession, entries: Sequence[Any]
+) -> list[ContinueWatchingItem]:
+    """Attach anime and next episode to progress not read from the table.
+
+    Entries whose anime no longer exists are left out.
+    """
+    if not entries:
+        return []
+
+    source = values(
+        column("anime_id", UUID(as_uuid=True)),
+        column("episode", Integer),
+        name="progress",
+    ).data([(entry.anime_id, entry.episode) for entry in entries])
+    next_episode = _next_episode(source.c.anime_id, source.c.episode)
+    stmt = (
+        select(
+            source.c.anime_id,
+            source.c.episode,
+            Anime.title.label("anime_title"),
+            Anime.year.label("anime_year"),
+            next_episode,
+        )
+        .join(Anime, Anime.id == source.c.anime_id)
+        .outerjoin(next_episode, true())
+    )
+    result = await session.execute(stmt)
+    rows = {(row.anime_id, row.episode): row for row in result}
+    return [
+        _continue_watching_item(entry, rows[(entry.anime_id, entry.episode)])
+        for entry in entries
+        if (entry.anime_id, entry.episode) in rows
+    ]
+
+
+async def list_watch_progress_for_anime(
+    session: AsyncSession, user_id: uuid.UUID, anime_ids: Sequence[uuid.UUID]
+) -> list[WatchProgress]:
+    stmt = (
+        select(WatchProgress)
+        .where(
+            WatchProgress.user_id == user_id, WatchProgress.anime_id.in_(anime_ids)
+        )
+        .order_by(WatchProgress.last_watched_at.desc())
+    )
+    result = await session.execute(stmt)
     return list(result.scalars().all())
+
+
+async def upsert_watch_progress_many(
+    session: AsyncSession, rows: Sequence[dict[str, Any]]
+) -> None:
+    """Bulk upsert keyed by (user_id, anime_id) in a single statement.
+
+    Each row carries its own ``last_watched_at``; an existing row is only
+    overwritten by a newer one, so late or replayed writes never move
+    progress backwards.
+    """
+    if not rows:
+        return
+
+    stmt = pg_insert(WatchProgress).values(list(rows))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[WatchProgress.user_id, WatchProgress.anime_id],
+        set_={
+            "episode": stmt.excluded.episode,
+            "position_seconds": stmt.excluded.position_seconds,
+            "progress_percent": stmt.excluded.progress_percent,
+            "last_watched_at": stmt.excluded.last_watched_at,
+        },
+        where=WatchProgress.last_watched_at <= stmt.excluded.last_watched_at,
+    )
+    await session.execute(stmt)
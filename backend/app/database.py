@@ -13,6 +13,13 @@ engine = create_async_engine(
     max_overflow=settings.db_max_overflow,
     pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args={
+        "server_settings": {
+            "pg_trgm.word_similarity_threshold": str(
+                settings.search_similarity_threshold
+            ),
+        }
+    },
 )
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
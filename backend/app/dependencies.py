@@ -1,10 +1,13 @@
 import uuid
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .config import settings
+from .crud.user import UserIdentity, get_user_identity, load_user_identity
 from .database import get_session
 from .models.user import User
 from .utils.security import (
@@ -21,10 +24,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-    db: AsyncSession = Depends(get_db),
-):
+def _decode_credentials(
+    credentials: HTTPAuthorizationCredentials | None,
+) -> tuple[uuid.UUID, dict[str, Any]]:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
@@ -57,10 +59,69 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload"
         ) from None
 
+    return user_id, payload
+
+
+def _check_token_claims(
+    payload: dict[str, Any], *, is_active: bool, token_version: int
+) -> None:
+    if payload.get("act") is False or not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user"
+        )
+    # Tokens issued before the "ver" claim existed are accepted until they expire.
+    claimed_version = payload.get("ver")
+    if claimed_version is not None and claimed_version != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked"
+        )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    user_id, payload = _decode_credentials(credentials)
+
     user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
 
+    _check_token_claims(
+        payload, is_active=user.is_active, token_version=user.token_version
+    )
     return user
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> UserIdentity:
+    """Authenticate a request that only needs the caller's id.
+
+    With ``AUTH_STATELESS`` enabled the identity comes from the token claims
+    checked against a short-lived in-process cache, so the session is only
+    used on a cache miss.
+    """
+    user_id, payload = _decode_credentials(credentials)
+
+    if settings.auth_stateless:
+        if payload.get("act") is False:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user"
+            )
+        identity = await get_user_identity(db, user_id)
+    else:
+        identity = await load_user_identity(db, user_id)
+
+    if identity is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+        )
+
+    _check_token_claims(
+        payload, is_active=identity.is_active, token_version=identity.token_version
+    )
+    return identity
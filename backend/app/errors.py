@@ -1,3 +1,5 @@
+import math
+
 from fastapi import status
 
 
@@ -5,6 +7,7 @@ class AppError(Exception):
     code: str = "APP_ERROR"
     message: str = "Application error"
     status_code: int = status.HTTP_400_BAD_REQUEST
+    headers: dict[str, str] | None = None
 
     def __init__(
         self,
@@ -53,6 +56,23 @@ class ConflictError(AppError):
     status_code = status.HTTP_409_CONFLICT
 
 
+class RateLimitError(AppError):
+    code = "RATE_LIMITED"
+    message = "Too many requests"
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+
+    def __init__(self, message: str | None = None, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+class ServiceUnavailableError(AppError):
+    code = "SERVICE_UNAVAILABLE"
+    message = "Service temporarily unavailable"
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
 class InternalError(AppError):
     code = "INTERNAL_ERROR"
     message = "Internal server error"
@@ -66,6 +86,8 @@ ERROR_CODE_BY_STATUS: dict[int, str] = {
     status.HTTP_404_NOT_FOUND: NotFoundError.code,
     status.HTTP_409_CONFLICT: ConflictError.code,
     status.HTTP_422_UNPROCESSABLE_ENTITY: ValidationError.code,
+    status.HTTP_429_TOO_MANY_REQUESTS: RateLimitError.code,
+    status.HTTP_503_SERVICE_UNAVAILABLE: ServiceUnavailableError.code,
 }
 
 
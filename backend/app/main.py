@@ -18,7 +18,8 @@ from sqlalchemy.exc import (
 )
 
 from .config import settings
-from .database import engine
+from .crud.catalog_cache import catalog_cache
+from .database import AsyncSessionLocal, engine
 from .errors import (
     AppError,
     AuthError,
@@ -26,6 +27,8 @@ from .errors import (
     InternalError,
     NotFoundError,
     PermissionError,
+    RateLimitError,
+    ServiceUnavailableError,
     ValidationError,
     error_payload,
     resolve_error_code,
@@ -41,9 +44,30 @@ from .routers import (
     users,
     views,
     watch,
+    well_known,
+)
+from .use_cases.auth.refresh_session import refresh_grace_cache
+from .use_cases.auth.throttle import auth_throttle
+from .use_cases.views.view_log import run_view_log_writer, view_log_writer
+from .use_cases.watch.progress_buffer import (
+    run_watch_progress_flusher,
+    watch_progress_buffer,
 )
 from .utils.health import check_database_connection
+from .utils.jwt_keys import jwt_key_ring, run_key_ring_reloader
+from .utils.metrics import collect_metrics
 from .utils.migrations import run_migrations
+from .utils.pagination import NEXT_CURSOR_HEADER
+from .utils.popularity import popularity_aggregator, run_popularity_aggregator
+from .utils.search_index import anime_search_index, run_anime_search_index_refresher
+from .utils.security import hashing_pool
+from .utils.suggest import run_suggestion_refresher, suggestion_index
+from .utils.token_sweeper import refresh_token_sweeper, run_refresh_token_sweeper
+from .utils.view_partitions import (
+    VIEW_PARTITION_MAINTENANCE_SECONDS,
+    run_view_partition_maintenance,
+    view_partition_maintainer,
+)
 
 AVATAR_DIR = Path(__file__).resolve().parent.parent / "uploads" / "avatars"
 AVATAR_DIR.mkdir(parents=True, exist_ok=True)
@@ -98,8 +122,115 @@ async def lifespan(app: FastAPI):
             db_status.alembic_revision or "unavailable",
         )
 
+    background_tasks: list[asyncio.Task] = []
+    if settings.search_suggest_index_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                run_suggestion_refresher(
+                    suggestion_index,
+                    AsyncSessionLocal,
+                    settings.search_suggest_refresh_seconds,
+                )
+            )
+        )
+    if jwt_key_ring is not None:
+        background_tasks.append(
+            asyncio.create_task(
+                run_key_ring_reloader(jwt_key_ring, settings.jwt_keys_reload_seconds)
+            )
+        )
+    if settings.refresh_token_sweep_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                run_refresh_token_sweeper(
+                    refresh_token_sweeper,
+                    engine,
+                    settings.refresh_token_sweep_interval_seconds,
+                )
+            )
+        )
+    if settings.watch_progress_write_behind:
+        background_tasks.append(
+            asyncio.create_task(
+                run_watch_progress_flusher(
+                    watch_progress_buffer,
+                    AsyncSessionLocal,
+                    settings.watch_progress_flush_seconds,
+                )
+            )
+        )
+    background_tasks.append(
+        asyncio.create_task(
+            run_view_partition_maintenance(
+                view_partition_maintainer, engine, VIEW_PARTITION_MAINTENANCE_SECONDS
+            )
+        )
+    )
+    background_tasks.append(
+        asyncio.create_task(
+            run_view_log_writer(view_log_writer, engine, settings.view_log_flush_seconds)
+        )
+    )
+    if settings.popularity_rollup_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                run_popularity_aggregator(
+                    popularity_aggregator,
+                    engine,
+                    settings.popularity_rollup_interval_seconds,
+                )
+            )
+        )
+    if settings.search_index_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                run_anime_search_index_refresher(
+                    anime_search_index,
+                    AsyncSessionLocal,
+                    settings.search_index_refresh_seconds,
+                )
+            )
+        )
+
     yield
 
+    for task in background_tasks:
+        task.cancel()
+    # A task that already died holds its exception; collect it instead of
+    # letting it abort the flushes and closes below.
+    results = await asyncio.gather(*background_tasks, return_exceptions=True)
+    for task, result in zip(background_tasks, results):
+        if isinstance(result, BaseException) and not isinstance(
+            result, asyncio.CancelledError
+        ):
+            logger.error(
+                "Background task %s failed",
+                task.get_coro().__qualname__,
+                exc_info=result,
+            )
+
+    if settings.watch_progress_write_behind:
+        try:
+            flushed = await watch_progress_buffer.flush(AsyncSessionLocal)
+            logger.info("Flushed %s buffered watch progress rows", flushed)
+        except Exception:
+            logger.exception("Final watch progress flush failed")
+    try:
+        written = await view_log_writer.flush(engine)
+        logger.info("Flushed %s buffered view events", written)
+    except Exception:
+        logger.exception("Final view log flush failed")
+    for name, close in (
+        ("catalog cache", catalog_cache.close),
+        ("auth throttle", auth_throttle.close),
+        ("refresh grace cache", refresh_grace_cache.close),
+    ):
+        try:
+            await close()
+        except Exception:
+            logger.exception("Closing %s failed", name)
+    hashing_pool.shutdown()
+
 
 app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
 
@@ -109,6 +240,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
 app.mount(
@@ -127,6 +259,7 @@ routers = [
     favorites.router,
     views.router,
     watch.router,
+    well_known.router,
 ]
 
 for router in routers:
@@ -141,6 +274,8 @@ SAFE_HTTP_MESSAGES: dict[int, str] = {
     status.HTTP_404_NOT_FOUND: NotFoundError.message,
     status.HTTP_409_CONFLICT: ConflictError.message,
     status.HTTP_422_UNPROCESSABLE_ENTITY: ValidationError.message,
+    status.HTTP_429_TOO_MANY_REQUESTS: RateLimitError.message,
+    status.HTTP_503_SERVICE_UNAVAILABLE: ServiceUnavailableError.message,
 }
 
 
@@ -159,6 +294,7 @@ async def handle_app_error(request: Request, exc: AppError) -> JSONResponse:
     return JSONResponse(
         status_code=exc.status_code,
         content=error_payload(exc.code, exc.message),
+        headers=exc.headers,
     )
 
 
@@ -270,3 +406,8 @@ async def healthcheck() -> Response:
 
     logger.debug("Healthcheck passed")
     return _health_response("ok", status.HTTP_200_OK)
+
+
+@app.get("/metrics", tags=["health"])
+async def metrics() -> dict[str, dict[str, float]]:
+    return collect_metrics()
@@ -3,6 +3,7 @@ from .anime import Anime
 from .collection import Collection
 from .episode import Episode
 from .favorite import Favorite
+from .popularity import AnimeDailyStats, AnimeRanking, RollupWatermark
 from .release import Release
 from .user import User
 from .view import View
@@ -16,6 +17,9 @@ __all__ = [
     "Episode",
     "Collection",
     "Favorite",
+    "AnimeDailyStats",
+    "AnimeRanking",
+    "RollupWatermark",
     "View",
     "WatchProgress",
 ]
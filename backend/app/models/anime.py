@@ -1,15 +1,38 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Computed, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 
+SEARCH_TEXT_CONFIG = "simple"
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}'::regconfig, coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}'::regconfig, coalesce(title_original, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}'::regconfig, coalesce(description, '')), 'C')"
+)
+
 
 class Anime(Base):
     __tablename__ = "anime"
+    __table_args__ = (
+        Index(
+            "ix_anime_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_anime_title_original_trgm",
+            "title_original",
+            postgresql_using="gin",
+            postgresql_ops={"title_original": "gin_trgm_ops"},
+        ),
+        Index("ix_anime_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_anime_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -22,3 +45,12 @@ class Anime(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
+    )
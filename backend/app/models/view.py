@@ -1,20 +1,48 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 
 
 class View(Base):
-    __tablename__ = "views"
+    """Append-only per-episode view log, range-partitioned by month of ``viewed_at``.
+
+    Partitions are named ``views_yYYYYmMM`` and managed by
+    ``utils.view_partitions``; there are no foreign keys, so expired months are
+    dropped as whole tables and ingestion never checks other tables.
+    ``ingested_at`` is set by the database when the row is written and is what
+    the popularity rollup advances over, since ``viewed_at`` can be minutes
+    older for rows that waited in the writer's queue.
+    """
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    episode_id = Column(Integer, ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False)
-    progress = Column(Integer, nullable=False, default=0)
-    last_viewed_at = Column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
+    __tablename__ = "views"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "viewed_at"),
+        Index("ix_views_user_id_viewed_at_id", "user_id", "viewed_at", "id"),
+        Index("ix_views_viewed_at", "viewed_at", postgresql_using="brin"),
+        Index("ix_views_ingested_at", "ingested_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (viewed_at)"},
     )
-    device = Column(String(128))
 
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    episode_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    position_seconds: Mapped[int | None] = mapped_column(Integer)
+    progress_percent: Mapped[float | None] = mapped_column(Float)
+    device: Mapped[str | None] = mapped_column(String(128))
+    viewed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    ingested_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
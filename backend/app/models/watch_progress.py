@@ -1,7 +1,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,7 +19,14 @@ from .base import Base
 
 class WatchProgress(Base):
     __tablename__ = "watch_progress"
-    __table_args__ = (UniqueConstraint("user_id", "anime_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "anime_id"),
+        Index(
+            "ix_watch_progress_user_id_last_watched_at",
+            "user_id",
+            text("last_watched_at DESC"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -19,7 +35,6 @@ class WatchProgress(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     anime_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -31,7 +46,10 @@ class WatchProgress(Base):
     position_seconds: Mapped[int | None] = mapped_column(Integer)
     progress_percent: Mapped[float | None] = mapped_column(Float)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
     )
     last_watched_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -9,6 +9,7 @@ from . import (
     users,
     views,
     watch,
+    well_known,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     "views",
     "search",
     "watch",
+    "well_known",
 ]
@@ -1,29 +1,90 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..crud.anime import get_anime_by_id, get_anime_list
+from ..crud.anime import get_anime_by_id, get_anime_list, get_anime_updated_at
+from ..crud.popularity import list_ranking
 from ..dependencies import get_db
-from ..schemas.anime import AnimeListItem, AnimeRead
+from ..schemas.anime import (
+    AnimeFull,
+    AnimeListItem,
+    AnimeRead,
+    TrendingAnime,
+    TrendingRanking,
+)
+from ..use_cases.anime import get_anime_full
+from ..utils.http_cache import (
+    collection_version,
+    has_conditional_headers,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from ..utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/anime", tags=["anime"])
 
 
 @router.get("/", response_model=list[AnimeListItem])
 async def list_anime(
+    request: Request,
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Opaque {NEXT_CURSOR_HEADER} value"),
     db: AsyncSession = Depends(get_db),
 ) -> list[AnimeListItem]:
-    return await get_anime_list(db, limit=limit, offset=offset)
+    page = await get_anime_list(db, limit=limit, offset=offset, cursor=cursor)
+    etag, last_modified = collection_version("anime", page.items, page.next_cursor)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    set_cache_headers(response, etag, last_modified)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+# Declared before "/{anime_id}" so "trending" is not parsed as an id.
+@router.get("/trending", response_model=list[TrendingAnime])
+async def list_trending_anime(
+    ranking: TrendingRanking = Query("trending"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> list[TrendingAnime]:
+    """Precomputed top-K; ``most_watched`` ranks by views over the last 7 days."""
+    return await list_ranking(db, ranking=ranking, limit=limit)
 
 
 @router.get("/{anime_id}", response_model=AnimeRead)
-async def get_anime(anime_id: UUID, db: AsyncSession = Depends(get_db)) -> AnimeRead:
+async def get_anime(
+    anime_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> AnimeRead:
+    if has_conditional_headers(request):
+        # Answer revalidations from the timestamp alone, without loading the row.
+        updated_at = await get_anime_updated_at(db, anime_id)
+        if updated_at is not None:
+            etag = make_etag("anime", anime_id, updated_at.isoformat())
+            if is_not_modified(request, etag, updated_at):
+                return not_modified(etag, updated_at)
+
     anime = await get_anime_by_id(db, anime_id)
     if anime is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Anime not found"
         )
+    etag = make_etag("anime", anime.id, anime.updated_at.isoformat())
+    set_cache_headers(response, etag, anime.updated_at)
     return anime
+
+
+@router.get("/{anime_id}/full", response_model=AnimeFull)
+async def get_anime_with_releases(
+    anime_id: UUID, db: AsyncSession = Depends(get_db)
+) -> AnimeFull:
+    return await get_anime_full(db, anime_id)
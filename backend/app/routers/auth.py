@@ -1,35 +1,67 @@
-from fastapi import APIRouter, Depends, status
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..dependencies import get_db
+from ..crud.user import UserIdentity
+from ..dependencies import get_current_principal, get_db
 from ..schemas.auth import (
     LogoutRequest,
+    PasswordChange,
     RefreshTokenRequest,
+    SessionRead,
     TokenResponse,
     UserLogin,
     UserRegister,
 )
+from ..use_cases.auth.change_password import change_password
+from ..use_cases.auth.deactivate_user import deactivate_user
 from ..use_cases.auth.login_user import login_user
 from ..use_cases.auth.logout_user import logout_user
 from ..use_cases.auth.refresh_session import refresh_session
-from ..use_cases.auth.register_user import register_user
+from ..use_cases.auth.register_user import DeviceInfo, register_user
+from ..use_cases.auth.sessions import (
+    list_sessions,
+    revoke_all_sessions,
+    revoke_session,
+)
+from ..use_cases.auth.throttle import auth_throttle
+from ..utils.client_ip import client_ip
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_USER_AGENT_MAX_LENGTH = 255
+
+
+def get_device_info(request: Request) -> DeviceInfo:
+    user_agent = request.headers.get("user-agent")
+    return DeviceInfo(
+        user_agent=user_agent[:_USER_AGENT_MAX_LENGTH] if user_agent else None,
+        ip_address=client_ip(request),
+    )
+
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(
-    payload: UserRegister, db: AsyncSession = Depends(get_db)
+    payload: UserRegister,
+    db: AsyncSession = Depends(get_db),
+    device: DeviceInfo = Depends(get_device_info),
 ) -> TokenResponse:
-    tokens = await register_user(db, payload.email, payload.password)
+    await auth_throttle.check("register", ip=device.ip_address, email=payload.email)
+    tokens = await register_user(db, payload.email, payload.password, device)
     return TokenResponse(
         access_token=tokens.access_token, refresh_token=tokens.refresh_token
     )
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(payload: UserLogin, db: AsyncSession = Depends(get_db)) -> TokenResponse:
-    tokens = await login_user(db, payload.email, payload.password)
+async def login(
+    payload: UserLogin,
+    db: AsyncSession = Depends(get_db),
+    device: DeviceInfo = Depends(get_device_info),
+) -> TokenResponse:
+    await auth_throttle.check("login", ip=device.ip_address, email=payload.email)
+    tokens = await login_user(db, payload.email, payload.password, device)
     return TokenResponse(
         access_token=tokens.access_token, refresh_token=tokens.refresh_token
     )
@@ -37,9 +69,11 @@ async def login(payload: UserLogin, db: AsyncSession = Depends(get_db)) -> Token
 
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
-    payload: RefreshTokenRequest, db: AsyncSession = Depends(get_db)
+    payload: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_db),
+    device: DeviceInfo = Depends(get_device_info),
 ) -> TokenResponse:
-    tokens = await refresh_session(db, payload.refresh_token)
+    tokens = await refresh_session(db, payload.refresh_token, device)
     return TokenResponse(
         access_token=tokens.access_token, refresh_token=tokens.refresh_token
     )
@@ -50,3 +84,51 @@ async def logout(
     payload: LogoutRequest, db: AsyncSession = Depends(get_db)
 ) -> None:
     await logout_user(db, payload.refresh_token)
+
+
+@router.post("/password", response_model=TokenResponse)
+async def update_password(
+    payload: PasswordChange,
+    db: AsyncSession = Depends(get_db),
+    device: DeviceInfo = Depends(get_device_info),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> TokenResponse:
+    tokens = await change_password(
+        db, current_user.id, payload.current_password, payload.new_password, device
+    )
+    return TokenResponse(
+        access_token=tokens.access_token, refresh_token=tokens.refresh_token
+    )
+
+
+@router.post("/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate_account(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> None:
+    await deactivate_user(db, current_user.id)
+
+
+@router.get("/sessions", response_model=list[SessionRead])
+async def get_sessions(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> list[SessionRead]:
+    return await list_sessions(db, current_user.id)
+
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_session(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> None:
+    await revoke_session(db, current_user.id, session_id)
+
+
+@router.delete("/sessions", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_all_sessions(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> None:
+    await revoke_all_sessions(db, current_user.id)
@@ -1,24 +1,39 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..crud.episode import get_episodes_by_release
-from ..crud.release import get_release_by_id
+from ..crud.episode import get_episodes_by_release, get_release_episodes_version
 from ..dependencies import get_db
 from ..schemas.episode import EpisodeListItem
+from ..utils.http_cache import is_not_modified, make_etag, not_modified, set_cache_headers
 
 router = APIRouter(prefix="/episodes", tags=["episodes"])
 
 
 @router.get("/", response_model=list[EpisodeListItem])
 async def list_episodes(
+    request: Request,
+    response: Response,
     release_id: UUID = Query(...),
     db: AsyncSession = Depends(get_db),
 ) -> list[EpisodeListItem]:
-    release = await get_release_by_id(db, release_id)
-    if release is None:
+    # One aggregate query both proves the release exists and versions its
+    # episode list, so a revalidation never loads the episodes themselves.
+    version = await get_release_episodes_version(db, release_id)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Release not found"
         )
+
+    last_modified = max(
+        filter(None, (version.release_updated_at, version.episodes_updated_at))
+    )
+    etag = make_etag(
+        "episodes", release_id, version.episode_count, last_modified.isoformat()
+    )
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    set_cache_headers(response, etag, last_modified)
     return await get_episodes_by_release(db, release_id)
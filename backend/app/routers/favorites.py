@@ -1,37 +1,43 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..dependencies import get_current_user, get_db
-from ..models.user import User
+from ..crud.user import UserIdentity
+from ..dependencies import get_current_principal, get_db
 from ..schemas.favorite import FavoriteCreate, FavoriteRead
 from ..use_cases.favorites import (
     add_favorite as add_favorite_use_case,
     get_favorites as get_favorites_use_case,
     remove_favorite as remove_favorite_use_case,
 )
+from ..utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/favorites", tags=["favorites"])
 
 
 @router.get("/", response_model=list[FavoriteRead])
 async def get_favorites(
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Opaque {NEXT_CURSOR_HEADER} value"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_principal),
 ) -> list[FavoriteRead]:
-    return await get_favorites_use_case(
-        db, user_id=current_user.id, limit=limit, offset=offset
+    page = await get_favorites_use_case(
+        db, user_id=current_user.id, limit=limit, offset=offset, cursor=cursor
     )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 
 @router.post("/", response_model=FavoriteRead, status_code=status.HTTP_201_CREATED)
 async def create_favorite(
     payload: FavoriteCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_principal),
 ) -> FavoriteRead:
     return await add_favorite_use_case(
         db, user_id=current_user.id, anime_id=payload.anime_id
@@ -42,6 +48,6 @@ async def create_favorite(
 async def delete_favorite(
     anime_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_principal),
 ) -> None:
     await remove_favorite_use_case(db, user_id=current_user.id, anime_id=anime_id)
@@ -1,31 +1,63 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..crud.release import get_release_by_id, get_releases
+from ..crud.release import get_release_by_id, get_release_updated_at, get_releases
 from ..dependencies import get_db
 from ..schemas.release import ReleaseListItem, ReleaseRead
+from ..utils.http_cache import (
+    collection_version,
+    has_conditional_headers,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from ..utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/releases", tags=["releases"])
 
 
 @router.get("/", response_model=list[ReleaseListItem])
 async def list_releases(
+    request: Request,
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Opaque {NEXT_CURSOR_HEADER} value"),
     db: AsyncSession = Depends(get_db),
 ) -> list[ReleaseListItem]:
-    return await get_releases(db, limit=limit, offset=offset)
+    page = await get_releases(db, limit=limit, offset=offset, cursor=cursor)
+    etag, last_modified = collection_version("releases", page.items, page.next_cursor)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    set_cache_headers(response, etag, last_modified)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 
 @router.get("/{release_id}", response_model=ReleaseRead)
 async def get_release(
-    release_id: UUID, db: AsyncSession = Depends(get_db)
+    release_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
 ) -> ReleaseRead:
+    if has_conditional_headers(request):
+        updated_at = await get_release_updated_at(db, release_id)
+        if updated_at is not None:
+            etag = make_etag("release", release_id, updated_at.isoformat())
+            if is_not_modified(request, etag, updated_at):
+                return not_modified(etag, updated_at)
+
     release = await get_release_by_id(db, release_id)
     if release is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Release not found"
         )
+    etag = make_etag("release", release.id, release.updated_at.isoformat())
+    set_cache_headers(response, etag, release.updated_at)
     return release
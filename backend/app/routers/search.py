@@ -1,29 +1,54 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..crud.anime import search_anime
+from ..crud.anime import suggest_anime_titles
 from ..dependencies import get_db
-from ..schemas.anime import AnimeListItem
+from ..schemas.anime import AnimeSearchResult, AnimeSuggestion, SearchMode
+from ..use_cases.search import search_anime
+from ..utils.suggest import MAX_SUGGESTIONS, suggestion_index
 
 router = APIRouter(prefix="/search", tags=["search"])
 
 
-@router.get("/anime", response_model=list[AnimeListItem])
+@router.get("/anime", response_model=list[AnimeSearchResult])
 async def search_anime_endpoint(
     q: str | None = Query(None, description="Search query"),
+    mode: SearchMode = Query(
+        "substring",
+        description=(
+            "substring: plain title match; fuzzy: typo-tolerant title match; "
+            "fulltext: weighted search over titles and description"
+        ),
+    ),
+    highlight: bool = Query(
+        False, description="Include highlighted description snippets (fulltext only)"
+    ),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
-) -> list[AnimeListItem]:
+) -> list[AnimeSearchResult]:
     if q is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Query parameter 'q' is required",
         )
-    if len(q) < 2:
+    if len(q.strip()) < 2:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Query parameter 'q' must be at least 2 characters long",
         )
 
-    return await search_anime(db, query=q, limit=limit, offset=offset)
+    return await search_anime(
+        db, query=q, mode=mode, limit=limit, offset=offset, highlight=highlight
+    )
+
+
+@router.get("/suggest", response_model=list[AnimeSuggestion])
+async def suggest_anime_endpoint(
+    q: str = Query(..., min_length=1, description="Title prefix"),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS),
+    db: AsyncSession = Depends(get_db),
+) -> list[AnimeSuggestion]:
+    if suggestion_index.ready:
+        return suggestion_index.suggest(q, limit=limit)
+    return await suggest_anime_titles(db, prefix=q, limit=limit)
@@ -1,19 +1,41 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..dependencies import get_db
+from ..crud.user import UserIdentity
+from ..dependencies import get_current_principal, get_db
+from ..schemas.view import ViewCreate, ViewRead
+from ..use_cases.views import get_view_history, record_view
+from ..utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/views", tags=["views"])
 
 
-@router.get("/")
-async def list_views(db: AsyncSession = Depends(get_db)) -> list[dict]:
-    # TODO: Replace with view history retrieval.
-    return []
+@router.get("/", response_model=list[ViewRead])
+async def list_views(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Opaque {NEXT_CURSOR_HEADER} value"),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> list[ViewRead]:
+    page = await get_view_history(
+        db, user_id=current_user.id, limit=limit, offset=offset, cursor=cursor
+    )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 
-@router.post("/", status_code=201)
-async def create_view(db: AsyncSession = Depends(get_db)) -> dict:
-    # TODO: Persist view record.
-    return {"message": "view recorded"}
-
+@router.post("/", response_model=ViewRead, status_code=status.HTTP_202_ACCEPTED)
+async def create_view(
+    payload: ViewCreate,
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> ViewRead:
+    return record_view(
+        user_id=current_user.id,
+        episode_id=payload.episode_id,
+        position_seconds=payload.position_seconds,
+        progress_percent=payload.progress_percent,
+        device=payload.device,
+    )
@@ -1,10 +1,20 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..dependencies import get_current_user, get_db
-from ..models.user import User
-from ..schemas.watch import WatchProgressRead, WatchProgressUpdate
-from ..use_cases.watch import get_continue_watching, update_progress
+from ..crud.user import UserIdentity
+from ..dependencies import get_current_principal, get_db
+from ..schemas.watch import (
+    ContinueWatchingItem,
+    WatchProgressBatch,
+    WatchProgressBatchResult,
+    WatchProgressRead,
+    WatchProgressUpdate,
+)
+from ..use_cases.watch import (
+    get_continue_watching,
+    sync_progress_batch,
+    update_progress,
+)
 
 router = APIRouter(prefix="/watch", tags=["watch"])
 
@@ -13,7 +23,7 @@ router = APIRouter(prefix="/watch", tags=["watch"])
 async def upsert_progress(
     payload: WatchProgressUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_principal),
 ) -> WatchProgressRead:
     return await update_progress(
         db,
@@ -25,10 +35,19 @@ async def upsert_progress(
     )
 
 
-@router.get("/continue", response_model=list[WatchProgressRead])
+@router.post("/progress/batch", response_model=WatchProgressBatchResult)
+async def upsert_progress_batch(
+    payload: WatchProgressBatch,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> WatchProgressBatchResult:
+    return await sync_progress_batch(db, user_id=current_user.id, items=payload.items)
+
+
+@router.get("/continue", response_model=list[ContinueWatchingItem])
 async def continue_watching(
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[WatchProgressRead]:
+    current_user: UserIdentity = Depends(get_current_principal),
+) -> list[ContinueWatchingItem]:
     return await get_continue_watching(db, user_id=current_user.id, limit=limit)
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response
+
+from ..utils.jwt_keys import jwt_key_ring
+
+router = APIRouter(prefix="/.well-known", tags=["auth"])
+
+_JWKS_MAX_AGE_SECONDS = 300
+
+
+@router.get("/jwks.json")
+async def jwks(response: Response) -> dict[str, list[dict]]:
+    """Public keys for verifying access tokens; empty while HS* signing is used."""
+    response.headers["Cache-Control"] = f"public, max-age={_JWKS_MAX_AGE_SECONDS}"
+    if jwt_key_ring is None:
+        return {"keys": []}
+    return jwt_key_ring.jwks()
@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from .release import ReleaseWithEpisodes
+
 
 class AnimeCreate(BaseModel):
     title: str
@@ -24,6 +27,12 @@ class AnimeRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CachedAnime(AnimeRead):
+    """Cache payload; ``updated_at`` feeds ETags and is dropped from responses."""
+
+    updated_at: datetime
+
+
 class AnimeListItem(BaseModel):
     id: UUID
     title: str
@@ -31,3 +40,26 @@ class AnimeListItem(BaseModel):
     status: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TrendingAnime(AnimeListItem):
+    score: float
+
+
+class AnimeFull(AnimeRead):
+    releases: list[ReleaseWithEpisodes] = []
+
+
+SearchMode = Literal["fuzzy", "substring", "fulltext"]
+TrendingRanking = Literal["trending", "most_watched"]
+
+
+class AnimeSearchResult(AnimeListItem):
+    snippet: str | None = None
+
+
+class AnimeSuggestion(BaseModel):
+    id: UUID
+    title: str
+
+    model_config = ConfigDict(from_attributes=True)
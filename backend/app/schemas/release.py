@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from .episode import EpisodeListItem
+
 
 class ReleaseRead(BaseModel):
     id: UUID
@@ -15,6 +17,12 @@ class ReleaseRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CachedRelease(ReleaseRead):
+    """Cache payload; ``updated_at`` feeds ETags and is dropped from responses."""
+
+    updated_at: datetime
+
+
 class ReleaseListItem(BaseModel):
     id: UUID
     anime_id: UUID
@@ -23,3 +31,7 @@ class ReleaseListItem(BaseModel):
     status: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ReleaseWithEpisodes(ReleaseListItem):
+    episodes: list[EpisodeListItem] = []
@@ -0,0 +1,30 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound of the INTEGER column; larger values would fail the whole COPY.
+MAX_POSITION_SECONDS = 2**31 - 1
+
+
+class ViewCreate(BaseModel):
+    episode_id: UUID
+    position_seconds: int | None = Field(
+        default=None, ge=0, le=MAX_POSITION_SECONDS
+    )
+    progress_percent: float | None = Field(default=None, ge=0, le=100)
+    # PostgreSQL text cannot hold NUL characters.
+    device: str | None = Field(
+        default=None, max_length=128, pattern=r"^[^\x00]*$"
+    )
+
+
+class ViewRead(BaseModel):
+    id: UUID
+    episode_id: UUID
+    position_seconds: int | None
+    progress_percent: float | None
+    device: str | None
+    viewed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from .episode import EpisodeListItem
 
 
 class WatchProgressUpdate(BaseModel):
@@ -21,3 +23,27 @@ class WatchProgressRead(BaseModel):
     last_watched_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ContinueWatchingAnime(BaseModel):
+    id: UUID
+    title: str
+    year: int | None = None
+
+
+class ContinueWatchingItem(WatchProgressRead):
+    anime: ContinueWatchingAnime
+    next_episode: EpisodeListItem | None = None
+
+
+class WatchProgressBatchItem(WatchProgressUpdate):
+    watched_at: datetime
+
+
+class WatchProgressBatch(BaseModel):
+    items: list[WatchProgressBatchItem] = Field(min_length=1)
+
+
+class WatchProgressBatchResult(BaseModel):
+    items: list[WatchProgressRead]
+    missing_anime_ids: list[UUID] = Field(default_factory=list)
@@ -0,0 +1,3 @@
+from .get_anime_full import get_anime_full
+
+__all__ = ["get_anime_full"]
@@ -0,0 +1,40 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...crud.anime import get_anime_by_id
+from ...crud.release import get_release_episode_rows
+from ...errors import NotFoundError
+from ...schemas.anime import AnimeFull
+from ...schemas.episode import EpisodeListItem
+from ...schemas.release import ReleaseWithEpisodes
+
+
+async def get_anime_full(session: AsyncSession, anime_id: uuid.UUID) -> AnimeFull:
+    anime = await get_anime_by_id(session, anime_id)
+    if anime is None:
+        raise NotFoundError("Anime not found")
+
+    releases: dict[uuid.UUID, ReleaseWithEpisodes] = {}
+    for row in await get_release_episode_rows(session, anime_id):
+        release = releases.get(row.id)
+        if release is None:
+            release = releases[row.id] = ReleaseWithEpisodes(
+                id=row.id,
+                anime_id=row.anime_id,
+                title=row.title,
+                year=row.year,
+                status=row.status,
+            )
+        if row.episode_id is not None:
+            release.episodes.append(
+                EpisodeListItem(
+                    id=row.episode_id,
+                    number=row.episode_number,
+                    title=row.episode_title,
+                )
+            )
+
+    full = AnimeFull.model_validate(anime)
+    full.releases = list(releases.values())
+    return full
@@ -0,0 +1,53 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...crud.refresh_token import revoke_user_refresh_tokens
+from ...crud.user import (
+    get_user_password_hash,
+    update_user_credentials,
+    user_identity_cache,
+)
+from ...errors import AppError, AuthError
+from ...utils.security import hash_password_async, verify_and_update_password_async
+from .register_user import AuthTokens, DeviceInfo, issue_tokens
+
+
+async def change_password(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    current_password: str,
+    new_password: str,
+    device: DeviceInfo | None = None,
+) -> AuthTokens:
+    """Replace the password, sign out every session and open a new one.
+
+    The version bump rejects access tokens issued before the change; the
+    caller gets a fresh pair for the device it changed the password from.
+    """
+    try:
+        password_hash = await get_user_password_hash(session, user_id)
+        if password_hash is None:
+            raise AuthError()
+        verified, _ = await verify_and_update_password_async(
+            current_password, password_hash
+        )
+        if not verified:
+            raise AuthError()
+
+        identity = await update_user_credentials(
+            session, user_id, password_hash=await hash_password_async(new_password)
+        )
+        if identity is None:
+            raise AuthError()
+        await revoke_user_refresh_tokens(session, user_id)
+        tokens = await issue_tokens(session, identity, device=device)
+    except AppError:
+        await session.rollback()
+        raise
+    except Exception:
+        await session.rollback()
+        raise
+
+    user_identity_cache.delete(user_id)
+    return tokens
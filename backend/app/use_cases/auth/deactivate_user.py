@@ -0,0 +1,25 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...crud.refresh_token import revoke_user_refresh_tokens
+from ...crud.user import update_user_credentials, user_identity_cache
+from ...errors import AppError, NotFoundError
+
+
+async def deactivate_user(session: AsyncSession, user_id: uuid.UUID) -> None:
+    """Mark the user inactive and revoke every access and refresh token."""
+    try:
+        identity = await update_user_credentials(session, user_id, is_active=False)
+        if identity is None:
+            raise NotFoundError("User not found")
+        await revoke_user_refresh_tokens(session, user_id)
+        await session.commit()
+    except AppError:
+        await session.rollback()
+        raise
+    except Exception:
+        await session.rollback()
+        raise
+
+    user_identity_cache.delete(user_id)
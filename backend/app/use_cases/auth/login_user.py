@@ -1,20 +1,35 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...crud.user import get_user_by_email
+from ...crud.user import UserIdentity, get_user_by_email
 from ...errors import AppError, AuthError
-from ...utils.security import verify_password
-from .register_user import AuthTokens, issue_tokens
+from ...utils.security import verify_and_update_password_async
+from .register_user import AuthTokens, DeviceInfo, issue_tokens
 
 
 async def login_user(
-    session: AsyncSession, email: str, password: str
+    session: AsyncSession,
+    email: str,
+    password: str,
+    device: DeviceInfo | None = None,
 ) -> AuthTokens:
     try:
         user = await get_user_by_email(session, email)
-        if user is None or not verify_password(password, user.password_hash):
+        if user is None:
             raise AuthError()
 
-        return await issue_tokens(session, user.id)
+        verified, new_hash = await verify_and_update_password_async(
+            password, user.password_hash
+        )
+        if not verified:
+            raise AuthError()
+        if new_hash is not None:
+            # Same password, new scheme or cost: issued tokens stay valid.
+            user.password_hash = new_hash
+
+        identity = UserIdentity(
+            id=user.id, is_active=user.is_active, token_version=user.token_version
+        )
+        return await issue_tokens(session, identity, device=device)
     except AppError:
         await session.rollback()
         raise
@@ -14,7 +14,7 @@ async def logout_user(session: AsyncSession, refresh_token: str) -> None:
         if stored_token is None:
             return
 
-        await revoke_refresh_token(session, stored_token.user_id)
+        await revoke_refresh_token(session, stored_token)
         await session.commit()
     except AppError:
         await session.rollback()
@@ -1,27 +1,217 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+from collections import Counter
 from datetime import datetime, timezone
 
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...crud.refresh_token import get_refresh_token_by_hash
+from ...config import settings
+from ...crud.refresh_token import (
+    get_refresh_session_for_rotation,
+    get_refresh_token_by_hash,
+    rotate_refresh_token_if_current,
+)
+from ...crud.user import UserIdentity
 from ...errors import AppError, AuthError, PermissionError
+from ...utils.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from ...utils.metrics import register_metrics
 from ...utils.security import hash_refresh_token
-from .register_user import AuthTokens, issue_tokens
+from .register_user import (
+    AuthTokens,
+    DeviceInfo,
+    build_auth_tokens,
+    issue_tokens,
+    new_refresh_credentials,
+)
 
+logger = logging.getLogger("kitsu.auth.refresh")
 
-async def refresh_session(session: AsyncSession, refresh_token: str) -> AuthTokens:
-    token_hash = hash_refresh_token(refresh_token)
+
+_GRACE_NONCE_BYTES = 12
+# The winner publishes its pair right after COMMIT, which is also when callers
+# blocked on the row get their empty UPDATE back; give it a moment to land.
+_GRACE_LOOKUP_ATTEMPTS = 5
+_GRACE_LOOKUP_DELAY_SECONDS = 0.02
+
+
+def _create_grace_backend() -> CacheBackend:
+    if settings.cache_backend == "redis" and settings.cache_redis_url:
+        return RedisCacheBackend(settings.cache_redis_url, prefix="kitsu:refresh-grace:")
+    return MemoryCacheBackend(maxsize=settings.auth_refresh_grace_cache_size)
+
+
+# Old token hash -> the pair issued when it was rotated, for concurrent callers.
+refresh_grace_cache = _create_grace_backend()
+_refresh_counters: Counter[str] = Counter()
+register_metrics("auth_refresh", lambda: dict(_refresh_counters))
+
+
+def _grace_cipher(refresh_token: str) -> AESGCM:
+    # Keyed by the old token itself, so a cache entry is only readable by a
+    # caller that presents that token; the cache never holds plaintext.
+    key = hmac.new(
+        settings.secret_key.encode(), refresh_token.encode(), hashlib.sha256
+    ).digest()
+    return AESGCM(key)
+
+
+def _seal_grace_pair(refresh_token: str, token_hash: str, tokens: AuthTokens) -> str:
+    nonce = os.urandom(_GRACE_NONCE_BYTES)
+    payload = json.dumps(
+        {"access_token": tokens.access_token, "refresh_token": tokens.refresh_token}
+    ).encode()
+    sealed = _grace_cipher(refresh_token).encrypt(nonce, payload, token_hash.encode())
+    return base64.urlsafe_b64encode(nonce + sealed).decode()
+
+
+def _open_grace_pair(refresh_token: str, token_hash: str, value: str) -> AuthTokens:
+    raw = base64.urlsafe_b64decode(value)
+    nonce, sealed = raw[:_GRACE_NONCE_BYTES], raw[_GRACE_NONCE_BYTES:]
+    payload = _grace_cipher(refresh_token).decrypt(nonce, sealed, token_hash.encode())
+    return AuthTokens(**json.loads(payload))
+
+
+async def _get_grace_pair(refresh_token: str, token_hash: str) -> AuthTokens | None:
+    try:
+        value = await refresh_grace_cache.get(token_hash)
+    except Exception:
+        logger.warning("Refresh grace cache read failed", exc_info=True)
+        return None
+    if value is None:
+        return None
     try:
-        stored_token = await get_refresh_token_by_hash(
-            session, token_hash, for_update=True
+        return _open_grace_pair(refresh_token, token_hash, value)
+    except (InvalidTag, ValueError, TypeError):
+        logger.warning("Refresh grace cache entry could not be decrypted")
+        return None
+
+
+async def _set_grace_pair(
+    refresh_token: str, token_hash: str, tokens: AuthTokens
+) -> None:
+    try:
+        await refresh_grace_cache.set(
+            token_hash,
+            _seal_grace_pair(refresh_token, token_hash, tokens),
+            settings.auth_refresh_grace_seconds,
         )
-        if stored_token is None:
+    except Exception:
+        logger.warning("Refresh grace cache write failed", exc_info=True)
+
+
+async def _find_grace_pair(
+    session: AsyncSession, refresh_token: str, token_hash: str
+) -> AuthTokens | None:
+    """The pair a concurrent refresh issued for ``refresh_token``, if still valid."""
+    for attempt in range(_GRACE_LOOKUP_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(_GRACE_LOOKUP_DELAY_SECONDS)
+        tokens = await _get_grace_pair(refresh_token, token_hash)
+        if tokens is not None:
+            break
+    else:
+        return None
+
+    # Only hand the pair out while the session holding the new token is
+    # committed and still usable.
+    current = await get_refresh_token_by_hash(
+        session, hash_refresh_token(tokens.refresh_token)
+    )
+    if (
+        current is None
+        or current.revoked
+        or current.expires_at <= datetime.now(timezone.utc)
+    ):
+        return None
+    return tokens
+
+
+async def refresh_session(
+    session: AsyncSession, refresh_token: str, device: DeviceInfo | None = None
+) -> AuthTokens:
+    if settings.auth_refresh_mode == "cas":
+        return await _refresh_with_cas(session, refresh_token, device or DeviceInfo())
+
+    token_hash = hash_refresh_token(refresh_token)
+    try:
+        stored_session = await get_refresh_session_for_rotation(session, token_hash)
+        if stored_session is None:
             raise AuthError()
-        if stored_token.revoked:
+        if stored_session.revoked:
             raise PermissionError()
-        if stored_token.expires_at <= datetime.now(timezone.utc):
+        if stored_session.expires_at <= datetime.now(timezone.utc):
+            raise AuthError()
+        if not stored_session.is_active:
             raise AuthError()
 
-        return await issue_tokens(session, stored_token.user_id)
+        user = UserIdentity(
+            id=stored_session.user_id,
+            is_active=stored_session.is_active,
+            token_version=stored_session.token_version,
+        )
+        return await issue_tokens(
+            session, user, device=device, session_id=stored_session.id
+        )
+    except AppError:
+        await session.rollback()
+        raise
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def _refresh_with_cas(
+    session: AsyncSession, refresh_token: str, device: DeviceInfo
+) -> AuthTokens:
+    """Rotate with a conditional UPDATE instead of SELECT ... FOR UPDATE.
+
+    After COMMIT the winner of a concurrent refresh publishes its new pair,
+    encrypted, under the old token hash for ``AUTH_REFRESH_GRACE_SECONDS``;
+    the others find their UPDATE matched nothing and return that same pair
+    instead of failing, as long as the new session is still valid.
+    """
+    token_hash = hash_refresh_token(refresh_token)
+    credentials = new_refresh_credentials()
+    try:
+        rotated = await rotate_refresh_token_if_current(
+            session,
+            token_hash=token_hash,
+            new_token_hash=credentials.token_hash,
+            expires_at=credentials.expires_at,
+            ip_address=device.ip_address,
+        )
+        if rotated is None:
+            await session.rollback()
+            # A row still under the old hash was not rotated by anyone, it was
+            # refused for being revoked, expired or owned by an inactive user.
+            stored_token = await get_refresh_token_by_hash(session, token_hash)
+            if stored_token is None:
+                tokens = await _find_grace_pair(session, refresh_token, token_hash)
+                if tokens is not None:
+                    _refresh_counters["grace_hits"] += 1
+                    return tokens
+            _refresh_counters["rejected"] += 1
+            if stored_token is not None and stored_token.revoked:
+                raise PermissionError()
+            raise AuthError()
+
+        user = UserIdentity(
+            id=rotated.user_id,
+            is_active=rotated.is_active,
+            token_version=rotated.token_version,
+        )
+        tokens = build_auth_tokens(user, credentials.token)
+        await session.commit()
+        await _set_grace_pair(refresh_token, token_hash, tokens)
+        _refresh_counters["rotated"] += 1
+        return tokens
     except AppError:
         await session.rollback()
         raise
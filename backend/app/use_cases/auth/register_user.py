@@ -1,18 +1,17 @@
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...config import settings
-from ...crud.refresh_token import create_or_rotate_refresh_token
-from ...crud.user import get_user_by_email
+from ...crud.refresh_token import upsert_refresh_token_session
+from ...crud.user import UserIdentity, create_user_with_refresh_token
 from ...errors import AppError, ValidationError
-from ...models.user import User
 from ...utils.security import (
     create_access_token,
     create_refresh_token,
-    hash_password,
+    hash_password_async,
     hash_refresh_token,
 )
 
@@ -23,28 +22,84 @@ class AuthTokens:
     refresh_token: str
 
 
-async def issue_tokens(session: AsyncSession, user_id: uuid.UUID) -> AuthTokens:
-    access_token = create_access_token({"sub": str(user_id)})
-    refresh_token = create_refresh_token()
-    token_hash = hash_refresh_token(refresh_token)
-    expires_at = datetime.now(timezone.utc) + timedelta(
-        days=settings.refresh_token_expire_days
+@dataclass
+class DeviceInfo:
+    user_agent: str | None = None
+    ip_address: str | None = None
+
+
+@dataclass
+class RefreshCredentials:
+    token: str
+    token_hash: str
+    expires_at: datetime
+
+
+def new_refresh_credentials() -> RefreshCredentials:
+    token = create_refresh_token()
+    return RefreshCredentials(
+        token=token,
+        token_hash=hash_refresh_token(token),
+        expires_at=datetime.now(timezone.utc)
+        + timedelta(days=settings.refresh_token_expire_days),
+    )
+
+
+def build_auth_tokens(user: UserIdentity, refresh_token: str) -> AuthTokens:
+    access_token = create_access_token(
+        {"sub": str(user.id), "act": user.is_active, "ver": user.token_version}
     )
-    await create_or_rotate_refresh_token(session, user_id, token_hash, expires_at)
-    await session.commit()
     return AuthTokens(access_token=access_token, refresh_token=refresh_token)
 
 
-async def register_user(session: AsyncSession, email: str, password: str) -> AuthTokens:
+async def issue_tokens(
+    session: AsyncSession,
+    user: UserIdentity,
+    *,
+    device: DeviceInfo | None = None,
+    session_id: uuid.UUID | None = None,
+) -> AuthTokens:
+    """Open a new device session, or rotate ``session_id`` in place, and commit."""
+    device = device or DeviceInfo()
+    credentials = new_refresh_credentials()
+    await upsert_refresh_token_session(
+        session,
+        session_id=session_id or uuid.uuid4(),
+        user_id=user.id,
+        token_hash=credentials.token_hash,
+        expires_at=credentials.expires_at,
+        user_agent=device.user_agent,
+        ip_address=device.ip_address,
+    )
+    await session.commit()
+    return build_auth_tokens(user, credentials.token)
+
+
+async def register_user(
+    session: AsyncSession,
+    email: str,
+    password: str,
+    device: DeviceInfo | None = None,
+) -> AuthTokens:
+    device = device or DeviceInfo()
     try:
-        existing_user = await get_user_by_email(session, email)
-        if existing_user:
+        password_hash = await hash_password_async(password)
+        credentials = new_refresh_credentials()
+        user = await create_user_with_refresh_token(
+            session,
+            email=email,
+            password_hash=password_hash,
+            session_id=uuid.uuid4(),
+            token_hash=credentials.token_hash,
+            expires_at=credentials.expires_at,
+            user_agent=device.user_agent,
+            ip_address=device.ip_address,
+        )
+        if user is None:
             raise ValidationError("Email already registered")
 
-        user = User(email=email, password_hash=hash_password(password))
-        session.add(user)
-        await session.flush()
-        return await issue_tokens(session, user.id)
+        await session.commit()
+        return build_auth_tokens(user, credentials.token)
     except AppError:
         await session.rollback()
         raise
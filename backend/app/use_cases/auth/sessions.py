@@ -0,0 +1,46 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...crud.refresh_token import (
+    get_user_refresh_token,
+    list_active_refresh_tokens,
+    revoke_refresh_token,
+    revoke_user_refresh_tokens,
+)
+from ...errors import AppError, NotFoundError
+from ...models.refresh_token import RefreshToken
+
+
+async def list_sessions(
+    session: AsyncSession, user_id: uuid.UUID
+) -> list[RefreshToken]:
+    return await list_active_refresh_tokens(session, user_id)
+
+
+async def revoke_session(
+    session: AsyncSession, user_id: uuid.UUID, session_id: uuid.UUID
+) -> None:
+    try:
+        stored_token = await get_user_refresh_token(session, user_id, session_id)
+        if stored_token is None:
+            raise NotFoundError("Session not found")
+
+        await revoke_refresh_token(session, stored_token)
+        await session.commit()
+    except AppError:
+        await session.rollback()
+        raise
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def revoke_all_sessions(session: AsyncSession, user_id: uuid.UUID) -> int:
+    try:
+        revoked = await revoke_user_refresh_tokens(session, user_id)
+        await session.commit()
+        return revoked
+    except Exception:
+        await session.rollback()
+        raise
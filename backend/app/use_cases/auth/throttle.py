@@ -0,0 +1,32 @@
+from ...config import settings
+from ...utils.metrics import register_metrics
+from ...utils.rate_limit import (
+    AuthThrottle,
+    BucketRule,
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+)
+
+
+def _create_backend() -> RateLimitBackend:
+    if settings.auth_rate_limit_backend == "redis" and settings.auth_rate_limit_redis_url:
+        return RedisRateLimitBackend(settings.auth_rate_limit_redis_url)
+    return MemoryRateLimitBackend()
+
+
+auth_throttle = AuthThrottle(
+    _create_backend(),
+    ip_rule=BucketRule(
+        name="ip",
+        capacity=settings.auth_rate_limit_ip_burst,
+        per_minute=settings.auth_rate_limit_ip_per_minute,
+    ),
+    email_rule=BucketRule(
+        name="email",
+        capacity=settings.auth_rate_limit_email_burst,
+        per_minute=settings.auth_rate_limit_email_per_minute,
+    ),
+    enabled=settings.auth_rate_limit_enabled,
+)
+register_metrics("auth_throttle", auth_throttle.stats)
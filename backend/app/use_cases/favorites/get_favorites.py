@@ -4,9 +4,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...crud.favorite import list_favorites
 from ...models.favorite import Favorite
+from ...utils.pagination import Page
 
 
 async def get_favorites(
-    session: AsyncSession, user_id: uuid.UUID, limit: int, offset: int
-) -> list[Favorite]:
-    return await list_favorites(session, user_id=user_id, limit=limit, offset=offset)
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[Favorite]:
+    return await list_favorites(
+        session, user_id=user_id, limit=limit, offset=offset, cursor=cursor
+    )
@@ -0,0 +1,3 @@
+from .search_anime import search_anime
+
+__all__ = ["search_anime"]
@@ -0,0 +1,69 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import settings
+from ...crud.anime import (
+    search_anime as crud_search_anime,
+    search_anime_fulltext,
+    search_anime_fuzzy,
+)
+from ...models.anime import Anime
+from ...schemas.anime import AnimeSearchResult, SearchMode
+from ...utils.cache import TTLCache
+from ...utils.metrics import register_metrics
+from ...utils.model_events import on_commit
+from ...utils.search_index import anime_search_index
+
+SearchCacheKey = tuple[str, SearchMode, int, int, bool]
+
+search_cache: TTLCache[SearchCacheKey, list[AnimeSearchResult]] = TTLCache(
+    maxsize=settings.search_cache_size,
+    ttl_seconds=settings.search_cache_ttl_seconds,
+)
+register_metrics("search_cache", search_cache.stats)
+on_commit(Anime, lambda changes: search_cache.clear())
+
+
+async def _run_search(
+    session: AsyncSession,
+    query: str,
+    mode: SearchMode,
+    limit: int,
+    offset: int,
+    highlight: bool,
+):
+    if mode == "fulltext":
+        return await search_anime_fulltext(
+            session, query=query, limit=limit, offset=offset, highlight=highlight
+        )
+
+    if settings.search_index_enabled and anime_search_index.ready:
+        return anime_search_index.search(query, mode=mode, limit=limit, offset=offset)
+
+    if mode == "substring":
+        return await crud_search_anime(session, query=query, limit=limit, offset=offset)
+    return await search_anime_fuzzy(session, query=query, limit=limit, offset=offset)
+
+
+async def search_anime(
+    session: AsyncSession,
+    query: str,
+    mode: SearchMode,
+    limit: int,
+    offset: int,
+    highlight: bool = False,
+) -> list[AnimeSearchResult]:
+    # The key is exactly what the backend runs: folding case, spacing or NFKC
+    # forms would merge queries that ILIKE and the trigram operators treat
+    # differently, and the answer would depend on which was cached first.
+    query = query.strip()
+    highlight = highlight and mode == "fulltext"
+    cache_key = (query, mode, limit, offset, highlight)
+
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    rows = await _run_search(session, query, mode, limit, offset, highlight)
+    results = [AnimeSearchResult.model_validate(row) for row in rows]
+    search_cache.set(cache_key, results)
+    return results
@@ -0,0 +1,4 @@
+from .get_view_history import get_view_history
+from .record_view import record_view
+
+__all__ = ["get_view_history", "record_view"]
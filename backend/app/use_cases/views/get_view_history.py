@@ -0,0 +1,19 @@
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...crud.view import list_user_views
+from ...utils.pagination import Page
+
+
+async def get_view_history(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[Any]:
+    return await list_user_views(
+        session, user_id=user_id, limit=limit, offset=offset, cursor=cursor
+    )
@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime, timezone
+
+from ...errors import ServiceUnavailableError, ValidationError
+from ...schemas.view import MAX_POSITION_SECONDS
+from .view_log import ViewRecord, view_log_writer
+
+
+def record_view(
+    user_id: uuid.UUID,
+    episode_id: uuid.UUID,
+    position_seconds: int | None = None,
+    progress_percent: float | None = None,
+    device: str | None = None,
+) -> ViewRecord:
+    """Queue a view for the bulk writer; it reaches the log on the next flush."""
+    if progress_percent is not None and not (0 <= progress_percent <= 100):
+        raise ValidationError("Progress percent must be between 0 and 100")
+    if position_seconds is not None and not (
+        0 <= position_seconds <= MAX_POSITION_SECONDS
+    ):
+        raise ValidationError(
+            f"Position in seconds must be between 0 and {MAX_POSITION_SECONDS}"
+        )
+    if device is not None and "\x00" in device:
+        raise ValidationError("Device must not contain NUL characters")
+
+    record = ViewRecord(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        episode_id=episode_id,
+        position_seconds=position_seconds,
+        progress_percent=progress_percent,
+        device=device,
+        viewed_at=datetime.now(timezone.utc),
+    )
+    if not view_log_writer.append(record):
+        raise ServiceUnavailableError("View log is busy, try again later")
+    return record
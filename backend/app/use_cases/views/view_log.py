@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import uuid
+from collections import deque
+from dataclasses import astuple, dataclass
+from datetime import date, datetime
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ...config import settings
+from ...crud.view import (
+    create_view_partition,
+    insert_views,
+    list_view_partitions,
+    view_month,
+)
+from ...utils.advisory_lock import VIEW_PARTITION_MAINTENANCE_LOCK, advisory_xact_lock
+from ...utils.db_errors import is_data_error
+from ...utils.metrics import register_metrics
+
+logger = logging.getLogger("kitsu.view_log")
+
+
+@dataclass(frozen=True, slots=True)
+class ViewRecord:
+    """One view event; field order matches ``crud.view.VIEW_COLUMNS``."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    episode_id: uuid.UUID
+    position_seconds: int | None
+    progress_percent: float | None
+    device: str | None
+    viewed_at: datetime
+
+
+class ViewLogWriter:
+    """Buffers view events in memory and appends them to the log in bulk.
+
+    Requests only enqueue; a background task drains the queue every
+    ``flush_seconds`` or as soon as a full batch is waiting, writing up to
+    ``batch_size`` rows per COPY. A batch the database rejects for its data is
+    split in halves until the offending rows are isolated; those are dropped
+    and counted, the rest is written. Any other failure puts the unwritten
+    rows back at the front of the queue. A missing monthly partition is
+    created before the COPY. When ``max_pending`` rows are queued new events
+    are refused rather than growing memory without bound.
+    """
+
+    def __init__(self, max_pending: int, batch_size: int) -> None:
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self._pending: deque[ViewRecord] = deque()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._accepted = 0
+        self._rejected = 0
+        self._written = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._flush_errors = 0
+        self._last_flush_seconds = 0.0
+        self._partitions: set[date] | None = None
+
+    def append(self, record: ViewRecord) -> bool:
+        if len(self._pending) >= self.max_pending:
+            self._rejected += 1
+            self._flush_requested.set()
+            return False
+        self._pending.append(record)
+        self._accepted += 1
+        if len(self._pending) >= self.batch_size:
+            self._flush_requested.set()
+        return True
+
+    async def flush(self, engine: AsyncEngine) -> int:
+        async with self._flush_lock:
+            started_at = perf_counter()
+            written_before = self._written
+            while self._pending:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self.batch_size, len(self._pending)))
+                ]
+                await self._write_batch(engine, batch)
+                # Yield between batches so request handlers are not starved.
+                await asyncio.sleep(0)
+            self._flushes += 1
+            self._last_flush_seconds = perf_counter() - started_at
+            return self._written - written_before
+
+    async def _write_batch(self, engine: AsyncEngine, batch: list[ViewRecord]) -> None:
+        chunks = [batch]
+        while chunks:
+            chunk = chunks.pop()
+            try:
+                await self._insert(engine, chunk)
+            except Exception as exc:
+                if not is_data_error(exc):
+                    self._requeue(chunk, chunks)
+                    raise
+                if len(chunk) == 1:
+                    self._dropped += 1
+                    logger.warning(
+                        "Dropping view %s rejected by the database: %s",
+                        chunk[0].id,
+                        exc,
+                    )
+                    continue
+                middle = len(chunk) // 2
+                # The first half is popped next, so rows keep their order.
+                chunks.extend((chunk[middle:], chunk[:middle]))
+            except BaseException:
+                self._requeue(chunk, chunks)
+                raise
+
+    def _requeue(self, chunk: list[ViewRecord], chunks: list[list[ViewRecord]]) -> None:
+        unwritten = [*chunk, *(record for rest in reversed(chunks) for record in rest)]
+        self._pending.extendleft(reversed(unwritten))
+
+    async def _insert(self, engine: AsyncEngine, records: list[ViewRecord]) -> None:
+        async with engine.connect() as connection:
+            await self._ensure_partitions(connection, records)
+            await insert_views(connection, [astuple(record) for record in records])
+            await connection.commit()
+        self._written += len(records)
+
+    async def _ensure_partitions(
+        self, connection: AsyncConnection, records: list[ViewRecord]
+    ) -> None:
+        months = {view_month(record.viewed_at) for record in records}
+        if self._partitions is None or not months <= self._partitions:
+            self._partitions = set(await list_view_partitions(connection))
+        for month in sorted(months - self._partitions):
+            # Serialised with partition maintenance, which holds the same key.
+            await advisory_xact_lock(connection, VIEW_PARTITION_MAINTENANCE_LOCK)
+            await create_view_partition(connection, month)
+            await connection.commit()
+            self._partitions.add(month)
+            logger.info("Created view partition for %s", month.isoformat())
+
+    async def wait_for_flush(self, timeout: float) -> None:
+        """Sleep until the flush interval passes or a full batch is queued."""
+        try:
+            await asyncio.wait_for(self._flush_requested.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._flush_requested.clear()
+
+    def record_error(self) -> None:
+        self._flush_errors += 1
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+            "accepted": self._accepted,
+            "rejected": self._rejected,
+            "written": self._written,
+            "dropped": self._dropped,
+            "flushes": self._flushes,
+            "flush_errors": self._flush_errors,
+            "last_flush_seconds": self._last_flush_seconds,
+        }
+
+
+async def run_view_log_writer(
+    writer: ViewLogWriter, engine: AsyncEngine, interval_seconds: int
+) -> None:
+    while True:
+        await writer.wait_for_flush(interval_seconds)
+        try:
+            await writer.flush(engine)
+        except Exception:
+            # COPY runs on the driver connection, so its errors are the
+            # driver's own rather than SQLAlchemy's.
+            writer.record_error()
+            logger.exception("View log flush failed; events stay queued")
+
+
+view_log_writer = ViewLogWriter(
+    max_pending=settings.view_log_buffer_size,
+    batch_size=settings.view_log_batch_size,
+)
+register_metrics("view_log", view_log_writer.stats)
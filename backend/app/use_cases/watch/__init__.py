@@ -1,4 +1,5 @@
 from .get_continue_watching import get_continue_watching
+from .sync_progress_batch import sync_progress_batch
 from .update_progress import update_progress
 
-__all__ = ["get_continue_watching", "update_progress"]
+__all__ = ["get_continue_watching", "sync_progress_batch", "update_progress"]
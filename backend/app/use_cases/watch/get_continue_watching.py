@@ -2,11 +2,39 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...crud.watch_progress import list_watch_progress
-from ...models.watch_progress import WatchProgress
+from ...config import settings
+from ...crud.watch_progress import describe_watch_progress, list_continue_watching
+from ...schemas.watch import ContinueWatchingItem
+from .progress_buffer import BufferedWatchProgress, watch_progress_buffer
 
 
 async def get_continue_watching(
     session: AsyncSession, user_id: uuid.UUID, limit: int
-) -> list[WatchProgress]:
-    return await list_watch_progress(session, user_id=user_id, limit=limit)
+) -> list[ContinueWatchingItem]:
+    stored = await list_continue_watching(session, user_id=user_id, limit=limit)
+    if not settings.watch_progress_write_behind:
+        return stored
+
+    # Overlay buffered entries so a pending flush never shows older progress.
+    merged: dict[uuid.UUID, ContinueWatchingItem | BufferedWatchProgress] = {
+        item.anime_id: item for item in stored
+    }
+    for buffered in watch_progress_buffer.for_user(user_id):
+        current = merged.get(buffered.anime_id)
+        # Batch syncs write straight to the table and may be newer.
+        if current is None or buffered.last_watched_at >= current.last_watched_at:
+            merged[buffered.anime_id] = buffered
+    items = sorted(merged.values(), key=lambda item: item.last_watched_at, reverse=True)
+    items = items[:limit]
+
+    pending = [item for item in items if isinstance(item, BufferedWatchProgress)]
+    if not pending:
+        return items
+    described = {
+        item.anime_id: item for item in await describe_watch_progress(session, pending)
+    }
+    return [
+        described[item.anime_id] if isinstance(item, BufferedWatchProgress) else item
+        for item in items
+        if not isinstance(item, BufferedWatchProgress) or item.anime_id in described
+    ]
@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ...config import settings
+from ...crud.watch_progress import upsert_watch_progress_many
+from ...utils.metrics import register_metrics
+
+logger = logging.getLogger("kitsu.watch_buffer")
+
+_FLUSH_BATCH_SIZE = 500
+
+ProgressKey = tuple[uuid.UUID, uuid.UUID]
+
+
+@dataclass(slots=True)
+class BufferedWatchProgress:
+    """Latest known progress for one (user, anime); readable as WatchProgressRead."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    anime_id: uuid.UUID
+    episode: int
+    position_seconds: int | None
+    progress_percent: float | None
+    created_at: datetime
+    last_watched_at: datetime
+    version: int = field(default=0)
+    flushed_version: int = field(default=0)
+
+    @property
+    def dirty(self) -> bool:
+        return self.version != self.flushed_version
+
+    def as_row(self) -> dict:
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "anime_id": self.anime_id,
+            "episode": self.episode,
+            "position_seconds": self.position_seconds,
+            "progress_percent": self.progress_percent,
+            "last_watched_at": self.last_watched_at,
+        }
+
+
+class WatchProgressBuffer:
+    """Write-behind store that coalesces heartbeats per (user, anime).
+
+    Updates only touch memory; a background task periodically writes dirty
+    entries back in bulk upserts. Flushed entries stay resident as
+    a read cache until ``max_entries`` forces the least recent clean ones out.
+    Dirty entries are never evicted: going over the limit triggers an early
+    flush instead. Clean keys are also kept in their own LRU order, so
+    eviction never walks past dirty entries on the heartbeat path.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[ProgressKey, BufferedWatchProgress] = OrderedDict()
+        self._by_user: dict[uuid.UUID, set[uuid.UUID]] = {}
+        self._clean: OrderedDict[ProgressKey, None] = OrderedDict()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flushes = 0
+        self._flushed_rows = 0
+        self._flush_errors = 0
+        self._dropped_rows = 0
+        self._last_flush_seconds = 0.0
+
+    def get(self, user_id: uuid.UUID, anime_id: uuid.UUID) -> BufferedWatchProgress | None:
+        key = (user_id, anime_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if key in self._clean:
+                self._clean.move_to_end(key)
+        return entry
+
+    def for_user(self, user_id: uuid.UUID) -> list[BufferedWatchProgress]:
+        return [
+            self._entries[(user_id, anime_id)]
+            for anime_id in self._by_user.get(user_id, ())
+        ]
+
+    def record(
+        self,
+        *,
+        user_id: uuid.UUID,
+        anime_id: uuid.UUID,
+        episode: int,
+        position_seconds: int | None,
+        progress_percent: float | None,
+        existing_id: uuid.UUID | None = None,
+        existing_created_at: datetime | None = None,
+    ) -> BufferedWatchProgress:
+        now = datetime.now(timezone.utc)
+        key = (user_id, anime_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = BufferedWatchProgress(
+                id=existing_id or uuid.uuid4(),
+                user_id=user_id,
+                anime_id=anime_id,
+                episode=episode,
+                position_seconds=position_seconds,
+                progress_percent=progress_percent,
+                created_at=existing_created_at or now,
+                last_watched_at=now,
+            )
+            self._entries[key] = entry
+            self._by_user.setdefault(user_id, set()).add(anime_id)
+        else:
+            entry.episode = episode
+            entry.position_seconds = position_seconds
+            entry.progress_percent = progress_percent
+            entry.last_watched_at = max(now, entry.last_watched_at)
+            self._entries.move_to_end(key)
+        entry.version += 1
+        self._clean.pop(key, None)
+        self._evict_clean()
+        return entry
+
+    def _evict_clean(self) -> None:
+        while len(self._entries) > self.max_entries and self._clean:
+            key, _ = self._clean.popitem(last=False)
+            self._forget(key)
+        if len(self._entries) > self.max_entries:
+            self._flush_requested.set()
+
+    def _mark_flushed(self, entry: BufferedWatchProgress, version: int) -> None:
+        entry.flushed_version = max(entry.flushed_version, version)
+        key = (entry.user_id, entry.anime_id)
+        if not entry.dirty and self._entries.get(key) is entry:
+            self._clean[key] = None
+
+    def _forget(self, key: ProgressKey) -> None:
+        del self._entries[key]
+        self._clean.pop(key, None)
+        user_id, anime_id = key
+        anime_ids = self._by_user.get(user_id)
+        if anime_ids is not None:
+            anime_ids.discard(anime_id)
+            if not anime_ids:
+                del self._by_user[user_id]
+
+    async def flush(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        async with self._flush_lock:
+            started_at = perf_counter()
+            pending = [
+                (entry, entry.version) for entry in self._entries.values() if entry.dirty
+            ]
+            flushed = 0
+            for start in range(0, len(pending), _FLUSH_BATCH_SIZE):
+                batch = pending[start : start + _FLUSH_BATCH_SIZE]
+                flushed += await self._write_batch(session_factory, batch)
+            self._flushes += 1
+            self._flushed_rows += flushed
+            self._last_flush_seconds = perf_counter() - started_at
+            return flushed
+
+    async def _write_batch(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch: list[tuple[BufferedWatchProgress, int]],
+    ) -> int:
+        try:
+            async with session_factory() as session:
+                await upsert_watch_progress_many(
+                    session, [entry.as_row() for entry, _ in batch]
+                )
+                await session.commit()
+        except IntegrityError:
+            # An anime or user deleted since the heartbeat poisons the whole
+            # statement; retry row by row and drop only the offending rows.
+            logger.warning("Bulk progress flush conflicted; retrying row by row")
+            return await self._write_rows(session_factory, batch)
+
+        for entry, version in batch:
+            self._mark_flushed(entry, version)
+        return len(batch)
+
+    async def _write_rows(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch: list[tuple[BufferedWatchProgress, int]],
+    ) -> int:
+        written = 0
+        for entry, version in batch:
+            try:
+                async with session_factory() as session:
+                    await upsert_watch_progress_many(session, [entry.as_row()])
+                    await session.commit()
+            except IntegrityError:
+                self._dropped_rows += 1
+                key = (entry.user_id, entry.anime_id)
+                if self._entries.get(key) is entry:
+                    self._forget(key)
+                continue
+            self._mark_flushed(entry, version)
+            written += 1
+        return written
+
+    async def wait_for_flush(self, timeout: float) -> None:
+        """Sleep until the flush interval passes or the buffer overflows."""
+        try:
+            await asyncio.wait_for(self._flush_requested.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._flush_requested.clear()
+
+    def record_error(self) -> None:
+        self._flush_errors += 1
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "entries": len(self._entries),
+            "dirty": len(self._entries) - len(self._clean),
+            "max_entries": self.max_entries,
+            "flushes": self._flushes,
+            "flushed_rows": self._flushed_rows,
+            "dropped_rows": self._dropped_rows,
+            "flush_errors": self._flush_errors,
+            "last_flush_seconds": self._last_flush_seconds,
+        }
+
+
+async def run_watch_progress_flusher(
+    buffer: WatchProgressBuffer,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: int,
+) -> None:
+    while True:
+        await buffer.wait_for_flush(interval_seconds)
+        try:
+            await buffer.flush(session_factory)
+        except Exception:
+            # Connection failures surface as driver or OS errors, not only
+            # SQLAlchemy's; the loop must survive them to keep draining.
+            buffer.record_error()
+            logger.exception("Watch progress flush failed; entries stay dirty")
+
+
+watch_progress_buffer = WatchProgressBuffer(
+    max_entries=settings.watch_progress_buffer_size
+)
+register_metrics("watch_progress_buffer", watch_progress_buffer.stats)
@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import settings
+from ...crud.anime import get_existing_anime_ids
+from ...crud.watch_progress import (
+    USER_FOREIGN_KEY,
+    list_watch_progress_for_anime,
+    upsert_watch_progress_many,
+)
+from ...errors import AppError, NotFoundError, ValidationError
+from ...schemas.watch import (
+    WatchProgressBatchItem,
+    WatchProgressBatchResult,
+    WatchProgressRead,
+)
+from ...utils.db_errors import foreign_key_violation
+from .update_progress import validate_progress
+
+
+def _client_time(value: datetime, now: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    # A client clock running ahead must not pin its progress above later updates.
+    return min(value, now)
+
+
+async def sync_progress_batch(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    items: list[WatchProgressBatchItem],
+) -> WatchProgressBatchResult:
+    """Apply queued progress entries in one upsert and return the stored rows.
+
+    Entries are ordered by their client ``watched_at``; the latest one per anime
+    wins inside the batch, and a stored row is only overwritten by a newer one.
+    Entries for anime that no longer exist are skipped and reported, so one
+    stale entry from an offline client does not block the rest.
+    """
+    try:
+        if len(items) > settings.watch_progress_batch_max_items:
+            raise ValidationError(
+                "At most "
+                f"{settings.watch_progress_batch_max_items} entries per batch"
+            )
+        for index, item in enumerate(items):
+            try:
+                validate_progress(
+                    item.episode, item.position_seconds, item.progress_percent
+                )
+            except ValidationError as exc:
+                raise ValidationError(f"items[{index}]: {exc.message}") from None
+
+        now = datetime.now(timezone.utc)
+        latest: dict[uuid.UUID, dict] = {}
+        ordered = sorted(items, key=lambda item: _client_time(item.watched_at, now))
+        for item in ordered:
+            latest[item.anime_id] = {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "anime_id": item.anime_id,
+                "episode": item.episode,
+                "position_seconds": item.position_seconds,
+                "progress_percent": item.progress_percent,
+                "last_watched_at": _client_time(item.watched_at, now),
+            }
+
+        existing = await get_existing_anime_ids(session, list(latest))
+        missing = [anime_id for anime_id in latest if anime_id not in existing]
+        rows = [row for anime_id, row in latest.items() if anime_id in existing]
+
+        if rows:
+            try:
+                await upsert_watch_progress_many(session, rows)
+            except IntegrityError as exc:
+                # Only an anime deleted after the existence check gets here.
+                if foreign_key_violation(exc) in (None, USER_FOREIGN_KEY):
+                    raise
+                raise NotFoundError("Anime not found") from None
+
+        progress = await list_watch_progress_for_anime(
+            session, user_id, [row["anime_id"] for row in rows]
+        )
+        await session.commit()
+        return WatchProgressBatchResult(
+            items=[WatchProgressRead.model_validate(row) for row in progress],
+            missing_anime_ids=missing,
+        )
+    except AppError:
+        await session.rollback()
+        raise
+    except Exception:
+        await session.rollback()
+        raise
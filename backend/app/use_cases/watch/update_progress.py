@@ -1,15 +1,34 @@
 import uuid
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import settings
 from ...crud.anime import get_anime_by_id
 from ...crud.watch_progress import (
-    create_watch_progress,
+    USER_FOREIGN_KEY,
     get_watch_progress,
-    update_watch_progress as crud_update_watch_progress,
+    upsert_watch_progress,
 )
 from ...errors import AppError, NotFoundError, ValidationError
 from ...models.watch_progress import WatchProgress
+from ...utils.db_errors import foreign_key_violation
+from .progress_buffer import BufferedWatchProgress, watch_progress_buffer
+
+
+def validate_progress(
+    episode: int, position_seconds: int | None, progress_percent: float | None
+) -> None:
+    if episode <= 0:
+        raise ValidationError("Episode number must be positive")
+    if position_seconds is None and progress_percent is None:
+        raise ValidationError(
+            "Either position_seconds or progress_percent must be provided"
+        )
+    if progress_percent is not None and not (0 <= progress_percent <= 100):
+        raise ValidationError("Progress percent must be between 0 and 100")
+    if position_seconds is not None and position_seconds < 0:
+        raise ValidationError("Position in seconds must be non-negative")
 
 
 async def update_progress(
@@ -19,35 +38,30 @@ async def update_progress(
     episode: int,
     position_seconds: int | None = None,
     progress_percent: float | None = None,
-) -> WatchProgress:
+) -> WatchProgress | BufferedWatchProgress:
     try:
-        if episode <= 0:
-            raise ValidationError("Episode number must be positive")
-        if position_seconds is None and progress_percent is None:
-            raise ValidationError(
-                "Either position_seconds or progress_percent must be provided"
-            )
-        if progress_percent is not None and not (0 <= progress_percent <= 100):
-            raise ValidationError("Progress percent must be between 0 and 100")
-        if position_seconds is not None and position_seconds < 0:
-            raise ValidationError("Position in seconds must be non-negative")
-
-        anime = await get_anime_by_id(session, anime_id)
-        if anime is None:
-            raise NotFoundError("Anime not found")
-
-        progress = await get_watch_progress(session, user_id, anime_id)
-        if progress:
-            progress = await crud_update_watch_progress(
-                session, progress, episode, position_seconds, progress_percent
+        validate_progress(episode, position_seconds, progress_percent)
+
+        if settings.watch_progress_write_behind:
+            # Buffered rows are only written later, so check the anime up front.
+            anime = await get_anime_by_id(session, anime_id)
+            if anime is None:
+                raise NotFoundError("Anime not found")
+            return await _buffer_progress(
+                session, user_id, anime_id, episode, position_seconds, progress_percent
             )
-        else:
-            progress = await create_watch_progress(
+
+        # The anime foreign key replaces a separate existence check.
+        try:
+            progress = await upsert_watch_progress(
                 session, user_id, anime_id, episode, position_seconds, progress_percent
             )
+        except IntegrityError as exc:
+            if foreign_key_violation(exc) in (None, USER_FOREIGN_KEY):
+                raise
+            raise NotFoundError("Anime not found") from None
 
         await session.commit()
-        await session.refresh(progress)
         return progress
     except AppError:
         await session.rollback()
@@ -55,3 +69,30 @@ async def update_progress(
     except Exception:
         await session.rollback()
         raise
+
+
+async def _buffer_progress(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    anime_id: uuid.UUID,
+    episode: int,
+    position_seconds: int | None,
+    progress_percent: float | None,
+) -> BufferedWatchProgress:
+    """Acknowledge from memory; the row is written by the next bulk flush."""
+    existing_id = existing_created_at = None
+    if watch_progress_buffer.get(user_id, anime_id) is None:
+        # First heartbeat for this pair: keep the stored row's identity.
+        stored = await get_watch_progress(session, user_id, anime_id)
+        if stored is not None:
+            existing_id, existing_created_at = stored.id, stored.created_at
+
+    return watch_progress_buffer.record(
+        user_id=user_id,
+        anime_id=anime_id,
+        episode=episode,
+        position_seconds=position_seconds,
+        progress_percent=progress_percent,
+        existing_id=existing_id,
+        existing_created_at=existing_created_at,
+    )
@@ -0,0 +1,67 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger("kitsu.advisory_lock")
+
+# Fixed pg_advisory_lock keys; each background job gets its own.
+REFRESH_TOKEN_SWEEPER_LOCK = 0x4B495453_0001
+VIEW_PARTITION_MAINTENANCE_LOCK = 0x4B495453_0002
+POPULARITY_ROLLUP_LOCK = 0x4B495453_0003
+
+
+@asynccontextmanager
+async def try_advisory_lock(
+    connection: AsyncConnection, key: int
+) -> AsyncIterator[bool]:
+    """Hold a session-level advisory lock on ``connection`` if it is free.
+
+    Yields False without waiting when another connection holds the lock. The
+    lock survives commits on ``connection`` and is released on exit. Pool
+    reset only rolls back, so a lock that cannot be released cleanly is
+    dropped by invalidating the connection, which ends its server session.
+    """
+    acquired = bool(await connection.scalar(select(func.pg_try_advisory_lock(key))))
+    await connection.commit()
+    if not acquired:
+        yield False
+        return
+
+    failed = False
+    try:
+        yield True
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        await _release_advisory_lock(connection, key, rollback=failed)
+
+
+async def _release_advisory_lock(
+    connection: AsyncConnection, key: int, *, rollback: bool
+) -> None:
+    try:
+        if rollback:
+            # The failed body may have left the transaction aborted.
+            await connection.rollback()
+        await connection.execute(select(func.pg_advisory_unlock(key)))
+        await connection.commit()
+    except Exception:
+        # Closing the server session releases the lock just the same.
+        logger.warning(
+            "Releasing advisory lock %#x failed; discarding the connection",
+            key,
+            exc_info=True,
+        )
+        await connection.invalidate()
+    except BaseException:
+        await connection.invalidate()
+        raise
+
+
+async def advisory_xact_lock(connection: AsyncConnection, key: int) -> None:
+    """Wait for the advisory lock on ``key``; it is held until the transaction ends."""
+    await connection.execute(select(func.pg_advisory_xact_lock(key)))
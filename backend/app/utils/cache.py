@@ -0,0 +1,268 @@
+import asyncio
+import json
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, Protocol, TypeVar
+
+logger = logging.getLogger("kitsu.cache")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Not thread-safe: instances are meant to be used from the event loop only.
+    A ``maxsize`` of 0 disables caching while keeping the counters.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CacheBackend(Protocol):
+    """Key/value store behind ``ReadThroughCache``; values are JSON-compatible."""
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None: ...
+
+    def invalidate(self, *keys: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Per-process LRU backend; invalidation takes effect immediately."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._cache: TTLCache[str, Any] = TTLCache(maxsize=maxsize, ttl_seconds=0)
+
+    async def get(self, key: str) -> Any | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+
+# Lua keeps the fence check and the write atomic. KEYS: entry, fence.
+_SET_UNLESS_FENCED = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return 1
+"""
+# KEYS: entry and fence pairs; ARGV[1]: fence lifetime in milliseconds.
+_DELETE_AND_FENCE = """
+for i = 1, #KEYS, 2 do
+    redis.call('DEL', KEYS[i])
+    redis.call('SET', KEYS[i + 1], '1', 'PX', ARGV[1])
+end
+return #KEYS / 2
+"""
+_FENCE_MILLISECONDS = 5000
+
+
+class RedisCacheBackend:
+    """Shared backend so every worker sees the same entries and invalidations.
+
+    An invalidation leaves a short-lived fence next to each deleted key, and
+    writes skip fenced keys, so a read that loaded the old row before the
+    change, in any worker, cannot store it back afterwards. Requires the
+    optional ``redis`` package (``pip install .[redis]``).
+    """
+
+    def __init__(self, url: str, *, prefix: str = "kitsu:") -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package"
+            ) from exc
+
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+        self._set_unless_fenced = self._client.register_script(_SET_UNLESS_FENCED)
+        self._delete_and_fence = self._client.register_script(_DELETE_AND_FENCE)
+        self._pending: set[asyncio.Task] = set()
+
+    def _fence_key(self, key: str) -> str:
+        return f"{self._prefix}fence:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._client.get(self._prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self._set_unless_fenced(
+            keys=[self._prefix + key, self._fence_key(key)],
+            args=[json.dumps(value), int(ttl_seconds * 1000)],
+        )
+
+    def invalidate(self, *keys: str) -> None:
+        if not keys:
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._delete_and_fence(
+                keys=[
+                    name
+                    for key in keys
+                    for name in (self._prefix + key, self._fence_key(key))
+                ],
+                args=[_FENCE_MILLISECONDS],
+            )
+        )
+        self._pending.add(task)
+        task.add_done_callback(lambda done: self._invalidated(done, keys))
+
+    def _invalidated(self, task: asyncio.Task, keys: tuple[str, ...]) -> None:
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning(
+                "Cache invalidation failed; entries stay until their TTL: %s",
+                ", ".join(keys),
+                exc_info=exc,
+            )
+
+    async def close(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self._client.aclose()
+
+
+class ReadThroughCache:
+    """Namespaced read-through cache with per-namespace hit/miss counters."""
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._errors = 0
+        # Bumped on every invalidation in a namespace; a load that straddles
+        # one does not write back, since the row may have changed under it.
+        self._generations: Counter[str] = Counter()
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[V | None]],
+        *,
+        ttl_seconds: float,
+        dump: Callable[[V], Any],
+        load: Callable[[Any], V],
+    ) -> V | None:
+        cache_key = f"{namespace}:{key}"
+        try:
+            cached = await self.backend.get(cache_key)
+        except Exception:
+            # A broken shared backend must degrade to database reads, not errors.
+            self._errors += 1
+            logger.warning("Cache read failed for %s", cache_key, exc_info=True)
+            cached = None
+
+        if cached is not None:
+            self._hits[namespace] += 1
+            return load(cached)
+
+        self._misses[namespace] += 1
+        generation = self._generations[namespace]
+        value = await loader()
+        if value is not None and self._generations[namespace] == generation:
+            try:
+                await self.backend.set(cache_key, dump(value), ttl_seconds)
+            except Exception:
+                self._errors += 1
+                logger.warning("Cache write failed for %s", cache_key, exc_info=True)
+        return value
+
+    def invalidate(self, namespace: str, *keys: Hashable) -> None:
+        self._generations[namespace] += 1
+        self.backend.invalidate(*(f"{namespace}:{key}" for key in keys))
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    def stats(self) -> dict[str, float]:
+        stats: dict[str, float] = {"errors": self._errors}
+        for namespace in sorted(set(self._hits) | set(self._misses)):
+            hits, misses = self._hits[namespace], self._misses[namespace]
+            stats[f"{namespace}_hits"] = hits
+            stats[f"{namespace}_misses"] = misses
+            stats[f"{namespace}_hit_ratio"] = hits / (hits + misses)
+        return stats
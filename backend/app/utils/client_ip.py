@@ -0,0 +1,56 @@
+import ipaddress
+from collections.abc import Sequence
+
+from starlette.requests import Request
+
+from ..config import settings
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+_trusted_proxies = tuple(
+    ipaddress.ip_network(proxy, strict=False) for proxy in settings.trusted_proxies
+)
+
+
+def _parse_ip(value: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address | None:
+    try:
+        return ipaddress.ip_address(value)
+    except ValueError:
+        return None
+
+
+def _is_trusted(
+    address: ipaddress.IPv4Address | ipaddress.IPv6Address,
+    networks: Sequence[IPNetwork],
+) -> bool:
+    return any(address in network for network in networks)
+
+
+def client_ip(
+    request: Request, trusted_proxies: Sequence[IPNetwork] = _trusted_proxies
+) -> str | None:
+    """Address of the client that sent ``request``, seen through trusted proxies.
+
+    ``X-Forwarded-For`` is only read when the direct peer is listed in
+    ``TRUSTED_PROXIES``. Its entries are walked from the right past further
+    trusted hops, so the result is the address the outermost trusted proxy
+    saw, not one the client wrote into the header itself.
+    """
+    peer = request.client.host if request.client else None
+    peer_ip = _parse_ip(peer) if peer else None
+    if peer_ip is None or not _is_trusted(peer_ip, trusted_proxies):
+        return peer
+
+    hops = [
+        hop.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for hop in header.split(",")
+    ]
+    for hop in reversed(hops):
+        hop_ip = _parse_ip(hop)
+        if hop_ip is None:
+            break
+        if not _is_trusted(hop_ip, trusted_proxies):
+            return str(hop_ip)
+        peer = str(hop_ip)
+    return peer
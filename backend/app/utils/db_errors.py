@@ -0,0 +1,41 @@
+from sqlalchemy.exc import IntegrityError
+
+FOREIGN_KEY_VIOLATION = "23503"
+# SQLSTATE classes raised for the rows themselves: data exceptions (22) and
+# integrity constraint violations (23).
+_DATA_ERROR_CLASSES = ("22", "23")
+
+
+def _driver_error(exc: BaseException) -> object:
+    # asyncpg errors arrive wrapped in SQLAlchemy's DBAPI adapter.
+    orig = getattr(exc, "orig", None)
+    if orig is None:
+        return exc
+    return getattr(orig, "__cause__", None) or orig
+
+
+def sqlstate(exc: BaseException) -> str | None:
+    """SQLSTATE of a database error, raw or wrapped by SQLAlchemy."""
+    for candidate in (exc, getattr(exc, "orig", None), _driver_error(exc)):
+        code = getattr(candidate, "sqlstate", None) or getattr(
+            candidate, "pgcode", None
+        )
+        if code:
+            return code
+    return None
+
+
+def is_data_error(exc: BaseException) -> bool:
+    """True when the rows were rejected, as opposed to the database failing."""
+    code = sqlstate(exc)
+    if code is not None:
+        return code[:2] in _DATA_ERROR_CLASSES
+    # asyncpg refuses values it cannot encode before they reach the server.
+    return isinstance(exc, ValueError | TypeError)
+
+
+def foreign_key_violation(exc: IntegrityError) -> str | None:
+    """Name of the violated foreign key, "" if unknown, None for other errors."""
+    if sqlstate(exc) != FOREIGN_KEY_VIOLATION:
+        return None
+    return getattr(_driver_error(exc), "constraint_name", None) or ""
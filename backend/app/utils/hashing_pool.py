@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from statistics import quantiles
+from time import perf_counter
+from typing import TypeVar
+
+from ..errors import ServiceUnavailableError
+
+logger = logging.getLogger("kitsu.hashing_pool")
+
+T = TypeVar("T")
+
+_TIMING_WINDOW = 1024
+
+
+class HashingPool:
+    """Size-bounded worker pool that keeps bcrypt off the event loop.
+
+    bcrypt releases the GIL, so threads give real parallelism here without
+    the pickling cost of a process pool. At most ``max_pending`` calls may be
+    running or queued; beyond that callers get an immediate 503 instead of
+    waiting behind a login spike while catalog requests stall.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._run_seconds: deque[float] = deque(maxlen=_TIMING_WINDOW)
+        self._wait_seconds: deque[float] = deque(maxlen=_TIMING_WINDOW)
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            logger.warning("Password hashing pool saturated (pending=%s)", self._pending)
+            raise ServiceUnavailableError("Authentication is busy, please retry")
+
+        loop = asyncio.get_running_loop()
+        submitted_at = perf_counter()
+        job = self._executor.submit(self._timed, func, args)
+        self._pending += 1
+        # The slot is freed when the job ends, not when the caller stops
+        # waiting: a cancelled request's bcrypt call keeps its thread busy.
+        job.add_done_callback(lambda _: self._release_from_thread(loop))
+        result, started_at, finished_at = await asyncio.wrap_future(job)
+
+        self._completed += 1
+        self._wait_seconds.append(started_at - submitted_at)
+        self._run_seconds.append(finished_at - started_at)
+        return result
+
+    def _release_from_thread(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Done callbacks run in the worker thread; the counter is owned by
+        # the event loop.
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # The loop is already closed; nothing reads the counter.
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+    @staticmethod
+    def _timed(func: Callable[..., T], args: tuple[object, ...]) -> tuple[T, float, float]:
+        started_at = perf_counter()
+        result = func(*args)
+        return result, started_at, perf_counter()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, float]:
+        stats: dict[str, float] = {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+        for name, samples in (("run", self._run_seconds), ("wait", self._wait_seconds)):
+            if len(samples) >= 2:
+                cuts = quantiles(samples, n=100)
+                stats[f"{name}_p50_seconds"] = cuts[49]
+                stats[f"{name}_p99_seconds"] = cuts[98]
+        return stats
@@ -0,0 +1,78 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.sha256(
+        "|".join(str(part) for part in parts).encode()
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def collection_version(
+    kind: str, items: list[Any], *extra: Any
+) -> tuple[str, datetime | None]:
+    """
+    ETag and Last-Modified for a list response, derived from the
+    ``(id, updated_at)`` pairs of its items rather than the rendered body.
+    """
+    etag = make_etag(
+        kind, *extra, *(f"{item.id}:{item.updated_at.isoformat()}" for item in items)
+    )
+    last_modified = max((item.updated_at for item in items), default=None)
+    return etag, last_modified
+
+
+def _format_http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since per RFC 9110: when the client
+    sends If-None-Match, If-Modified-Since is ignored.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def set_cache_headers(
+    response: Response, etag: str, last_modified: datetime | None = None
+) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _format_http_date(last_modified)
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, last_modified)
+    return response
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return (
+        "if-none-match" in request.headers or "if-modified-since" in request.headers
+    )
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from ..config import ASYMMETRIC_JWT_ALGORITHMS, settings
+
+logger = logging.getLogger("kitsu.jwt_keys")
+
+# "2026-03-01.pem" or "2026-03-01-b.pem": the key signs from that UTC date on.
+_KID_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:[-_.][\w.-]+)?$")
+
+PrivateKey = RSAPrivateKey | Ed25519PrivateKey
+PublicKey = RSAPublicKey | Ed25519PublicKey
+
+_KEY_TYPES: dict[str, type] = {"RS256": RSAPrivateKey, "EdDSA": Ed25519PrivateKey}
+_JWK_ENCODERS: dict[str, Any] = {"RS256": RSAAlgorithm, "EdDSA": OKPAlgorithm}
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    kid: str
+    active_from: datetime
+    private_key: PrivateKey
+    public_key: PublicKey
+    jwk: dict[str, Any]
+
+
+class JWTKeyRing:
+    """Asymmetric signing keys loaded from ``<kid>.pem`` files in one directory.
+
+    The kid starts with the UTC date the key takes over signing, so a rotation
+    is scheduled by dropping the next key in ahead of time: it is published in
+    JWKS immediately, signs from its date on, and its predecessor stays
+    verifiable for one more access-token lifetime before it is retired.
+    Public keys and their JWK form are decoded once per kid at load time.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        keys_dir: Path,
+        token_lifetime: timedelta,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.algorithm = algorithm
+        self.keys_dir = keys_dir
+        self.token_lifetime = token_lifetime
+        self._clock = clock
+        self._keys: list[SigningKey] = []
+        self._by_kid: dict[str, SigningKey] = {}
+
+    def load(self) -> None:
+        keys = [self._load_key(path) for path in sorted(self.keys_dir.glob("*.pem"))]
+        keys.sort(key=lambda key: key.active_from)
+        if not keys or keys[0].active_from > self._clock():
+            raise RuntimeError(f"No active JWT signing key found in {self.keys_dir}")
+
+        self._keys = keys
+        self._by_kid = {key.kid: key for key in self._keys}
+
+    def _load_key(self, path: Path) -> SigningKey:
+        kid = path.stem
+        # Decoding is done once per kid; reloads reuse already known keys.
+        cached = self._by_kid.get(kid)
+        if cached is not None:
+            return cached
+
+        match = _KID_RE.match(kid)
+        if match is None:
+            raise ValueError(f"JWT key file name must start with YYYY-MM-DD: {path.name}")
+        private_key = load_pem_private_key(path.read_bytes(), password=None)
+        if not isinstance(private_key, _KEY_TYPES[self.algorithm]):
+            raise ValueError(f"JWT key {path.name} does not match {self.algorithm}")
+
+        public_key = private_key.public_key()
+        jwk = _JWK_ENCODERS[self.algorithm].to_jwk(public_key, as_dict=True)
+        jwk.update({"kid": kid, "alg": self.algorithm, "use": "sig"})
+        return SigningKey(
+            kid=kid,
+            active_from=datetime.fromisoformat(match.group(1)).replace(
+                tzinfo=timezone.utc
+            ),
+            private_key=private_key,
+            public_key=public_key,
+            jwk=jwk,
+        )
+
+    def _published(self) -> list[SigningKey]:
+        now = self._clock()
+        published: list[SigningKey] = []
+        for key, successor in zip(self._keys, [*self._keys[1:], None]):
+            if (
+                successor is not None
+                and successor.active_from + self.token_lifetime <= now
+            ):
+                continue
+            published.append(key)
+        return published
+
+    def signing_key(self) -> SigningKey:
+        now = self._clock()
+        return next(key for key in reversed(self._keys) if key.active_from <= now)
+
+    def verification_key(self, kid: str) -> PublicKey | None:
+        key = self._by_kid.get(kid)
+        if key is None or not any(published is key for published in self._published()):
+            return None
+        return key.public_key
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        return {"keys": [key.jwk for key in self._published()]}
+
+
+async def run_key_ring_reloader(ring: JWTKeyRing, interval_seconds: int) -> None:
+    """Pick up key files added or removed after startup."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            ring.load()
+        except (OSError, ValueError, RuntimeError):
+            logger.exception("JWT key ring reload failed; keeping previous keys")
+
+
+jwt_key_ring: JWTKeyRing | None = None
+if settings.algorithm in ASYMMETRIC_JWT_ALGORITHMS and settings.jwt_keys_dir:
+    jwt_key_ring = JWTKeyRing(
+        settings.algorithm,
+        Path(settings.jwt_keys_dir),
+        timedelta(minutes=settings.access_token_expire_minutes),
+    )
+    jwt_key_ring.load()
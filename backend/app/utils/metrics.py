@@ -0,0 +1,14 @@
+from collections.abc import Callable
+
+MetricsProvider = Callable[[], dict[str, float]]
+
+_providers: dict[str, MetricsProvider] = {}
+
+
+def register_metrics(name: str, provider: MetricsProvider) -> None:
+    """Expose ``provider()`` under ``name`` in the ``/metrics`` snapshot."""
+    _providers[name] = provider
+
+
+def collect_metrics() -> dict[str, dict[str, float]]:
+    return {name: provider() for name, provider in sorted(_providers.items())}
@@ -0,0 +1,104 @@
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("kitsu.model_events")
+
+_PENDING_CHANGES_KEY = "kitsu_pending_model_changes"
+
+
+@dataclass(frozen=True)
+class ModelChange:
+    """Snapshot of a flushed ORM row, delivered once its transaction commits."""
+
+    model: type
+    deleted: bool
+    values: dict[str, Any]
+    # Pre-flush values of the columns the flush changed.
+    previous: dict[str, Any] = field(default_factory=dict)
+
+
+ChangeListener = Callable[[list[ModelChange]], None]
+
+_listeners: dict[type, list[ChangeListener]] = defaultdict(list)
+
+
+def on_commit(model: type, listener: ChangeListener) -> None:
+    """Call ``listener`` with the rows of ``model`` changed by each committed transaction.
+
+    Only ORM unit-of-work changes are observed; bulk ``update()``/``delete()``
+    statements bypass the session and are not reported.
+    """
+    _listeners[model].append(listener)
+
+
+def _snapshot(obj: Any) -> dict[str, Any]:
+    state = inspect(obj)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+
+def _previous_values(obj: Any) -> dict[str, Any]:
+    state = inspect(obj)
+    previous: dict[str, Any] = {}
+    for attr in state.mapper.column_attrs:
+        deleted = state.attrs[attr.key].history.deleted
+        if deleted:
+            previous[attr.key] = deleted[0]
+    return previous
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context: Any) -> None:
+    if not _listeners:
+        return
+
+    pending: list[ModelChange] = session.info.setdefault(_PENDING_CHANGES_KEY, [])
+    flushed = chain(
+        ((obj, False) for obj in session.new),
+        ((obj, False) for obj in session.dirty),
+        ((obj, True) for obj in session.deleted),
+    )
+    for obj, deleted in flushed:
+        model = type(obj)
+        if model in _listeners:
+            pending.append(
+                ModelChange(
+                    model=model,
+                    deleted=deleted,
+                    values=_snapshot(obj),
+                    previous=_previous_values(obj),
+                )
+            )
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session: Session) -> None:
+    pending: list[ModelChange] = session.info.pop(_PENDING_CHANGES_KEY, [])
+    if not pending:
+        return
+
+    by_model: dict[type, list[ModelChange]] = defaultdict(list)
+    for change in pending:
+        by_model[change.model].append(change)
+
+    for model, changes in by_model.items():
+        for listener in _listeners.get(model, ()):
+            try:
+                listener(changes)
+            except Exception:
+                logger.exception("Model change listener failed for %s", model.__name__)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
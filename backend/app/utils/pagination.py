@@ -1,4 +1,25 @@
-from sqlalchemy import Select
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ..errors import ValidationError
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
 
 
 def apply_pagination(statement: Select, limit: int, offset: int) -> Select:
@@ -7,3 +28,55 @@ def apply_pagination(statement: Select, limit: int, offset: int) -> Select:
     """
     return statement.limit(limit).offset(offset)
 
+
+def encode_cursor(created_at: datetime, obj_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(obj_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, obj_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(obj_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValidationError("Invalid pagination cursor") from None
+
+
+def apply_keyset_pagination(
+    statement: Select,
+    created_at_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    *,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Select:
+    """
+    Order newest first by ``(created_at, id)`` and fetch one extra row so
+    ``build_page`` can tell whether a next page exists.
+
+    With a cursor the position is a row comparison served by a composite
+    ``(created_at, id)`` index, so every page costs the same. ``offset`` is
+    kept for legacy clients and ignored once a cursor is supplied.
+    """
+    statement = statement.order_by(created_at_column.desc(), id_column.desc())
+    if cursor is not None:
+        created_at, obj_id = decode_cursor(cursor)
+        statement = statement.where(
+            tuple_(created_at_column, id_column) < tuple_(created_at, obj_id)
+        )
+    elif offset:
+        statement = statement.offset(offset)
+    return statement.limit(limit + 1)
+
+
+def build_page(
+    rows: list[Any], limit: int, *, created_at_attr: str = "created_at"
+) -> Page[Any]:
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, created_at_attr), last.id)
+    return Page(items=items, next_cursor=next_cursor)
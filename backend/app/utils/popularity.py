@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ..config import settings
+from ..crud.popularity import (
+    EVENT_SOURCES,
+    EventSource,
+    compute_ranking,
+    decayed_score,
+    get_earliest_event,
+    get_rollup_watermark,
+    replace_ranking,
+    roll_up_events,
+    set_rollup_watermark,
+)
+from ..models.popularity import AnimeDailyStats
+from ..schemas.anime import TrendingRanking
+from .advisory_lock import POPULARITY_ROLLUP_LOCK, try_advisory_lock
+from .metrics import register_metrics
+
+logger = logging.getLogger("kitsu.popularity")
+
+# Windows close this long after their end, so transactions that stamped
+# ``ingested_at`` but had not committed yet still land inside them.
+_SETTLE_DELAY = timedelta(minutes=2)
+# Catching up after downtime happens one day of events per transaction.
+_MAX_WINDOW = timedelta(days=1)
+_MOST_WATCHED_DAYS = 7
+TRENDING_WEIGHTS = {"views": 1.0, "watch_starts": 3.0, "favorites": 5.0}
+
+
+@dataclass
+class RollupResult:
+    acquired: bool
+    rows: dict[str, int] = field(default_factory=dict)
+
+
+class PopularityAggregator:
+    """Folds new watch and favorite events into per-day counters, then ranks.
+
+    Each source keeps a watermark on its ingestion timestamp in
+    ``rollup_watermarks``; a run counts the events ingested between the
+    watermark and now minus a settle delay, adds them to ``anime_daily_stats``
+    by the day they happened and advances the watermark in the same
+    transaction, so no window is counted twice. A row whose transaction
+    commits more than the settle delay after its ingestion timestamp is
+    missed, so counts are exact only for short writes. The top-K rankings
+    are then recomputed from the daily rows alone and swapped in, and
+    requests only read those.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_days: int,
+        half_life_hours: int,
+        top_k: int,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.window_days = window_days
+        self.half_life_hours = half_life_hours
+        self.top_k = top_k
+        self._clock = clock
+        self._runs = 0
+        self._skipped = 0
+        self._errors = 0
+        self._rows = 0
+        self._last_duration_seconds = 0.0
+
+    async def run(self, engine: AsyncEngine) -> RollupResult:
+        started_at = perf_counter()
+        now = self._clock()
+
+        async with engine.connect() as connection:
+            async with try_advisory_lock(connection, POPULARITY_ROLLUP_LOCK) as acquired:
+                if not acquired:
+                    self._skipped += 1
+                    return RollupResult(acquired=False)
+
+                result = RollupResult(acquired=True)
+                for source in EVENT_SOURCES:
+                    result.rows[source.name] = await self._roll_up(
+                        connection, source, now - _SETTLE_DELAY
+                    )
+                await self._rank(connection, now)
+
+        self._runs += 1
+        self._rows += sum(result.rows.values())
+        self._last_duration_seconds = perf_counter() - started_at
+        return result
+
+    async def _roll_up(
+        self, connection: AsyncConnection, source: EventSource, until: datetime
+    ) -> int:
+        after = await get_rollup_watermark(connection, source)
+        if after is None:
+            earliest = await get_earliest_event(connection, source)
+            if earliest is None:
+                await set_rollup_watermark(connection, source, until)
+                await connection.commit()
+                return 0
+            after = earliest - timedelta(microseconds=1)
+
+        rows = 0
+        while after < until:
+            window_end = min(after + _MAX_WINDOW, until)
+            rows += await roll_up_events(connection, source, after, window_end)
+            await set_rollup_watermark(connection, source, window_end)
+            await connection.commit()
+            after = window_end
+        return rows
+
+    async def _rank(self, connection: AsyncConnection, now: datetime) -> None:
+        today = now.date()
+        rankings: dict[TrendingRanking, list[tuple[uuid.UUID, float]]] = {
+            "trending": await compute_ranking(
+                connection,
+                decayed_score(
+                    TRENDING_WEIGHTS,
+                    today=today,
+                    half_life_hours=self.half_life_hours,
+                ),
+                since=today - timedelta(days=self.window_days - 1),
+                limit=self.top_k,
+            ),
+            "most_watched": await compute_ranking(
+                connection,
+                AnimeDailyStats.views,
+                since=today - timedelta(days=_MOST_WATCHED_DAYS - 1),
+                limit=self.top_k,
+            ),
+        }
+        # Both rankings are swapped in one transaction; readers see either
+        # the previous or the new lists, never a half-written one.
+        for ranking, entries in rankings.items():
+            await replace_ranking(connection, ranking, entries, computed_at=now)
+        await connection.commit()
+
+    def record_error(self) -> None:
+        self._errors += 1
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "runs": self._runs,
+            "skipped_locked": self._skipped,
+            "errors": self._errors,
+            "rolled_up_rows": self._rows,
+            "last_duration_seconds": self._last_duration_seconds,
+        }
+
+
+async def run_popularity_aggregator(
+    aggregator: PopularityAggregator, engine: AsyncEngine, interval_seconds: int
+) -> None:
+    while True:
+        try:
+            await aggregator.run(engine)
+        except Exception:
+            aggregator.record_error()
+            logger.exception("Popularity rollup failed")
+        await asyncio.sleep(interval_seconds)
+
+
+popularity_aggregator = PopularityAggregator(
+    window_days=settings.trending_window_days,
+    half_life_hours=settings.trending_half_life_hours,
+    top_k=settings.trending_top_k,
+)
+register_metrics("popularity_rollup", popularity_aggregator.stats)
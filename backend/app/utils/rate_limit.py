@@ -0,0 +1,190 @@
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from ..errors import RateLimitError
+
+logger = logging.getLogger("kitsu.rate_limit")
+
+
+@dataclass(frozen=True, slots=True)
+class BucketRule:
+    """Token bucket: ``capacity`` requests at once, refilled at ``per_minute``."""
+
+    name: str
+    capacity: int
+    per_minute: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.per_minute / 60
+
+
+class RateLimitBackend(Protocol):
+    async def acquire(self, key: str, rule: BucketRule) -> float:
+        """Take one token; return 0 when admitted, else seconds until one is free."""
+
+    async def close(self) -> None: ...
+
+
+class MemoryRateLimitBackend:
+    """Per-process buckets split across independently bounded LRU shards.
+
+    Sharding keeps eviction local: a flood of unique keys (rotating IPs or
+    emails) only churns the shards it hashes into and never has to scan the
+    whole key space.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_keys_per_shard: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._shards: list[OrderedDict[str, tuple[float, float]]] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self._max_keys_per_shard = max_keys_per_shard
+        self._clock = clock
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    async def acquire(self, key: str, rule: BucketRule) -> float:
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = self._clock()
+        tokens, updated_at = shard.get(key, (float(rule.capacity), now))
+        tokens = min(
+            float(rule.capacity), tokens + (now - updated_at) * rule.refill_per_second
+        )
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rule.refill_per_second
+
+        shard[key] = (tokens, now)
+        shard.move_to_end(key)
+        if len(shard) > self._max_keys_per_shard:
+            shard.popitem(last=False)
+            self.evictions += 1
+        return retry_after
+
+    async def close(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+
+# Refill and take one token atomically; state is a hash {tokens, ts} in ms.
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local refill_per_ms = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill_per_ms)
+local wait_ms = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait_ms = math.ceil((1 - tokens) / refill_per_ms)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / refill_per_ms))
+return wait_ms
+"""
+
+
+class RedisRateLimitBackend:
+    """Buckets shared by every worker, updated with one Lua call per check.
+
+    Requires the optional ``redis`` package (``pip install .[redis]``).
+    """
+
+    def __init__(self, url: str, *, prefix: str = "kitsu:ratelimit:") -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "AUTH_RATE_LIMIT_BACKEND=redis requires the 'redis' package"
+            ) from exc
+
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+        self._prefix = prefix
+
+    async def acquire(self, key: str, rule: BucketRule) -> float:
+        wait_ms = await self._script(
+            keys=[self._prefix + key],
+            args=[rule.capacity, rule.refill_per_second / 1000, int(time.time() * 1000)],
+        )
+        return int(wait_ms) / 1000
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class AuthThrottle:
+    """Admission check for credential endpoints, run before any bcrypt or DB work.
+
+    The per-IP bucket is checked first so a rejected address does not drain
+    the bucket of the account it is targeting. Backend failures fail open.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        *,
+        ip_rule: BucketRule,
+        email_rule: BucketRule,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend
+        self.ip_rule = ip_rule
+        self.email_rule = email_rule
+        self.enabled = enabled
+        self._allowed: Counter[str] = Counter()
+        self._rejected: Counter[str] = Counter()
+        self._errors = 0
+
+    async def check(self, scope: str, *, ip: str | None, email: str | None) -> None:
+        if not self.enabled:
+            return
+
+        checks = []
+        if ip:
+            checks.append((self.ip_rule, ip))
+        if email:
+            checks.append((self.email_rule, email.strip().lower()))
+
+        for rule, value in checks:
+            try:
+                retry_after = await self.backend.acquire(
+                    f"{scope}:{rule.name}:{value}", rule
+                )
+            except Exception:
+                self._errors += 1
+                logger.warning("Rate limit backend failed", exc_info=True)
+                return
+            if retry_after > 0:
+                self._rejected[f"{scope}_{rule.name}"] += 1
+                raise RateLimitError(retry_after=retry_after)
+        self._allowed[scope] += 1
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    def stats(self) -> dict[str, float]:
+        stats: dict[str, float] = {"backend_errors": self._errors}
+        for scope, count in self._allowed.items():
+            stats[f"{scope}_allowed"] = count
+        for key, count in self._rejected.items():
+            stats[f"{key}_rejected"] = count
+        return stats
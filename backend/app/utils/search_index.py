@@ -0,0 +1,304 @@
+import asyncio
+import logging
+import re
+import unicodedata
+import uuid
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import settings
+from ..models.anime import Anime
+from .model_events import ModelChange, on_commit
+
+logger = logging.getLogger("kitsu.search_index")
+
+_WORD_RE = re.compile(r"\w+")
+_BUILD_BATCH_SIZE = 1000
+
+IndexSearchMode = Literal["fuzzy", "substring"]
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedAnime:
+    id: uuid.UUID
+    title: str
+    title_original: str | None
+    year: int | None
+    status: str | None
+
+
+def normalize_text(value: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+
+def trigram_sequence(value: str) -> tuple[str, ...]:
+    """Word-level trigrams in text order, padded the same way pg_trgm pads them."""
+    sequence: list[str] = []
+    for word in _WORD_RE.findall(normalize_text(value)):
+        padded = f"  {word} "
+        sequence.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return tuple(sequence)
+
+
+def trigrams(value: str) -> set[str]:
+    return set(trigram_sequence(value))
+
+
+def word_similarity(query_grams: set[str], sequence: Sequence[str]) -> float:
+    """pg_trgm ``word_similarity``: the best score of the query trigrams against
+    any contiguous extent of ``sequence``, shared / (query + extent - shared).
+
+    Trimming an extent edge that is not a query trigram never lowers the
+    score, so only extents starting and ending on query trigrams are tried.
+    """
+    best = 0.0
+    for start, first in enumerate(sequence):
+        if first not in query_grams:
+            continue
+        extent: set[str] = set()
+        shared = 0
+        for gram in sequence[start:]:
+            if gram not in extent:
+                extent.add(gram)
+                if gram in query_grams:
+                    shared += 1
+            if gram in query_grams:
+                best = max(best, shared / (len(query_grams) + len(extent) - shared))
+    return best
+
+
+class AnimeSearchIndex:
+    """In-memory trigram postings over anime titles.
+
+    Documents are addressed by small integer ids so every posting list is a
+    set of ints rather than a set of UUIDs. Fuzzy matches are scored with the
+    same ``word_similarity`` as the SQL path. The index is cold until the
+    first full build finishes; callers are expected to fall back to SQL until
+    then. Full rebuilds are indexed in a worker thread and swapped in, and
+    catch up on changes other workers made, which ``on_commit`` never sees.
+    """
+
+    def __init__(self, similarity_threshold: float) -> None:
+        self.similarity_threshold = similarity_threshold
+        self._ready = False
+        self._building = False
+        self._pending: list[ModelChange] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: dict[str, set[int]] = {}
+        self._docs: dict[int, IndexedAnime] = {}
+        self._doc_grams: dict[int, frozenset[str]] = {}
+        self._doc_sequences: dict[int, tuple[tuple[str, ...], ...]] = {}
+        self._normalized_titles: dict[int, str] = {}
+        self._doc_ids: dict[uuid.UUID, int] = {}
+        self._next_doc_id = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def begin_rebuild(self) -> None:
+        self._building = True
+        self._pending = []
+
+    def abort_rebuild(self) -> None:
+        self._building = False
+        self._pending = []
+
+    @classmethod
+    def from_documents(
+        cls, documents: list[IndexedAnime], similarity_threshold: float
+    ) -> "AnimeSearchIndex":
+        index = cls(similarity_threshold)
+        for document in documents:
+            index._add(document)
+        return index
+
+    def finish_rebuild(self, built: "AnimeSearchIndex") -> None:
+        """Adopt the postings of ``built``, then replay changes made meanwhile."""
+        self._postings = built._postings
+        self._docs = built._docs
+        self._doc_grams = built._doc_grams
+        self._doc_sequences = built._doc_sequences
+        self._normalized_titles = built._normalized_titles
+        self._doc_ids = built._doc_ids
+        self._next_doc_id = built._next_doc_id
+        pending, self._pending = self._pending, []
+        self._building = False
+        self._ready = True
+        self.apply_changes(pending)
+
+    def apply_changes(self, changes: list[ModelChange]) -> None:
+        if self._building:
+            self._pending.extend(changes)
+            return
+        if not self._ready:
+            return
+
+        for change in changes:
+            anime_id = change.values.get("id")
+            if anime_id is None:
+                continue
+            previous = self._remove(anime_id)
+            if change.deleted:
+                continue
+
+            # Dirty rows may carry only part of their columns; keep the rest.
+            fields = {
+                name: change.values[name]
+                if name in change.values
+                else getattr(previous, name, None)
+                for name in ("title", "title_original", "year", "status")
+            }
+            if fields["title"] is None:
+                continue
+            self._add(IndexedAnime(id=anime_id, **fields))
+
+    def _add(self, document: IndexedAnime) -> None:
+        doc_id = self._next_doc_id
+        self._next_doc_id += 1
+
+        sequences = [trigram_sequence(document.title)]
+        if document.title_original:
+            sequences.append(trigram_sequence(document.title_original))
+        grams = {gram for sequence in sequences for gram in sequence}
+
+        self._docs[doc_id] = document
+        self._doc_grams[doc_id] = frozenset(grams)
+        self._doc_sequences[doc_id] = tuple(sequences)
+        self._normalized_titles[doc_id] = normalize_text(document.title)
+        self._doc_ids[document.id] = doc_id
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def _remove(self, anime_id: uuid.UUID) -> IndexedAnime | None:
+        doc_id = self._doc_ids.pop(anime_id, None)
+        if doc_id is None:
+            return None
+
+        for gram in self._doc_grams.pop(doc_id):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[gram]
+        del self._doc_sequences[doc_id]
+        del self._normalized_titles[doc_id]
+        return self._docs.pop(doc_id)
+
+    def search(
+        self, query: str, *, mode: IndexSearchMode, limit: int, offset: int
+    ) -> list[IndexedAnime]:
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        if mode == "substring":
+            needle = normalize_text(query)
+            # Only unpadded trigrams are guaranteed to occur inside a longer word.
+            inner_grams = {
+                word[i : i + 3]
+                for word in _WORD_RE.findall(needle)
+                for i in range(len(word) - 2)
+            }
+            if inner_grams:
+                postings = sorted(
+                    (self._postings.get(gram, set()) for gram in inner_grams), key=len
+                )
+                candidates = set.intersection(*postings)
+            else:
+                candidates = set(self._docs)
+            matches = [
+                self._docs[doc_id]
+                for doc_id in candidates
+                if needle in self._normalized_titles[doc_id]
+            ]
+            matches.sort(key=lambda doc: doc.title)
+            return matches[offset : offset + limit]
+
+        hits: Counter[int] = Counter()
+        for gram in query_grams:
+            hits.update(self._postings.get(gram, ()))
+
+        total = len(query_grams)
+        scored: list[tuple[float, IndexedAnime]] = []
+        for doc_id, count in hits.items():
+            # No extent shares more trigrams than the whole document, so
+            # count / total bounds the score and skips most candidates.
+            if count / total < self.similarity_threshold:
+                continue
+            score = max(
+                word_similarity(query_grams, sequence)
+                for sequence in self._doc_sequences[doc_id]
+            )
+            if score >= self.similarity_threshold:
+                scored.append((score, self._docs[doc_id]))
+        scored.sort(key=lambda item: (-item[0], item[1].title))
+        return [doc for _, doc in scored[offset : offset + limit]]
+
+
+async def build_anime_search_index(
+    index: AnimeSearchIndex, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    index.begin_rebuild()
+    documents: list[IndexedAnime] = []
+    stmt = select(
+        Anime.id, Anime.title, Anime.title_original, Anime.year, Anime.status
+    ).execution_options(yield_per=_BUILD_BATCH_SIZE)
+    try:
+        async with session_factory() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                documents.append(
+                    IndexedAnime(
+                        id=row.id,
+                        title=row.title,
+                        title_original=row.title_original,
+                        year=row.year,
+                        status=row.status,
+                    )
+                )
+        built = await asyncio.to_thread(
+            AnimeSearchIndex.from_documents, documents, index.similarity_threshold
+        )
+    except SQLAlchemyError:
+        index.abort_rebuild()
+        logger.exception("Anime search index build failed")
+        return
+    except BaseException:
+        index.abort_rebuild()
+        raise
+
+    index.finish_rebuild(built)
+    logger.info("Anime search index built (documents=%s)", len(index))
+
+
+async def run_anime_search_index_refresher(
+    index: AnimeSearchIndex,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: int,
+) -> None:
+    """Build the index, then rebuild it from the database on a fixed interval."""
+    while True:
+        try:
+            await build_anime_search_index(index, session_factory)
+        except Exception:
+            logger.exception("Anime search index refresh failed")
+        await asyncio.sleep(interval_seconds)
+
+
+anime_search_index = AnimeSearchIndex(
+    similarity_threshold=settings.search_similarity_threshold
+)
+on_commit(Anime, anime_search_index.apply_changes)
@@ -9,6 +9,10 @@ from passlib.context import CryptContext
 from passlib.hash import bcrypt as passlib_bcrypt
 
 from ..config import settings
+from .hashing_pool import HashingPool
+from .jwt_keys import jwt_key_ring
+from .metrics import register_metrics
+
 
 class TokenExpiredError(Exception):
     pass
@@ -23,8 +27,17 @@ pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
     bcrypt__ident="2b",
+    bcrypt__default_rounds=settings.password_bcrypt_rounds,
+    # Any other cost, higher or lower, is rehashed on the next successful login.
+    bcrypt__min_rounds=settings.password_bcrypt_rounds,
+    bcrypt__max_rounds=settings.password_bcrypt_rounds,
 )
 
+# Stored hashes are "<version><bcrypt hash>". v2 is bcrypt over the SHA-256 hex
+# digest of the password. Unprefixed hashes predate versioning and may hold
+# either the digest or the raw password.
+PASSWORD_HASH_VERSION = "v2:"
+
 
 def _normalize_password(password: str) -> str:
     """Normalize passwords to avoid bcrypt's 72-byte input limit."""
@@ -33,34 +46,100 @@ def _normalize_password(password: str) -> str:
 
 def hash_password(password: str) -> str:
     normalized_password = _normalize_password(password)
-    return pwd_context.hash(normalized_password)
+    return PASSWORD_HASH_VERSION + pwd_context.hash(normalized_password)
+
+
+def _verify_legacy_password(plain_password: str, hashed_password: str) -> bool:
+    for candidate in (_normalize_password(plain_password), plain_password):
+        try:
+            if pwd_context.verify(candidate, hashed_password):
+                return True
+        except ValueError:
+            return False
+    return False
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    normalized_password = _normalize_password(plain_password)
-    try:
-        if pwd_context.verify(normalized_password, hashed_password):
-            return True
-    except ValueError:
-        pass
+    """Versioned hashes cost exactly one bcrypt verification."""
+    if not hashed_password.startswith(PASSWORD_HASH_VERSION):
+        return _verify_legacy_password(plain_password, hashed_password)
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        return pwd_context.verify(
+            _normalize_password(plain_password),
+            hashed_password.removeprefix(PASSWORD_HASH_VERSION),
+        )
     except ValueError:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    if not hashed_password.startswith(PASSWORD_HASH_VERSION):
+        return True
+    return pwd_context.needs_update(hashed_password.removeprefix(PASSWORD_HASH_VERSION))
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Check a password and return a replacement hash when the stored one is outdated."""
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if password_needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
+
+
+hashing_pool = HashingPool(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+register_metrics("password_hashing", hashing_pool.stats)
+
+
+async def hash_password_async(password: str) -> str:
+    return await hashing_pool.run(hash_password, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return await hashing_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(payload: dict[str, Any]) -> str:
     to_encode = payload.copy()
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.access_token_expire_minutes
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    if jwt_key_ring is None:
+        return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+
+    signing_key = jwt_key_ring.signing_key()
+    return jwt.encode(
+        to_encode,
+        signing_key.private_key,
+        algorithm=settings.algorithm,
+        headers={"kid": signing_key.kid},
+    )
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
     try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        if jwt_key_ring is None:
+            return jwt.decode(
+                token, settings.secret_key, algorithms=[settings.algorithm]
+            )
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        verification_key = (
+            jwt_key_ring.verification_key(kid) if isinstance(kid, str) else None
+        )
+        if verification_key is None:
+            raise TokenInvalidError()
+        return jwt.decode(token, verification_key, algorithms=[settings.algorithm])
     except jwt.ExpiredSignatureError as exc:
         raise TokenExpiredError from exc
     except jwt.InvalidTokenError as exc:
@@ -0,0 +1,165 @@
+import asyncio
+import heapq
+import logging
+import re
+import uuid
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..crud.anime import list_anime_titles_with_popularity
+from ..models.anime import Anime
+from .model_events import ModelChange, on_commit
+from .search_index import normalize_text
+
+logger = logging.getLogger("kitsu.suggest")
+
+_WORD_START_RE = re.compile(r"(?<=\s)\S")
+_PREFIX_UPPER_BOUND = "\U0010ffff"
+_STALE_DEBOUNCE_SECONDS = 5
+
+MAX_SUGGESTIONS = 20
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+
+@dataclass(frozen=True, slots=True)
+class Suggestion:
+    id: uuid.UUID
+    title: str
+    popularity: int
+
+
+def _rank(suggestion: Suggestion) -> tuple[int, str]:
+    return (-suggestion.popularity, suggestion.title)
+
+
+def _completion_keys(text: str) -> set[str]:
+    """The full normalized title plus every suffix starting at a word boundary."""
+    normalized = normalize_text(text)
+    if not normalized:
+        return set()
+    starts = [0, *(match.start() for match in _WORD_START_RE.finditer(normalized))]
+    return {normalized[start:] for start in starts}
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexData:
+    keys: list[str]
+    refs: list[int]
+    suggestions: list[Suggestion]
+    top_by_prefix: dict[str, list[Suggestion]]
+
+
+def _build_index_data(
+    rows: Iterable[tuple[uuid.UUID, str, str | None, int]],
+) -> _IndexData:
+    suggestions: list[Suggestion] = []
+    entries: list[tuple[str, int]] = []
+    for anime_id, title, title_original, popularity in rows:
+        ref = len(suggestions)
+        suggestions.append(Suggestion(id=anime_id, title=title, popularity=popularity))
+        keys = _completion_keys(title)
+        if title_original:
+            keys |= _completion_keys(title_original)
+        entries.extend((key, ref) for key in keys)
+    entries.sort()
+
+    short_prefixes: dict[str, set[int]] = {}
+    for key, ref in entries:
+        for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LENGTH) + 1):
+            short_prefixes.setdefault(key[:length], set()).add(ref)
+
+    return _IndexData(
+        keys=[key for key, _ in entries],
+        refs=[ref for _, ref in entries],
+        suggestions=suggestions,
+        top_by_prefix={
+            prefix: heapq.nsmallest(
+                MAX_SUGGESTIONS, (suggestions[ref] for ref in refs), key=_rank
+            )
+            for prefix, refs in short_prefixes.items()
+        },
+    )
+
+
+class SuggestionIndex:
+    """Sorted array of completion keys answered with two binary searches.
+
+    Keys are every word-boundary suffix of ``title`` and ``title_original`` so
+    "piece" completes "One Piece". Top results for one- and two-character
+    prefixes, whose key ranges cover a large share of the catalog, are
+    precomputed at build time. A rebuild replaces all arrays with a single
+    assignment, so it can run in a worker thread while requests are served.
+    """
+
+    def __init__(self) -> None:
+        self._data = _IndexData(keys=[], refs=[], suggestions=[], top_by_prefix={})
+        self._ready = False
+        self.stale = asyncio.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def mark_stale(self, changes: list[ModelChange] | None = None) -> None:
+        self.stale.set()
+
+    def rebuild(
+        self, rows: Iterable[tuple[uuid.UUID, str, str | None, int]]
+    ) -> None:
+        self._data = _build_index_data(rows)
+        self._ready = True
+
+    def suggest(self, prefix: str, limit: int) -> list[Suggestion]:
+        normalized = normalize_text(prefix)
+        if not normalized:
+            return []
+        data = self._data
+        if len(normalized) <= PRECOMPUTED_PREFIX_LENGTH:
+            return data.top_by_prefix.get(normalized, [])[:limit]
+
+        lo = bisect_left(data.keys, normalized)
+        hi = bisect_left(data.keys, normalized + _PREFIX_UPPER_BOUND, lo)
+        refs = set(data.refs[lo:hi])
+        return heapq.nsmallest(
+            limit, (data.suggestions[ref] for ref in refs), key=_rank
+        )
+
+
+async def build_suggestion_index(
+    index: SuggestionIndex, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    async with session_factory() as session:
+        rows = await list_anime_titles_with_popularity(session)
+    # Sorting every completion key takes long enough to stall the event loop.
+    await asyncio.to_thread(
+        index.rebuild,
+        [(row.id, row.title, row.title_original, row.popularity) for row in rows],
+    )
+    logger.info("Suggestion index built (titles=%s)", len(rows))
+
+
+async def run_suggestion_refresher(
+    index: SuggestionIndex,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: int,
+) -> None:
+    """Rebuild on a fixed interval, or shortly after anime rows change."""
+    while True:
+        index.stale.clear()
+        try:
+            await build_suggestion_index(index, session_factory)
+        except Exception:
+            logger.exception("Suggestion index refresh failed")
+
+        try:
+            await asyncio.wait_for(index.stale.wait(), timeout=interval_seconds)
+        except TimeoutError:
+            continue
+        await asyncio.sleep(_STALE_DEBOUNCE_SECONDS)
+
+
+suggestion_index = SuggestionIndex()
+on_commit(Anime, suggestion_index.mark_stale)
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..config import settings
+from ..crud.refresh_token import delete_stale_refresh_tokens
+from .advisory_lock import REFRESH_TOKEN_SWEEPER_LOCK, try_advisory_lock
+from .metrics import register_metrics
+
+logger = logging.getLogger("kitsu.token_sweeper")
+
+
+@dataclass
+class SweepResult:
+    acquired: bool
+    deleted: int = 0
+    batches: int = 0
+
+
+class RefreshTokenSweeper:
+    """Deletes expired refresh tokens and revoked ones past their retention.
+
+    Rows go in batches of ``batch_size``, each in its own short transaction,
+    so the sweep never holds many row locks or one long transaction. A
+    session-level advisory lock keeps concurrent workers from sweeping twice.
+    """
+
+    def __init__(self, batch_size: int, revoked_retention: timedelta) -> None:
+        self.batch_size = batch_size
+        self.revoked_retention = revoked_retention
+        self._runs = 0
+        self._skipped = 0
+        self._errors = 0
+        self._deleted = 0
+        self._last_deleted = 0
+        self._last_duration_seconds = 0.0
+
+    async def sweep(self, engine: AsyncEngine) -> SweepResult:
+        started_at = perf_counter()
+        now = datetime.now(timezone.utc)
+        revoked_before = now - self.revoked_retention
+
+        async with engine.connect() as connection:
+            async with try_advisory_lock(
+                connection, REFRESH_TOKEN_SWEEPER_LOCK
+            ) as acquired:
+                if not acquired:
+                    self._skipped += 1
+                    return SweepResult(acquired=False)
+
+                result = SweepResult(acquired=True)
+                while True:
+                    deleted = await delete_stale_refresh_tokens(
+                        connection,
+                        expired_before=now,
+                        revoked_before=revoked_before,
+                        limit=self.batch_size,
+                    )
+                    await connection.commit()
+                    result.batches += 1
+                    result.deleted += deleted
+                    if deleted < self.batch_size:
+                        break
+                    # Yield between batches so request handlers are not starved.
+                    await asyncio.sleep(0)
+
+        self._runs += 1
+        self._deleted += result.deleted
+        self._last_deleted = result.deleted
+        self._last_duration_seconds = perf_counter() - started_at
+        return result
+
+    def record_error(self) -> None:
+        self._errors += 1
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "runs": self._runs,
+            "skipped_locked": self._skipped,
+            "errors": self._errors,
+            "deleted_total": self._deleted,
+            "last_deleted": self._last_deleted,
+            "last_duration_seconds": self._last_duration_seconds,
+        }
+
+
+async def run_refresh_token_sweeper(
+    sweeper: RefreshTokenSweeper, engine: AsyncEngine, interval_seconds: int
+) -> None:
+    while True:
+        try:
+            result = await sweeper.sweep(engine)
+        except Exception:
+            sweeper.record_error()
+            logger.exception("Refresh token sweep failed")
+        else:
+            if result.acquired:
+                logger.info(
+                    "Refresh token sweep finished (deleted=%s, batches=%s)",
+                    result.deleted,
+                    result.batches,
+                )
+        await asyncio.sleep(interval_seconds)
+
+
+refresh_token_sweeper = RefreshTokenSweeper(
+    batch_size=settings.refresh_token_sweep_batch_size,
+    revoked_retention=timedelta(hours=settings.refresh_token_revoked_retention_hours),
+)
+register_metrics("refresh_token_sweeper", refresh_token_sweeper.stats)
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..config import settings
+from ..crud.view import (
+    add_months,
+    create_view_partition,
+    drop_view_partition,
+    list_view_partitions,
+)
+from .advisory_lock import VIEW_PARTITION_MAINTENANCE_LOCK, try_advisory_lock
+from .metrics import register_metrics
+
+logger = logging.getLogger("kitsu.view_partitions")
+
+VIEW_PARTITION_MAINTENANCE_SECONDS = 3600
+
+
+@dataclass
+class MaintenanceResult:
+    acquired: bool
+    created: list[date] = field(default_factory=list)
+    dropped: list[date] = field(default_factory=list)
+
+
+class ViewPartitionMaintainer:
+    """Keeps monthly ``views`` partitions created ahead and drops expired ones.
+
+    The current month and ``months_ahead`` following months always exist, so
+    ingestion never waits on DDL. With a non-zero ``retention_months`` whole
+    partitions older than that are dropped, which costs a catalog update
+    instead of a DELETE over every expired row.
+    """
+
+    def __init__(
+        self,
+        months_ahead: int,
+        retention_months: int,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self._clock = clock
+        self._runs = 0
+        self._skipped = 0
+        self._errors = 0
+        self._partitions = 0
+
+    async def maintain(self, engine: AsyncEngine) -> MaintenanceResult:
+        current = self._clock().date().replace(day=1)
+        wanted = [add_months(current, offset) for offset in range(self.months_ahead + 1)]
+
+        async with engine.connect() as connection:
+            async with try_advisory_lock(
+                connection, VIEW_PARTITION_MAINTENANCE_LOCK
+            ) as acquired:
+                if not acquired:
+                    self._skipped += 1
+                    return MaintenanceResult(acquired=False)
+
+                result = MaintenanceResult(acquired=True)
+                existing = set(await list_view_partitions(connection))
+                for month in wanted:
+                    if month not in existing:
+                        await create_view_partition(connection, month)
+                        await connection.commit()
+                        result.created.append(month)
+
+                if self.retention_months:
+                    cutoff = add_months(current, -self.retention_months)
+                    for month in sorted(existing):
+                        if month >= cutoff:
+                            break
+                        await drop_view_partition(connection, month)
+                        await connection.commit()
+                        result.dropped.append(month)
+
+        self._runs += 1
+        self._partitions = len(existing) + len(result.created) - len(result.dropped)
+        return result
+
+    def record_error(self) -> None:
+        self._errors += 1
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "runs": self._runs,
+            "skipped_locked": self._skipped,
+            "errors": self._errors,
+            "partitions": self._partitions,
+        }
+
+
+async def run_view_partition_maintenance(
+    maintainer: ViewPartitionMaintainer, engine: AsyncEngine, interval_seconds: int
+) -> None:
+    while True:
+        try:
+            result = await maintainer.maintain(engine)
+        except Exception:
+            maintainer.record_error()
+            logger.exception("View partition maintenance failed")
+        else:
+            if result.created or result.dropped:
+                logger.info(
+                    "View partitions maintained (created=%s, dropped=%s)",
+                    [month.isoformat() for month in result.created],
+                    [month.isoformat() for month in result.dropped],
+                )
+        await asyncio.sleep(interval_seconds)
+
+
+view_partition_maintainer = ViewPartitionMaintainer(
+    months_ahead=settings.view_log_partitions_ahead,
+    retention_months=settings.view_log_retention_months,
+)
+register_metrics("view_partitions", view_partition_maintainer.stats)
@@ -0,0 +1,113 @@
+"""Database round trips and latency of register, login and refresh.
+
+Runs the auth use cases against ``DATABASE_URL`` (migrated to head) and prints,
+per flow, the average number of round trips (statements plus BEGIN/COMMIT) and
+p50/p99 latency. bcrypt cost defaults to the minimum so the numbers reflect
+database work. Benchmark users are deleted afterwards.
+
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.auth_round_trips --iterations 200
+"""
+
+import argparse
+import asyncio
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from statistics import quantiles
+from time import perf_counter
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALLOWED_ORIGINS", "http://localhost:3000")
+os.environ.setdefault("PASSWORD_BCRYPT_ROUNDS", "4")
+os.environ.setdefault("AUTH_RATE_LIMIT_ENABLED", "false")
+
+from sqlalchemy import delete, event  # noqa: E402
+
+from app.database import AsyncSessionLocal, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.use_cases.auth.login_user import login_user  # noqa: E402
+from app.use_cases.auth.refresh_session import refresh_session  # noqa: E402
+from app.use_cases.auth.register_user import register_user  # noqa: E402
+
+EMAIL_DOMAIN = "auth-bench.invalid"
+PASSWORD = "benchmark-password"
+
+
+class RoundTripCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def install(self) -> None:
+        sync_engine = engine.sync_engine
+        for name in ("before_cursor_execute", "begin", "commit", "rollback"):
+            event.listen(sync_engine, name, self._increment)
+
+    def _increment(self, *args: object, **kwargs: object) -> None:
+        self.count += 1
+
+
+async def _measure(
+    counter: RoundTripCounter, call: Callable[[], Awaitable[object]]
+) -> tuple[float, int]:
+    before = counter.count
+    started_at = perf_counter()
+    await call()
+    return perf_counter() - started_at, counter.count - before
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    counter = RoundTripCounter()
+    counter.install()
+    results: dict[str, list[tuple[float, int]]] = {
+        "register": [],
+        "login": [],
+        "refresh": [],
+    }
+    try:
+        for _ in range(args.iterations):
+            email = f"{uuid.uuid4().hex}@{EMAIL_DOMAIN}"
+            async with AsyncSessionLocal() as session:
+                tokens = None
+
+                async def register() -> None:
+                    nonlocal tokens
+                    tokens = await register_user(session, email, PASSWORD)
+
+                results["register"].append(await _measure(counter, register))
+
+                async def login() -> None:
+                    nonlocal tokens
+                    tokens = await login_user(session, email, PASSWORD)
+
+                results["login"].append(await _measure(counter, login))
+
+                async def refresh() -> None:
+                    await refresh_session(session, tokens.refresh_token)
+
+                results["refresh"].append(await _measure(counter, refresh))
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                delete(User).where(User.email.like(f"%@{EMAIL_DOMAIN}"))
+            )
+            await session.commit()
+        await engine.dispose()
+
+    print(f"iterations={args.iterations}")
+    print(f"{'flow':>9} {'round trips':>12} {'p50 ms':>9} {'p99 ms':>9}")
+    for flow, samples in results.items():
+        latencies = [latency for latency, _ in samples]
+        round_trips = sum(trips for _, trips in samples) / len(samples)
+        cuts = quantiles(latencies, n=100)
+        print(
+            f"{flow:>9} {round_trips:>12.1f} {cuts[49] * 1000:>9.2f}"
+            f" {cuts[98] * 1000:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())